@@ -432,6 +432,30 @@ def test_package_listing_view__serializes_url_correctly(api_client: APIClient) -
     assert actual["website_url"] is None
 
 
+@pytest.mark.django_db
+def test_package_listing_view__returns_304_for_unchanged_content(
+    api_client: APIClient,
+) -> None:
+    l = PackageListingFactory()
+    url = f"/api/cyberstorm/listing/{l.community.identifier}/{l.package.namespace}/{l.package.name}/"
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+
+    l.package.latest.description = "Changed description"
+    l.package.latest.save(update_fields=("description",))
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     ("package_is_active", "version_is_active"),
@@ -1,4 +1,5 @@
 from unittest.mock import patch
+from urllib.parse import urlparse
 
 import pytest
 from django.urls import reverse
@@ -858,31 +859,126 @@ def test_listing_by_dependency_view__returns_only_packages_listed_in_community(
 
 @mock_base_package_list_api_view
 @pytest.mark.django_db
-def test_annotate_queryset__adds_annotation_fields() -> None:
-    PackageListingFactory()
-    view = BasePackageListAPIView()
-    qs = PackageListing.objects.all()
-    annotated_qs = view._annotate_queryset(qs)
+def test_base_view__when_ordering_by_relevance__orders_by_search_rank(
+    community: Community,
+) -> None:
+    by_name = PackageListingFactory(
+        community_=community,
+        package_version_kwargs={"name": "Robot_Arms", "description": "Arms"},
+        package_kwargs={"date_updated": "2022-02-02 01:23:45Z"},
+    )
+    by_description = PackageListingFactory(
+        community_=community,
+        package_version_kwargs={"name": "Something", "description": "A robot"},
+        package_kwargs={"date_updated": "2023-02-02 01:23:45Z"},
+    )
+
+    request = APIRequestFactory().get("/", {"q": "robot", "ordering": "relevance"})
+    response = BasePackageListAPIView().dispatch(
+        request,
+        community_id=community.identifier,
+    )
 
-    assert "download_count" in annotated_qs.query.annotations
-    assert "rating_count" in annotated_qs.query.annotations
+    assert response.data["count"] == 2
+    assert response.data["results"][0]["name"] == by_name.package.name
+    assert response.data["results"][1]["name"] == by_description.package.name
+
+    # Without a search query relevance falls back to latest update
+    request = APIRequestFactory().get("/", {"ordering": "relevance"})
+    response = BasePackageListAPIView().dispatch(
+        request,
+        community_id=community.identifier,
+    )
+
+    assert response.data["count"] == 2
+    assert response.data["results"][0]["name"] == by_description.package.name
+
+
+@mock_base_package_list_api_view
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering", ("last-updated", "most-downloaded", "newest", "top-rated")
+)
+def test_base_view__cursor_pagination__walks_all_results(
+    community: Community,
+    ordering: str,
+) -> None:
+    listings = [
+        PackageListingFactory(
+            community_=community,
+            package_kwargs={
+                "date_updated": "2022-02-02 01:23:45Z",
+                "is_pinned": i % 7 == 0,
+            },
+            package_version_kwargs={"downloads": i % 3},
+        )
+        for i in range(45)
+    ]
+    expected = {(x.package.namespace.name, x.package.name) for x in listings}
+
+    seen = []
+    url = f"/?ordering={ordering}&pagination=cursor"
+    for _ in range(3):
+        request = APIRequestFactory().get(url)
+        response = BasePackageListAPIView().dispatch(
+            request,
+            community_id=community.identifier,
+        )
+        assert response.status_code == 200
+        assert response.data["count"] is None
+        assert response.data["previous"] is None
+        seen.extend((x["namespace"], x["name"]) for x in response.data["results"])
+        if response.data["next"] is None:
+            break
+        query = urlparse(response.data["next"]).query
+        assert "page=" not in query
+        url = f"/?{query}"
+
+    assert len(seen) == 45
+    assert set(seen) == expected
 
 
+@mock_base_package_list_api_view
 @pytest.mark.django_db
-def test_annotate_queryset__returns_correct_values() -> None:
-    listing = PackageListingFactory()
-    package = listing.package
-    package.latest.downloads = 10
-    package.latest.save()
+def test_base_view__cursor_pagination__includes_count_when_requested(
+    community: Community,
+) -> None:
+    PackageListingFactory(community_=community)
+    PackageListingFactory(community_=community)
+
+    request = APIRequestFactory().get(
+        "/", {"pagination": "cursor", "include_count": True}
+    )
+    response = BasePackageListAPIView().dispatch(
+        request,
+        community_id=community.identifier,
+    )
 
-    PackageVersionFactory(package=package, downloads=20, version_number="1.0.1")
+    assert response.data["count"] == 2
+    assert response.data["next"] is None
+    assert len(response.data["results"]) == 2
 
-    PackageRatingFactory(package=package)
-    PackageRatingFactory(package=package)
 
-    view = BasePackageListAPIView()
-    annotated_qs = view._annotate_queryset(PackageListing.objects.filter(id=listing.id))
-    annotated = annotated_qs.first()
+@mock_base_package_list_api_view
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    (
+        "garbage",
+        # Cursor of a different ordering
+        "eyJzIjoibmV3ZXN0IiwidiI6W2ZhbHNlLGZhbHNlLCIyMDIyLTAyLTAyIiwiMjAyMi0wMi0wMiIsMV19",
+        # Wrong amount of values
+        "eyJzIjoibGFzdC11cGRhdGVkIiwidiI6WzFdfQ",
+    ),
+)
+def test_base_view__cursor_pagination__rejects_invalid_cursor(
+    community: Community,
+    cursor: str,
+) -> None:
+    request = APIRequestFactory().get("/", {"pagination": "cursor", "cursor": cursor})
+    response = BasePackageListAPIView().dispatch(
+        request,
+        community_id=community.identifier,
+    )
 
-    assert annotated.download_count == 30
-    assert annotated.rating_count == 2
+    assert response.status_code == 404
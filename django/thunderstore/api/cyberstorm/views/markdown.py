@@ -5,7 +5,7 @@ from rest_framework import serializers
 from rest_framework.generics import RetrieveAPIView, get_object_or_404
 
 from thunderstore.api.utils import CyberstormAutoSchemaMixin, PublicCacheMixin
-from thunderstore.markdown.templatetags.markdownify import render_markdown
+from thunderstore.markdown.templatetags.markdownify import render_markdown_cached
 from thunderstore.repository.models import Package, PackageVersion
 
 
@@ -31,7 +31,7 @@ class PackageVersionReadmeAPIView(
             version_number=self.kwargs.get("version_number"),
         )
 
-        return {"html": render_markdown(package_version.readme)}
+        return {"html": render_markdown_cached(package_version.readme)}
 
 
 class PackageVersionChangelogAPIView(
@@ -57,7 +57,7 @@ class PackageVersionChangelogAPIView(
         if package_version.changelog is None:
             raise Http404
 
-        return {"html": render_markdown(package_version.changelog)}
+        return {"html": render_markdown_cached(package_version.changelog)}
 
 
 def get_package_version(
@@ -5,11 +5,8 @@ from django.db.models import (
     CharField,
     Count,
     ExpressionWrapper,
-    OuterRef,
     Q,
     QuerySet,
-    Subquery,
-    Sum,
     Value,
 )
 from django.http import Http404
@@ -31,13 +28,14 @@ from thunderstore.api.cyberstorm.views.package_listing_actions import (
     get_package_listing,
 )
 from thunderstore.api.utils import (
+    ContentETagMixin,
     CyberstormAutoSchemaMixin,
     PublicCacheMixin,
     conditional_swagger_auto_schema,
 )
 from thunderstore.community.models.package_listing import PackageListing
 from thunderstore.core.types import UserType
-from thunderstore.repository.models.package import get_package_dependants
+from thunderstore.repository.models import get_package_dependant_count
 from thunderstore.repository.models.package_version import PackageVersion
 from thunderstore.repository.views.package.detail import PermissionsChecker
 
@@ -117,7 +115,9 @@ class ResponseSerializer(serializers.Serializer):
     website_url = EmptyStringAsNoneField(source="version.website_url")
 
 
-class PackageListingAPIView(CyberstormAutoSchemaMixin, RetrieveAPIView):
+class PackageListingAPIView(
+    ContentETagMixin, CyberstormAutoSchemaMixin, RetrieveAPIView
+):
     serializer_class = ResponseSerializer
 
     def get_object(self):
@@ -150,8 +150,6 @@ def get_custom_package_listing(
     version: Optional[str] = None,
     user: UserType = None,
 ) -> CustomListing:
-    listing_ref = PackageListing.objects.filter(pk=OuterRef("pk"))
-
     qs = (
         PackageListing.objects.active()
         .select_related(
@@ -165,16 +163,6 @@ def get_custom_package_listing(
             "package__owner__members",
         )
         .annotate(
-            download_count=Subquery(
-                listing_ref.annotate(
-                    downloads=Sum("package__versions__downloads"),
-                ).values("downloads"),
-            ),
-            rating_count=Subquery(
-                listing_ref.annotate(
-                    ratings=Count("package__package_ratings"),
-                ).values("ratings"),
-            ),
             version_count=Count(
                 "package__versions", filter=Q(package__versions__is_active=True)
             ),
@@ -226,7 +214,7 @@ def get_custom_package_listing(
         )
 
     listing.dependency_count = dependencies.count()
-    listing.dependant_count = get_package_dependants(listing.package.pk).count()
+    listing.dependant_count = get_package_dependant_count(listing.package.pk)
 
     return listing
 
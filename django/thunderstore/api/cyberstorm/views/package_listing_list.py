@@ -4,14 +4,16 @@ from urllib.parse import urlencode
 
 from django.conf import settings
 from django.core.paginator import Page
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery, Sum
+from django.db.models import Q, QuerySet
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from rest_framework import serializers
 from rest_framework.generics import ListAPIView, get_object_or_404
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
 
 from thunderstore.api.cyberstorm.serializers import CyberstormPackagePreviewSerializer
+from thunderstore.api.pagination import KeysetPaginator
 from thunderstore.api.utils import PublicCacheMixin, conditional_swagger_auto_schema
 from thunderstore.community.consts import PackageListingReviewStatus
 from thunderstore.community.models import (
@@ -19,17 +21,26 @@ from thunderstore.community.models import (
     PackageListing,
     PackageListingSection,
 )
-from thunderstore.repository.models import Namespace, Package, get_package_dependants
+from thunderstore.repository.models import (
+    Namespace,
+    Package,
+    get_package_dependant_listings,
+)
+from thunderstore.repository.search import filter_packages_by_search_query
 
 # Keys are values expected in requests, values are args for .order_by().
 ORDER_ARGS = {
-    "last-updated": "-package__date_updated",
-    "most-downloaded": "-download_count",  # annotated field
+    "last-updated": "-date_updated",
+    "most-downloaded": "-download_count",
     "newest": "-package__date_created",
-    "top-rated": "-rating_count",  # annotated field
+    "top-rated": "-rating_count",
+    "relevance": "-search_rank",  # annotated field, requires a search query
 }
 
 
+PAGINATION_MODES = ("page", "cursor")
+
+
 class PackageListRequestSerializer(serializers.Serializer):
     """
     For deserializing the query parameters used in package filtering.
@@ -52,14 +63,33 @@ class PackageListRequestSerializer(serializers.Serializer):
     page = serializers.IntegerField(default=1, min_value=1)
     q = serializers.CharField(required=False, help_text="Free text search")
     section = serializers.UUIDField(required=False)
+    pagination = serializers.ChoiceField(
+        choices=list(PAGINATION_MODES),
+        required=False,
+        help_text=(
+            "Use cursor to paginate by following the next links instead of "
+            "page numbers. The page parameter is ignored and previous is "
+            "always null in cursor mode."
+        ),
+    )
+    cursor = serializers.CharField(
+        required=False,
+        help_text="Opaque cursor from the next link, used in cursor pagination mode",
+    )
+    include_count = serializers.BooleanField(
+        required=False,
+        help_text="Include the total count in cursor pagination mode",
+    )
 
 
 class PackageListResponseSerializer(serializers.Serializer):
     """
     Matches DRF's PageNumberPagination response.
+
+    In cursor pagination mode count is null unless requested.
     """
 
-    count = serializers.IntegerField(min_value=0)
+    count = serializers.IntegerField(min_value=0, allow_null=True)
     previous = serializers.CharField(allow_null=True)
     next = serializers.CharField(allow_null=True)  # noqa: A003
     results = CyberstormPackagePreviewSerializer(many=True)
@@ -100,6 +130,10 @@ class BasePackageListAPIView(PublicCacheMixin, ListAPIView):
         assert self.paginator is not None
 
         queryset = self.filter_queryset(self.get_queryset())
+        params = self._get_validated_query_params()
+        if params.get("pagination") == "cursor":
+            return self._list_by_cursor(queryset, params)
+
         page = self.paginate_queryset(queryset)
         serializer = self.get_serializer(page, many=True)
         response = self.paginator.get_paginated_response(serializer.data)
@@ -135,7 +169,6 @@ class BasePackageListAPIView(PublicCacheMixin, ListAPIView):
 
     def get_queryset(self) -> QuerySet[PackageListing]:
         queryset = PackageListing.objects.active()  # type: ignore
-        queryset = self._annotate_queryset(queryset)
         return self._select_and_prefetch(queryset)
 
     def filter_queryset(
@@ -154,12 +187,69 @@ class BasePackageListAPIView(PublicCacheMixin, ListAPIView):
         qs = filter_by_section(params.get("section"), qs)
         qs = filter_by_query(params.get("q"), qs)
 
-        return qs.order_by(
-            "-package__is_pinned",
-            "package__is_deprecated",
-            ORDER_ARGS[params["ordering"]],
-            "-package__date_updated",
-            "-package__pk",
+        return qs.order_by(*self._get_ordering(params))
+
+    def _get_ordering(self, params: OrderedDict) -> List[str]:
+        """
+        Return the total ordering of the results as .order_by() args.
+        """
+        ordering = params["ordering"]
+        if ordering == "relevance" and not params.get("q"):
+            ordering = "last-updated"
+
+        # The denormalized listing columns are used, so that the ordering is
+        # served by the indexes of PackageListing.
+        ordering_args = [
+            "-is_pinned",
+            "is_deprecated",
+            ORDER_ARGS[ordering],
+            "-date_updated",
+            "-package_id",
+        ]
+        return list(dict.fromkeys(ordering_args))
+
+    def _list_by_cursor(
+        self,
+        queryset: QuerySet[PackageListing],
+        params: OrderedDict,
+    ) -> Response:
+        """
+        Return a page of results following the requested cursor.
+
+        Unlike page numbers, cursors let the database seek directly to the
+        start of the page, and the count query is skipped unless requested.
+        """
+        paginator = KeysetPaginator(
+            ordering=self._get_ordering(params),
+            page_size=self.pagination_class.page_size,
+            scope=params["ordering"],
+        )
+        (page, next_cursor) = paginator.paginate_queryset(
+            queryset,
+            params.get("cursor"),
+        )
+        serializer = self.get_serializer(page, many=True)
+
+        next_url = None
+        if next_cursor:
+            assert self.viewname
+            path = reverse(self.viewname, kwargs=self.kwargs)
+            next_params = deepcopy(params)
+            next_params.pop("page", None)
+            next_params["cursor"] = next_cursor
+            next_url = (
+                f"{settings.PROTOCOL}{settings.PRIMARY_HOST}{path}"
+                f"?{urlencode(next_params, doseq=True)}"
+            )
+
+        count = queryset.count() if params.get("include_count") else None
+        return Response(
+            {
+                "count": count,
+                "previous": None,
+                "next": next_url,
+                "results": serializer.data,
+            }
         )
 
     def _get_community(self) -> Community:
@@ -169,27 +259,6 @@ class BasePackageListAPIView(PublicCacheMixin, ListAPIView):
         community_id = self.kwargs["community_id"]
         return get_object_or_404(Community, identifier=community_id)
 
-    def _annotate_queryset(
-        self, queryset: QuerySet[PackageListing]
-    ) -> QuerySet[PackageListing]:
-        """
-        Add annotations required to serialize the results.
-        """
-        listing_ref = PackageListing.objects.filter(pk=OuterRef("pk"))
-
-        return queryset.annotate(
-            download_count=Subquery(
-                listing_ref.annotate(
-                    downloads=Sum("package__versions__downloads")
-                ).values("downloads")
-            ),
-            rating_count=Subquery(
-                listing_ref.annotate(ratings=Count("package__package_ratings")).values(
-                    "ratings"
-                )
-            ),
-        )
-
     def _select_and_prefetch(
         self, queryset: QuerySet[PackageListing]
     ) -> QuerySet[PackageListing]:
@@ -205,8 +274,6 @@ class BasePackageListAPIView(PublicCacheMixin, ListAPIView):
             "package__namespace",
         ).prefetch_related(
             "categories",
-            "package__versions",
-            "package__package_ratings",
         )
 
     def _get_validated_query_params(self) -> OrderedDict:
@@ -353,9 +420,7 @@ class PackageListingByDependencyListAPIView(BasePackageListAPIView):
             package__name=package_name,
         )
 
-        queryset = get_package_dependants(listing.package.pk)
-        queryset = PackageListing.objects.filter(package__in=queryset)  # type: ignore
-        queryset = self._annotate_queryset(queryset)
+        queryset = get_package_dependant_listings(listing.package.pk)
         return self._select_and_prefetch(queryset)
 
 
@@ -376,7 +441,7 @@ def filter_deprecated(
     if show_deprecated:
         return queryset
 
-    return queryset.exclude(package__is_deprecated=True)
+    return queryset.exclude(is_deprecated=True)
 
 
 def filter_nsfw(
@@ -453,26 +518,10 @@ def filter_by_query(
     queryset: QuerySet[PackageListing],
 ) -> QuerySet[PackageListing]:
     """
-    Filter packages by free text search.
+    Filter packages by free text search and annotate the results with
+    their relevance as `search_rank`.
     """
-    if not query:
-        return queryset
-
-    search_fields = (
-        "package__name",
-        "package__owner__name",
-        "package__latest__description",
-    )
-    icontains_query = Q()
-    parts = [x for x in query.split(" ") if x]
-
-    for part in parts:
-        part_query = Q()
-        for field in search_fields:
-            part_query |= Q(**{f"{field}__icontains": part})
-        icontains_query &= part_query
-
-    return queryset.filter(icontains_query).distinct()
+    return filter_packages_by_search_query(query, queryset, package_prefix="package__")
 
 
 def filter_by_review_status(
@@ -1,5 +1,103 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 
 
 class PackageDependenciesPaginator(PageNumberPagination):
     page_size = 20
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        # Not using DjangoJSONEncoder as it truncates microseconds, which
+        # would make the cursor skip objects updated within a millisecond.
+        return value.isoformat()
+    return value
+
+
+def _resolve_value(obj: Model, field: str) -> Any:
+    for attr in field.split("__"):
+        obj = getattr(obj, attr)
+    return obj
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by comparing against the ordering field values of
+    the last object of the previous page instead of using an offset, so
+    the cost of a page doesn't grow the deeper the client goes.
+
+    The ordering must be total, i.e. end with an unique field, and the
+    fields must not be nullable. Only forward pagination is supported.
+    """
+
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering: Sequence[str], page_size: int, scope: str = ""):
+        self.ordering = list(ordering)
+        self.page_size = page_size
+        self.scope = scope
+
+    def encode_cursor(self, obj: Model) -> str:
+        values = [
+            _encode_value(_resolve_value(obj, x.lstrip("-"))) for x in self.ordering
+        ]
+        data = json.dumps({"s": self.scope, "v": values}, separators=(",", ":"))
+        return urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            data = json.loads(urlsafe_b64decode(cursor + padding))
+            values = data["v"]
+            scope = data["s"]
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if scope != self.scope or not isinstance(values, list):
+            raise NotFound(self.invalid_cursor_message)
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def get_keyset_filter(self, values: List[Any]) -> Q:
+        """
+        Build a filter matching objects that come after the given values in
+        the ordering, i.e. (a, b) > (x, y) as (a > x) OR (a = x AND b > y)
+        with the comparison flipped for descending fields.
+        """
+        result = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            result |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return result
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        cursor: Optional[str],
+    ) -> Tuple[List[Model], Optional[str]]:
+        """
+        Return the page following the cursor and the cursor of the next
+        page, if there is one.
+        """
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            queryset = queryset.filter(
+                self.get_keyset_filter(self.decode_cursor(cursor))
+            )
+
+        objects = list(queryset[: self.page_size + 1])
+        if len(objects) <= self.page_size:
+            return objects, None
+
+        objects = objects[: self.page_size]
+        return objects, self.encode_cursor(objects[-1])
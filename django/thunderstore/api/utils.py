@@ -1,5 +1,10 @@
 from django.conf import settings
-from django.utils.cache import patch_cache_control
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    set_response_etag,
+)
 from drf_yasg.utils import swagger_auto_schema, unset  # type: ignore
 
 
@@ -55,3 +60,33 @@ class PublicCacheMixin:
         ):
             patch_cache_control(response, public=True, max_age=self.cache_max_age)
         return response
+
+
+class ContentETagMixin:
+    """
+    A mixin deriving a strong ETag from the rendered body of successful GET
+    responses, answering matching If-None-Match requests with 304.
+
+    The response is still built on every request, only the transfer of an
+    unchanged body is skipped. Prefer validators of the underlying cache
+    where one exists.
+
+    IMPORTANT: Must be before PublicCacheMixin in the inheritance list for the
+    Cache-Control headers to be included in 304 responses.
+    """
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if request.method not in ("GET", "HEAD") or response.status_code != 200:
+            return response
+
+        if isinstance(response, SimpleTemplateResponse):
+            response.render()
+        set_response_etag(response)
+        conditional = get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            response=response,
+        )
+        return conditional or response
@@ -1,14 +1,26 @@
+import copy
 import hashlib
 import time
 import warnings
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest
 from redis.exceptions import LockError
 
 from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.index import index_cache_key
+from thunderstore.cache.metrics import (
+    CacheEvent,
+    record_cache_event,
+    record_regeneration,
+)
 from thunderstore.cache.utils import get_cache
+from thunderstore.core.utils import capture_exception
 from thunderstore.repository.mixins import CommunityMixin
 
 DEFAULT_CACHE_EXPIRY = 60 * 5
@@ -17,38 +29,112 @@ CACHE_LOCK_TIMEOUT = 30
 
 cache = get_cache("legacy")
 
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached value along with the time after which it should be refreshed.
+    The entry itself outlives that time so that it can be served stale
+    while it's being refreshed.
+    """
+
+    value: Any
+    stale_after: Optional[float]
+
+    @classmethod
+    def create(cls, value: Any, expiry: Optional[int]) -> "CacheEntry":
+        stale_after = None if expiry is None else time.time() + expiry
+        return cls(value=value, stale_after=stale_after)
+
+    @property
+    def is_stale(self) -> bool:
+        return self.stale_after is not None and time.time() >= self.stale_after
+
+
+def unwrap_cache_entry(entry: Any) -> Tuple[Any, bool]:
+    """
+    Return the value of a cached entry and whether it's stale. Values cached
+    before entries were introduced don't have an expiry and are considered
+    stale so that they get replaced.
+    """
+    if isinstance(entry, CacheEntry):
+        return entry.value, entry.is_stale
+    return entry, True
+
+
+def get_entry_timeout(expiry: Optional[int]) -> Optional[int]:
+    """
+    Return how long an entry with the given expiry is kept in the cache.
+    """
+    if expiry is None:
+        return None
+    if settings.CACHE_STALE_WHILE_REVALIDATE:
+        return expiry * 2
+    return expiry
+
+
+def generate_cache_value(generator: Callable) -> Any:
+    start = time.monotonic()
+    generated = generator()
+    record_regeneration(time.monotonic() - start)
+    if generated is None:
+        # TODO: Use some empty object instead which can be used to
+        #       recognize None was cached
+        warnings.warn(
+            "Attempted to set 'None' to cache, replacing with empty string",
+        )
+        generated = ""
+    return generated
+
+
+def set_cache_value(
+    key: str,
+    old_key: str,
+    value: Any,
+    expiry: Optional[int],
+    old_timeout: Optional[int],
+    version=None,
+    condition: Optional[str] = None,
+    tags: Sequence[str] = (),
+) -> None:
+    entry = CacheEntry.create(value, expiry)
+    timeout = get_entry_timeout(expiry)
+    if condition is not None:
+        index_cache_key(key, condition, tags, timeout)
+    cache.set(key, entry, timeout=timeout, version=version)
+    cache.set(old_key, entry, timeout=old_timeout, version=version)
+
 
 def try_regenerate_cache(
     key: str,
     old_key: str,
     generator: Callable,
-    timeout: int,
-    old_timeout: int,
+    timeout: Optional[int],
+    old_timeout: Optional[int],
     version=None,
+    condition: Optional[str] = None,
+    tags: Sequence[str] = (),
 ) -> Any:
     with cache.lock(
         f"lock.cachegenerate.{key}", timeout=CACHE_LOCK_TIMEOUT, blocking_timeout=None
     ):
-        generated = generator()
-        if generated is None:
-            # TODO: Use some empty object instead which can be used to
-            #       recognize None was cached
-            warnings.warn(
-                "Attempted to set 'None' to cache, replacing with empty string",
-            )
-            generated = ""
-        cache.set(key, generated, timeout=timeout, version=version)
-        cache.set(
-            old_key,
-            generated,
-            timeout=old_timeout,
-            version=version,
+        generated = generate_cache_value(generator)
+        set_cache_value(
+            key, old_key, generated, timeout, old_timeout, version, condition, tags
         )
         return generated
 
 
 def regenerate_cache(
-    key: str, generator: Callable, timeout: int, old_timeout: int, version=None
+    key: str,
+    generator: Callable,
+    timeout: Optional[int],
+    old_timeout: Optional[int],
+    version=None,
+    condition: Optional[str] = None,
+    tags: Sequence[str] = (),
 ):
     old_key = f"old.{key}"
     try:
@@ -59,16 +145,79 @@ def regenerate_cache(
             timeout=timeout,
             old_timeout=old_timeout,
             version=version,
+            condition=condition,
+            tags=tags,
         )
     except (LockError, AttributeError):
         # Lock was taken by another thread, check fallback version
         generated = cache.get(old_key, version=version)
         if generated is None:
             # Finally fall back to generating it on this thread
-            generated = generator()
-            cache.set(key, generated, timeout=timeout, version=version)
-            cache.set(old_key, generated, timeout=None, version=version)
-        return generated
+            generated = generate_cache_value(generator)
+            set_cache_value(
+                key, old_key, generated, timeout, None, version, condition, tags
+            )
+            return generated
+        return unwrap_cache_entry(generated)[0]
+
+
+def get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(
+            max_workers=settings.CACHE_REFRESH_MAX_WORKERS,
+            thread_name_prefix="cache-refresh",
+        )
+    return _refresh_executor
+
+
+def refresh_stale_cache(
+    key: str,
+    generator: Callable,
+    timeout: Optional[int],
+    old_timeout: Optional[int],
+    condition: Optional[str] = None,
+    tags: Sequence[str] = (),
+) -> None:
+    """
+    Regenerate a stale cache entry outside of the request, unless another
+    worker is already doing so.
+    """
+    lock_key = f"lock.cacherefresh.{key}"
+    if not cache.add(lock_key, 1, timeout=CACHE_LOCK_TIMEOUT):
+        return
+
+    def refresh():
+        try:
+            generated = generate_cache_value(generator)
+            set_cache_value(
+                key,
+                f"old.{key}",
+                generated,
+                timeout,
+                old_timeout,
+                condition=condition,
+                tags=tags,
+            )
+        except Exception as e:
+            record_cache_event(CacheEvent.refresh_error)
+            capture_exception(e)
+        finally:
+            cache.delete(lock_key)
+
+    if not settings.CACHE_REFRESH_IN_BACKGROUND:
+        refresh()
+        return
+
+    def refresh_in_thread():
+        try:
+            refresh()
+        finally:
+            # Database connections are thread local and wouldn't otherwise
+            # be closed, as the thread isn't part of a request cycle.
+            connections.close_all()
+
+    get_refresh_executor().submit(refresh_in_thread)
 
 
 def cache_get_or_set_by_key(
@@ -79,6 +228,7 @@ def cache_get_or_set_by_key(
     default_args=(),
     default_kwargs=None,
     expiry=DEFAULT_CACHE_EXPIRY,
+    tags: Sequence[str] = (),
 ):
     if default_kwargs is None:
         default_kwargs = {}
@@ -94,12 +244,36 @@ def cache_get_or_set_by_key(
         default_args=default_args,
         default_kwargs=default_kwargs,
         expiry=expiry,
+        cache_bust_condition=condition,
+        tags=tags,
     )
 
 
 def cache_get_or_set(
-    key, default, default_args=(), default_kwargs=None, expiry: Optional[int] = None
+    key,
+    default,
+    default_args=(),
+    default_kwargs=None,
+    expiry: Optional[int] = None,
+    stale_while_revalidate: bool = True,
+    cache_bust_condition: Optional[str] = None,
+    tags: Sequence[str] = (),
+    refresh: Optional[Callable[[], Any]] = None,
 ):
+    """
+    Return the cached value of the key, generating it with the default
+    callable if it's missing.
+
+    If a cache bust condition is given, the entry is indexed so that it's
+    invalidated along with the condition, or any of the tags if given.
+
+    Values which have expired are returned as is while they're refreshed by
+    a background thread, unless stale_while_revalidate is disabled, in which
+    case they're regenerated on the calling thread. The refresh callable is
+    used for regenerating the value in the background if given, otherwise
+    the default callable is, which must then not depend on state which is
+    only valid during the call.
+    """
     if default_kwargs is None:
         default_kwargs = {}
 
@@ -112,11 +286,41 @@ def cache_get_or_set(
     if expiry is not None:
         old_timeout = expiry * 2
 
-    result = cache.get(key, version=None)
-    if result is None:
-        result = regenerate_cache(
-            key=key, generator=call_default, timeout=expiry, old_timeout=old_timeout
+    entry = cache.get(key, version=None)
+    if entry is None:
+        record_cache_event(CacheEvent.miss)
+        return regenerate_cache(
+            key=key,
+            generator=call_default,
+            timeout=expiry,
+            old_timeout=old_timeout,
+            condition=cache_bust_condition,
+            tags=tags,
+        )
+
+    result, is_stale = unwrap_cache_entry(entry)
+    if is_stale and not stale_while_revalidate:
+        record_cache_event(CacheEvent.miss)
+        return regenerate_cache(
+            key=key,
+            generator=call_default,
+            timeout=expiry,
+            old_timeout=old_timeout,
+            condition=cache_bust_condition,
+            tags=tags,
+        )
+    elif is_stale:
+        record_cache_event(CacheEvent.stale)
+        refresh_stale_cache(
+            key=key,
+            generator=refresh or call_default,
+            timeout=expiry,
+            old_timeout=old_timeout,
+            condition=cache_bust_condition,
+            tags=tags,
         )
+    else:
+        record_cache_event(CacheEvent.hit)
 
     return result
 
@@ -146,6 +350,9 @@ class ManualCacheMixin(object):
     def get_extra_cache_vary(self):
         return set()
 
+    def get_cache_tags(self) -> Sequence[str]:
+        return ()
+
     def dispatch(self, *args, **kwargs):
         def get_default(*a, **kw):
             return super(ManualCacheMixin, self).dispatch(*a, **kw).render()
@@ -153,6 +360,19 @@ class ManualCacheMixin(object):
         if self.request.method != "GET":
             return get_default(*args, **kwargs)
 
+        # Dispatching sets up state on the view and the request, so stale
+        # views are refreshed in the background using copies of both taken
+        # before the view is dispatched on this thread.
+        view = copy.copy(self)
+        refresh_args = tuple(
+            copy.copy(x) if isinstance(x, HttpRequest) else x for x in args
+        )
+
+        def refresh():
+            return (
+                super(ManualCacheMixin, view).dispatch(*refresh_args, **kwargs).render()
+            )
+
         return cache_get_or_set(
             key=get_cache_key(
                 cache_bust_condition=self.cache_until,
@@ -164,6 +384,9 @@ class ManualCacheMixin(object):
             default_args=args,
             default_kwargs=kwargs,
             expiry=self.cache_expiry,
+            cache_bust_condition=self.cache_until,
+            tags=self.get_cache_tags(),
+            refresh=refresh,
         )
 
 
@@ -186,6 +409,7 @@ def cache_function_result(cache_until, expiry=DEFAULT_CACHE_EXPIRY):
                 default_args=args,
                 default_kwargs=kwargs,
                 expiry=expiry,
+                cache_bust_condition=cache_until,
             )
 
         def clear_cache_with_args(*args, **kwargs):
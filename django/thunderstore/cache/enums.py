@@ -1,8 +1,27 @@
 from thunderstore.core.utils import ChoiceEnum
 
 
-# TODO: Support parameters in cache bust conditions (e.g. specific package update)
 class CacheBustCondition(ChoiceEnum):
     background_update_only = "manual_update_only"
     any_package_updated = "any_package_updated"
     dynamic_html_updated = "dynamic_html_updated"
+
+
+class CacheTag:
+    """
+    Parameters of a cache bust condition. Cache entries tagged with any of
+    the tags passed to invalidate_cache are invalidated, while untagged
+    entries are invalidated by any invalidation of their condition.
+    """
+
+    @staticmethod
+    def community(identifier: str) -> str:
+        return f"community:{identifier}"
+
+    @staticmethod
+    def package(package_id: int) -> str:
+        return f"package:{package_id}"
+
+    @staticmethod
+    def team(team_id: int) -> str:
+        return f"team:{team_id}"
@@ -0,0 +1,94 @@
+from typing import List, Optional, Sequence, Set
+
+from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.utils import get_cache
+from thunderstore.utils.batch import batch
+
+# Index sets are refreshed whenever an entry is added, so this only needs to
+# outlive the entries themselves. Entries without an expiry are tracked in
+# separate sets which never expire.
+INDEX_TTL = 60 * 60 * 24
+DELETE_BATCH_SIZE = 1000
+
+UNTAGGED = "untagged"
+
+cache = get_cache("legacy")
+
+
+def get_index_key(condition: str, name: str, persistent: bool = False) -> str:
+    suffix = ".persistent" if persistent else ""
+    return f"cache.index.{condition}.{name}{suffix}"
+
+
+def get_index_registry_key(condition: str) -> str:
+    # Lists the names of the index sets of the condition, so that all of
+    # them can be found by an untagged invalidation
+    return f"cache.indexes.{condition}"
+
+
+def _get_redis():
+    return cache.client.get_client(write=True)
+
+
+def index_cache_key(
+    key: str,
+    condition: str,
+    tags: Sequence[str],
+    timeout: Optional[int],
+) -> None:
+    """
+    Track a cache entry in the index sets of its condition and tags so that
+    it can be invalidated without scanning the keyspace.
+    """
+    if condition == CacheBustCondition.background_update_only:
+        # Never invalidated, so there's no need to track these
+        return
+
+    persistent = timeout is None
+    names = list(tags) if tags else [UNTAGGED]
+    pipe = _get_redis().pipeline(transaction=False)
+    pipe.sadd(cache.make_key(get_index_registry_key(condition)), *names)
+    for name in names:
+        index_key = cache.make_key(get_index_key(condition, name, persistent))
+        pipe.sadd(index_key, key)
+        if not persistent:
+            pipe.expire(index_key, max(INDEX_TTL, timeout))
+    pipe.execute()
+
+
+def pop_indexed_cache_keys(condition: str, tags: Optional[Sequence[str]]) -> Set[str]:
+    """
+    Atomically remove and return the cache keys affected by an invalidation
+    of the condition. If tags are given, only entries with any of the tags
+    and untagged entries are affected, otherwise all entries are.
+    """
+    redis = _get_redis()
+    registry_key = cache.make_key(get_index_registry_key(condition))
+    if tags is None:
+        names = [
+            x.decode() if isinstance(x, bytes) else x
+            for x in redis.smembers(registry_key)
+        ]
+    else:
+        names = [UNTAGGED] + list(tags)
+    if not names:
+        return set()
+
+    index_keys: List[str] = [
+        cache.make_key(get_index_key(condition, name, persistent))
+        for name in names
+        for persistent in (False, True)
+    ]
+    pipe = redis.pipeline(transaction=True)
+    pipe.sunion(index_keys)
+    pipe.delete(*index_keys)
+    pipe.srem(registry_key, *names)
+    members, _, _ = pipe.execute()
+    return {x.decode() if isinstance(x, bytes) else x for x in members}
+
+
+def delete_indexed_cache_keys(condition: str, tags: Optional[Sequence[str]]) -> int:
+    keys = sorted(pop_indexed_cache_keys(condition, tags))
+    for key_batch in batch(DELETE_BATCH_SIZE, keys):
+        cache.delete_many(key_batch)
+    return len(keys)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import Counter
+from typing import Dict
+
+from django.conf import settings
+
+from thunderstore.cache.utils import get_cache
+from thunderstore.core.utils import ChoiceEnum, capture_exception
+
+METRICS_KEY = "cache.metrics"
+
+# Upper bounds (in milliseconds) of the regeneration latency histogram buckets
+REGENERATION_LATENCY_BUCKETS = (100, 1000, 10000)
+
+
+class CacheEvent(ChoiceEnum):
+    hit = "hit"
+    stale = "stale"
+    miss = "miss"
+    regeneration = "regeneration"
+    refresh_error = "refresh_error"
+
+
+class CacheMetrics:
+    """
+    Counts cache events in-process and periodically adds them to a redis
+    hash, so that recording an event doesn't cost a round trip.
+    """
+
+    def __init__(self, key: str = METRICS_KEY):
+        self.key = key
+        self.lock = threading.Lock()
+        self.pending = Counter()
+        self.last_flush = time.monotonic()
+
+    def add(self, field: str, amount: int = 1) -> None:
+        with self.lock:
+            self.pending[field] += amount
+            interval = settings.CACHE_METRICS_FLUSH_INTERVAL_SECONDS
+            if time.monotonic() - self.last_flush < interval:
+                return
+            pending = self.pending
+            self.pending = Counter()
+            self.last_flush = time.monotonic()
+        self.write(pending)
+
+    def write(self, counts: Dict[str, int]) -> None:
+        try:
+            redis = get_cache("legacy").client.get_client(write=True)
+            pipe = redis.pipeline(transaction=False)
+            for field, amount in counts.items():
+                pipe.hincrby(self.key, field, amount)
+            pipe.execute()
+        except Exception as e:  # pragma: no cover
+            capture_exception(e)
+
+    def flush(self) -> None:
+        with self.lock:
+            pending = self.pending
+            self.pending = Counter()
+            self.last_flush = time.monotonic()
+        if pending:
+            self.write(pending)
+
+    def read(self) -> Dict[str, int]:
+        self.flush()
+        redis = get_cache("legacy").client.get_client(write=False)
+        return {
+            key.decode(): int(value) for key, value in redis.hgetall(self.key).items()
+        }
+
+
+metrics = CacheMetrics()
+
+
+def record_cache_event(event: str) -> None:
+    metrics.add(event)
+
+
+def record_regeneration(duration: float) -> None:
+    """
+    Record the duration (in seconds) of a cache entry regeneration.
+    """
+    ms = int(duration * 1000)
+    bucket = next(
+        (f"le_{x}ms" for x in REGENERATION_LATENCY_BUCKETS if ms <= x),
+        "le_inf",
+    )
+    metrics.add(CacheEvent.regeneration)
+    metrics.add(f"{CacheEvent.regeneration}.{bucket}")
+    metrics.add(f"{CacheEvent.regeneration}.total_ms", ms)
+
+
+def get_cache_metrics() -> Dict[str, int]:
+    """
+    Return the cache metrics counters collected by all processes.
+    """
+    return metrics.read()
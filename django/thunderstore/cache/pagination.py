@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from django.core.paginator import Page, Paginator
 from django.db.models import QuerySet
 from django.utils.functional import cached_property
@@ -20,10 +22,12 @@ class CachedPaginator(Paginator):
         cache_bust_condition: str,
         orphans=0,
         allow_empty_first_page=True,
+        cache_tags: Sequence[str] = (),
     ):
         self.cache_key = cache_key
         self.cache_vary = cache_vary
         self.cache_bust_condition = cache_bust_condition
+        self.cache_tags = cache_tags
         super().__init__(
             object_list,
             per_page,
@@ -37,6 +41,7 @@ class CachedPaginator(Paginator):
             cache_key=self.cache_key,
             cache_vary=self.cache_vary,
             cache_bust_condition=self.cache_bust_condition,
+            cache_tags=self.cache_tags,
             **kwargs,
         )
 
@@ -47,6 +52,7 @@ class CachedPaginator(Paginator):
             cache_key=f"{self.cache_key}.count",
             cache_vary=self.cache_vary,
             get_default=lambda: super(CachedPaginator, self).count,
+            tags=self.cache_tags,
         )
 
     def _check_object_list_is_ordered(self):
@@ -63,10 +69,12 @@ class CachedPage(Page):
         cache_key: str,
         cache_vary: str,
         cache_bust_condition: str,
+        cache_tags: Sequence[str] = (),
     ):
         self.cache_key = cache_key
         self.cache_vary = cache_vary
         self.cache_bust_condition = cache_bust_condition
+        self.cache_tags = cache_tags
         self._object_list = object_list
         self.number = number
         super().__init__(self.object_list, number, paginator)
@@ -78,4 +86,5 @@ class CachedPage(Page):
             cache_key=f"{self.cache_key}.page.{self.number}",
             cache_vary=self.cache_vary,
             get_default=lambda: list(self._object_list),
+            tags=self.cache_tags,
         )
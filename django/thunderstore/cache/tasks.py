@@ -1,22 +1,30 @@
+from typing import List, Optional
+
 from celery import shared_task
 from django.conf import settings
-from django.core.cache import cache
 
 from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.index import delete_indexed_cache_keys
 from thunderstore.core.settings import CeleryQueues
 from thunderstore.utils.decorators import run_after_commit
 
 
 @run_after_commit
-def invalidate_cache_on_commit_async(cache_bust_condition: str):
+def invalidate_cache_on_commit_async(
+    cache_bust_condition: str,
+    tags: Optional[List[str]] = None,
+):
     if cache_bust_condition in settings.DISABLED_CACHE_BUST_CONDITIONS:
         return
-    invalidate_cache.delay(cache_bust_condition)
+    invalidate_cache.delay(cache_bust_condition, tags)
 
 
 @shared_task(queue=CeleryQueues.BackgroundCache)
-def invalidate_cache(cache_bust_condition: str):
+def invalidate_cache(cache_bust_condition: str, tags: Optional[List[str]] = None):
+    """
+    Invalidate the cache entries of the condition. If tags are given, only
+    entries tagged with any of them and untagged entries are invalidated.
+    """
     if cache_bust_condition == CacheBustCondition.background_update_only:
         raise AttributeError("Invalid cache bust condition")
-    if hasattr(cache, "delete_pattern"):
-        cache.delete_pattern(f"cache.{cache_bust_condition}.*")
+    delete_indexed_cache_keys(cache_bust_condition, tags)
@@ -1,8 +1,18 @@
 import time
+from datetime import timedelta
 from typing import Any
 
-from thunderstore.cache.cache import cache_function_result
+from django.template import Context, Template
+
+from thunderstore.cache.cache import (
+    CacheEntry,
+    ManualCacheMixin,
+    cache,
+    cache_function_result,
+    cache_get_or_set,
+)
 from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.metrics import CacheEvent, get_cache_metrics
 
 
 def test_cache_clear_with_args() -> None:
@@ -21,3 +31,141 @@ def test_cache_clear_with_args() -> None:
     first_busted = get_time("test")
     assert first_busted > first
     assert first_busted > second
+
+
+def _get_counter():
+    calls = []
+
+    def counter() -> int:
+        calls.append(None)
+        return len(calls)
+
+    return counter
+
+
+def test_cache_get_or_set_serves_stale_value_while_refreshing(freezer) -> None:
+    counter = _get_counter()
+    assert cache_get_or_set("test.swr", counter, expiry=60) == 1
+    assert cache_get_or_set("test.swr", counter, expiry=60) == 1
+
+    freezer.tick(timedelta(seconds=61))
+    # Refreshed synchronously in tests, but the stale value is returned
+    assert cache_get_or_set("test.swr", counter, expiry=60) == 1
+    assert cache_get_or_set("test.swr", counter, expiry=60) == 2
+
+
+def test_cache_get_or_set_without_stale_while_revalidate(freezer) -> None:
+    counter = _get_counter()
+    kwargs = {"expiry": 60, "stale_while_revalidate": False}
+    assert cache_get_or_set("test.noswr", counter, **kwargs) == 1
+    freezer.tick(timedelta(seconds=61))
+    assert cache_get_or_set("test.noswr", counter, **kwargs) == 2
+
+
+def test_cache_get_or_set_refreshes_in_background(
+    freezer, settings: Any, mocker
+) -> None:
+    settings.CACHE_REFRESH_IN_BACKGROUND = True
+    executor = mocker.patch("thunderstore.cache.cache.get_refresh_executor")
+    counter = _get_counter()
+    cache_get_or_set("test.bg", counter, expiry=60)
+
+    freezer.tick(timedelta(seconds=61))
+    assert cache_get_or_set("test.bg", counter, expiry=60) == 1
+    # The refresh lock is held until the job has run
+    assert cache_get_or_set("test.bg", counter, expiry=60) == 1
+    assert executor.return_value.submit.call_count == 1
+
+    executor.return_value.submit.call_args.args[0]()
+    assert cache_get_or_set("test.bg", counter, expiry=60) == 2
+
+
+def test_cache_refresh_is_skipped_if_already_running(freezer) -> None:
+    counter = _get_counter()
+    cache_get_or_set("test.lock", counter, expiry=60)
+    freezer.tick(timedelta(seconds=61))
+
+    cache.add("lock.cacherefresh.test.lock", 1)
+    cache_get_or_set("test.lock", counter, expiry=60)
+    assert cache_get_or_set("test.lock", counter, expiry=60) == 1
+
+
+def test_cache_get_or_set_serves_legacy_entries() -> None:
+    cache.set("test.legacy", "legacy", timeout=60)
+    assert cache_get_or_set("test.legacy", lambda: "new", expiry=60) == "legacy"
+    entry = cache.get("test.legacy")
+    assert isinstance(entry, CacheEntry)
+    assert entry.value == "new"
+
+
+def test_cache_metrics(freezer, settings: Any) -> None:
+    settings.CACHE_METRICS_FLUSH_INTERVAL_SECONDS = 0
+    before = get_cache_metrics()
+    counter = _get_counter()
+
+    cache_get_or_set("test.metrics", counter, expiry=60)
+    cache_get_or_set("test.metrics", counter, expiry=60)
+    freezer.tick(timedelta(seconds=61))
+    cache_get_or_set("test.metrics", counter, expiry=60)
+
+    after = get_cache_metrics()
+
+    def delta(field: str) -> int:
+        return after.get(field, 0) - before.get(field, 0)
+
+    assert delta(CacheEvent.miss) == 1
+    assert delta(CacheEvent.hit) == 1
+    assert delta(CacheEvent.stale) == 1
+    assert delta(CacheEvent.regeneration) == 2
+    assert delta(f"{CacheEvent.regeneration}.le_100ms") == 2
+
+
+def test_manual_cache_mixin_refreshes_stale_views_detached(freezer, rf, mocker) -> None:
+    dispatched = []
+
+    class BaseView:
+        def dispatch(self, request, *args, **kwargs):
+            dispatched.append((self, request))
+            response = mocker.Mock()
+            response.render.return_value = len(dispatched)
+            return response
+
+    class View(ManualCacheMixin, BaseView):
+        cache_until = CacheBustCondition.any_package_updated
+        cache_expiry = 60
+
+        def get_extra_cache_vary(self):
+            return ("test",)
+
+    request = rf.get("/")
+    view = View()
+    view.request = request
+    assert view.dispatch(request) == 1
+    assert view.dispatch(request) == 1
+
+    freezer.tick(timedelta(seconds=61))
+    # The stale view is served while it's refreshed, using copies of the view
+    # and the request which stay valid outside of the request
+    assert view.dispatch(request) == 1
+    refreshed_view, refreshed_request = dispatched[-1]
+    assert len(dispatched) == 2
+    assert refreshed_view is not view
+    assert refreshed_request is not request
+    assert refreshed_request.path == request.path
+    assert view.dispatch(request) == 2
+
+
+def test_cache_until_fragment_serves_stale_value_while_refreshing(freezer) -> None:
+    template = Template(
+        "{% load cache_until %}"
+        '{% cache_until "any_package_updated" "test-fragment" 60 %}'
+        "{{ counter }}"
+        "{% endcache %}"
+    )
+    counter = _get_counter()
+    assert template.render(Context({"counter": counter})) == "1"
+
+    freezer.tick(timedelta(seconds=61))
+    # Refreshed synchronously in tests with a copy of the context
+    assert template.render(Context({"counter": counter})) == "1"
+    assert template.render(Context({"counter": counter})) == "2"
@@ -0,0 +1,111 @@
+from thunderstore.cache.cache import cache, cache_get_or_set
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
+from thunderstore.cache.index import (
+    UNTAGGED,
+    _get_redis,
+    get_index_key,
+    get_index_registry_key,
+)
+from thunderstore.cache.tasks import invalidate_cache
+
+CONDITION = CacheBustCondition.any_package_updated
+
+
+def _cache_value(key: str, **kwargs) -> str:
+    return cache_get_or_set(
+        key,
+        lambda: key,
+        expiry=60,
+        cache_bust_condition=CONDITION,
+        **kwargs,
+    )
+
+
+def test_invalidate_cache_with_tags_only_affects_tagged_entries() -> None:
+    tag_a = CacheTag.community("a")
+    tag_b = CacheTag.community("b")
+    _cache_value("test.a", tags=[tag_a])
+    _cache_value("test.b", tags=[tag_b])
+    _cache_value("test.ab", tags=[tag_a, tag_b])
+    _cache_value("test.untagged")
+
+    invalidate_cache(CONDITION, [tag_a])
+
+    assert cache.get("test.a") is None
+    assert cache.get("test.ab") is None
+    assert cache.get("test.untagged") is None
+    assert cache.get("test.b") is not None
+
+
+def test_invalidate_cache_without_tags_affects_all_entries() -> None:
+    _cache_value("test.a", tags=[CacheTag.community("a")])
+    _cache_value("test.untagged")
+    _cache_value("test.p1", tags=[CacheTag.package(1)])
+    cache_get_or_set(
+        "test.persistent",
+        lambda: "persistent",
+        expiry=None,
+        cache_bust_condition=CONDITION,
+    )
+
+    invalidate_cache(CONDITION)
+
+    assert cache.get("test.a") is None
+    assert cache.get("test.untagged") is None
+    assert cache.get("test.p1") is None
+    assert cache.get("test.persistent") is None
+
+
+def test_invalidate_cache_only_affects_its_condition() -> None:
+    cache_get_or_set(
+        "test.other",
+        lambda: "other",
+        expiry=60,
+        cache_bust_condition=CacheBustCondition.dynamic_html_updated,
+    )
+    _cache_value("test.package")
+
+    invalidate_cache(CONDITION)
+
+    assert cache.get("test.package") is None
+    assert cache.get("test.other") is not None
+
+
+def test_invalidated_entries_are_reindexed_when_regenerated() -> None:
+    tag = CacheTag.community("a")
+    _cache_value("test.a", tags=[tag])
+    invalidate_cache(CONDITION, [tag])
+    _cache_value("test.a", tags=[tag])
+    assert cache.get("test.a") is not None
+
+    invalidate_cache(CONDITION, [tag])
+    assert cache.get("test.a") is None
+
+
+def test_invalidate_cache_drops_popped_index_sets() -> None:
+    tag_a = CacheTag.community("a")
+    tag_b = CacheTag.community("b")
+    _cache_value("test.a", tags=[tag_a])
+    _cache_value("test.b", tags=[tag_b])
+    _cache_value("test.untagged")
+    redis = _get_redis()
+
+    def get_index_names():
+        key = cache.make_key(get_index_registry_key(CONDITION))
+        return {x.decode() for x in redis.smembers(key)}
+
+    def get_indexed_keys():
+        names = get_index_names() | {tag_a, tag_b, UNTAGGED}
+        index_keys = [cache.make_key(get_index_key(CONDITION, x)) for x in names]
+        return {x.decode() for x in redis.sunion(index_keys)}
+
+    assert get_index_names() == {tag_a, tag_b, UNTAGGED}
+
+    invalidate_cache(CONDITION, [tag_a])
+    assert get_index_names() == {tag_b}
+    assert get_indexed_keys() == {"test.b"}
+
+    invalidate_cache(CONDITION)
+    assert get_index_names() == set()
+    assert get_indexed_keys() == set()
+    assert cache.get("test.b") is None
@@ -0,0 +1,51 @@
+# Generated by Django 3.1.7 on 2026-10-17 13:40
+
+from django.db import migrations, models
+
+BACKFILL_SORT_KEYS = """
+UPDATE community_packagelisting AS l SET
+    download_count = COALESCE((
+        SELECT SUM(v.downloads) FROM repository_packageversion AS v
+        WHERE v.package_id = l.package_id
+    ), 0),
+    rating_count = COALESCE((
+        SELECT COUNT(*) FROM repository_packagerating AS r
+        WHERE r.package_id = l.package_id
+    ), 0);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0070_add_package_search_vector"),
+        ("community", "0038_auto_20260430_0111"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="packagelisting",
+            name="download_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packagelisting",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(BACKFILL_SORT_KEYS, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="packagelisting",
+            index=models.Index(
+                fields=["community", "-download_count", "-id"],
+                name="listing_downloads_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="packagelisting",
+            index=models.Index(
+                fields=["community", "-rating_count", "-id"],
+                name="listing_rating_order_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 3.1.7 on 2026-10-17 20:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+BACKFILL_SORT_KEYS = """
+UPDATE community_packagelisting AS l SET
+    is_pinned = p.is_pinned,
+    is_deprecated = p.is_deprecated,
+    date_updated = p.date_updated
+FROM repository_package AS p
+WHERE p.id = l.package_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0039_packagelisting_sort_keys"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="packagelisting",
+            name="download_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packagelisting",
+            name="is_pinned",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packagelisting",
+            name="is_deprecated",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packagelisting",
+            name="date_updated",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SORT_KEYS, migrations.RunSQL.noop),
+        migrations.RemoveIndex(
+            model_name="packagelisting",
+            name="listing_downloads_order_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="packagelisting",
+            name="listing_rating_order_idx",
+        ),
+        migrations.AddIndex(
+            model_name="packagelisting",
+            index=models.Index(
+                fields=[
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-date_updated",
+                    "-package",
+                ],
+                name="listing_updated_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="packagelisting",
+            index=models.Index(
+                fields=[
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-download_count",
+                    "-date_updated",
+                    "-package",
+                ],
+                name="listing_downloads_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="packagelisting",
+            index=models.Index(
+                fields=[
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-rating_count",
+                    "-date_updated",
+                    "-package",
+                ],
+                name="listing_rating_order_idx",
+            ),
+        ),
+    ]
@@ -6,7 +6,7 @@ from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import Manager, QuerySet
+from django.db.models import Manager, QuerySet, Sum
 from django.urls import reverse
 from django.utils.functional import cached_property
 
@@ -408,7 +408,7 @@ class CommunityAggregatedFields(TimestampMixin, models.Model):
         listings = listings.filter_with_single_community()
 
         community.aggregated_fields.package_count = listings.count()
-        community.aggregated_fields.download_count = sum(
-            listing.total_downloads for listing in listings
+        community.aggregated_fields.download_count = (
+            listings.aggregate(total=Sum("download_count"))["total"] or 0
         )
         community.aggregated_fields.save()
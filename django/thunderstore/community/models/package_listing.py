@@ -3,12 +3,12 @@ from typing import TYPE_CHECKING, List, Optional
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import Exists, OuterRef, Q, signals
+from django.db.models import Exists, OuterRef, Q, Subquery, signals
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 
-from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
 from thunderstore.cache.tasks import invalidate_cache_on_commit_async
 from thunderstore.community.consts import PackageListingReviewStatus
 from thunderstore.core.exceptions import PermissionValidationError
@@ -61,6 +61,22 @@ class PackageListingQueryset(VisibilityFlagsQuerySet):
             community_count=models.Count("package__community_listings", distinct=True)
         ).exclude(~Q(community_count=1))
 
+    def update_sort_keys(self) -> int:
+        """
+        Copy the denormalized sort key columns of the listings from their
+        package.
+        """
+        from thunderstore.repository.models import Package
+
+        package = Package.objects.filter(pk=OuterRef("package_id"))
+        return self.update(
+            download_count=Subquery(package.values("total_downloads")[:1]),
+            rating_count=Subquery(package.values("rating_score")[:1]),
+            is_pinned=Subquery(package.values("is_pinned")[:1]),
+            is_deprecated=Subquery(package.values("is_deprecated")[:1]),
+            date_updated=Subquery(package.values("date_updated")[:1]),
+        )
+
 
 # TODO: Add a db constraint that ensures a package listing and it's categories
 #       belong to the same community. This might require actually specifying
@@ -106,12 +122,58 @@ class PackageListing(TimestampMixin, AdminLinkMixin, VisibilityMixin):
     has_nsfw_content = models.BooleanField(default=False)
     is_auto_imported = models.BooleanField(default=False)
 
+    # Denormalized from the package for cheap ordering of community listings,
+    # kept up to date by PackageListingQueryset.update_sort_keys. Every
+    # column of the listing orderings is copied, as an index can only serve
+    # an ordering made up of the columns of a single table.
+    download_count = models.PositiveBigIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    is_pinned = models.BooleanField(default=False, editable=False)
+    is_deprecated = models.BooleanField(default=False, editable=False)
+    date_updated = models.DateTimeField(default=timezone.now, editable=False)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
                 fields=("package", "community"), name="one_listing_per_community"
             ),
         ]
+        # Match the orderings of the community package lists, so that they
+        # can be paginated by walking an index instead of sorting
+        indexes = [
+            models.Index(
+                fields=(
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-date_updated",
+                    "-package",
+                ),
+                name="listing_updated_order_idx",
+            ),
+            models.Index(
+                fields=(
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-download_count",
+                    "-date_updated",
+                    "-package",
+                ),
+                name="listing_downloads_order_idx",
+            ),
+            models.Index(
+                fields=(
+                    "community",
+                    "-is_pinned",
+                    "is_deprecated",
+                    "-rating_count",
+                    "-date_updated",
+                    "-package",
+                ),
+                name="listing_rating_order_idx",
+            ),
+        ]
 
     def validate(self):
         if self.pk:
@@ -294,27 +356,35 @@ class PackageListing(TimestampMixin, AdminLinkMixin, VisibilityMixin):
             )
         )
 
-    @cached_property
+    @property
     def rating_score(self):
-        annotated = getattr(self, "_rating_score", None)
-        if annotated is not None:
-            return annotated
         return self.package.rating_score
 
-    @cached_property
+    @property
     def total_downloads(self):
-        annotated = getattr(self, "_total_downloads", None)
-        if annotated is not None:
-            return annotated
-        return self.package.downloads
+        return self.package.total_downloads
+
+    def get_cache_tags(self) -> List[str]:
+        return [
+            CacheTag.community(self.community.identifier),
+            CacheTag.package(self.package_id),
+        ]
 
     @staticmethod
     def post_save(sender, instance, created, **kwargs):
-        invalidate_cache_on_commit_async(CacheBustCondition.any_package_updated)
+        if created:
+            PackageListing.objects.filter(pk=instance.pk).update_sort_keys()
+        invalidate_cache_on_commit_async(
+            CacheBustCondition.any_package_updated,
+            instance.get_cache_tags(),
+        )
 
     @staticmethod
     def post_delete(sender, instance, **kwargs):
-        invalidate_cache_on_commit_async(CacheBustCondition.any_package_updated)
+        invalidate_cache_on_commit_async(
+            CacheBustCondition.any_package_updated,
+            instance.get_cache_tags(),
+        )
 
     @property
     def is_waiting_for_approval(self):
@@ -19,6 +19,7 @@ from thunderstore.community.models import (
     CommunityMembership,
     PackageCategory,
     PackageListing,
+    PackageListingQueryset,
 )
 from thunderstore.core.factories import UserFactory
 from thunderstore.permissions.models.tests._utils import (
@@ -28,7 +29,9 @@ from thunderstore.permissions.models.tests._utils import (
     assert_visibility_is_public,
 )
 from thunderstore.repository.consts import PackageVersionReviewStatus
+from thunderstore.repository.factories import PackageRatingFactory
 from thunderstore.repository.models import Package, TeamMember, TeamMemberRole
+from thunderstore.repository.tasks.downloads import log_version_download
 
 
 @pytest.mark.django_db
@@ -742,3 +745,77 @@ def test_package_listing_reject_skips_notes_if_none():
 
     listing.refresh_from_db()
     assert listing.notes == original_notes
+
+
+@pytest.mark.django_db
+def test_package_listing_sort_keys_are_maintained() -> None:
+    listing = PackageListingFactory(package_version_kwargs={"downloads": 5})
+    other_listing = PackageListingFactory(
+        package_=listing.package,
+        community_=CommunityFactory(),
+    )
+    package = listing.package
+
+    def assert_sort_keys(download_count: int, rating_count: int) -> None:
+        for entry in (listing, other_listing):
+            entry.refresh_from_db()
+            assert entry.download_count == download_count
+            assert entry.rating_count == rating_count
+
+    assert_sort_keys(5, 0)
+
+    PackageVersionFactory(package=package, downloads=20, version_number="1.0.1")
+    assert_sort_keys(25, 0)
+
+    log_version_download(package.latest.id, "2026-10-17T12:00:00+00:00")
+    assert_sort_keys(26, 0)
+
+    rating = PackageRatingFactory(package=package)
+    PackageRatingFactory(package=package)
+    assert_sort_keys(26, 2)
+
+    rating.delete()
+    assert_sort_keys(26, 1)
+
+    PackageListing.objects.update(download_count=0, rating_count=0)
+    assert PackageListing.objects.all().update_sort_keys() == 2
+    assert_sort_keys(26, 1)
+
+
+@pytest.mark.django_db
+def test_package_listing_ordering_sort_keys_follow_package() -> None:
+    listing = PackageListingFactory()
+    package = listing.package
+
+    package.is_pinned = True
+    package.save()
+    listing.refresh_from_db()
+    assert listing.is_pinned is True
+    assert listing.date_updated == package.date_updated
+
+    package.deprecate()
+    listing.refresh_from_db()
+    assert listing.is_deprecated is True
+
+    package.undeprecate()
+    listing.refresh_from_db()
+    assert listing.is_deprecated is False
+
+    PackageVersionFactory(package=package, version_number="1.0.1")
+    package.refresh_from_db()
+    listing.refresh_from_db()
+    assert listing.date_updated == package.date_updated
+
+
+@pytest.mark.django_db
+def test_package_listing_sort_keys_not_synced_by_unrelated_saves(mocker) -> None:
+    package = Package.objects.get(pk=PackageListingFactory().package.pk)
+    update_sort_keys = mocker.patch.object(PackageListingQueryset, "update_sort_keys")
+
+    package.is_active = False
+    package.save()
+    assert update_sort_keys.call_count == 0
+
+    package.is_pinned = True
+    package.save()
+    assert update_sort_keys.call_count == 1
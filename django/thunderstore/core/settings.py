@@ -32,6 +32,13 @@ env = environ.Env(
     DATABASE_URL=(str, "sqlite:///database/default.db"),
     DISABLE_SERVER_SIDE_CURSORS=(bool, True),
     DISABLED_CACHE_BUST_CONDITIONS=(list, []),
+    CACHE_STALE_WHILE_REVALIDATE=(bool, True),
+    CACHE_REFRESH_IN_BACKGROUND=(bool, True),
+    CACHE_REFRESH_MAX_WORKERS=(int, 2),
+    CACHE_METRICS_FLUSH_INTERVAL_SECONDS=(int, 10),
+    APIV1_PACKAGE_LIST_DELIVERY_MODE=(str, "stream"),
+    APIV1_PACKAGE_LIST_STREAM_CHUNK_SIZE=(int, 64 * 1024),
+    APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX=(str, "/internal/cache/"),
     SECRET_KEY=(str, ""),
     ALLOWED_HOSTS=(list, []),
     CORS_ALLOWED_ORIGINS=(list, []),
@@ -76,6 +83,7 @@ env = environ.Env(
     USERMEDIA_S3_REGION_NAME=(str, ""),
     USERMEDIA_S3_STORAGE_BUCKET_NAME=(str, ""),
     USERMEDIA_S3_LOCATION=(str, ""),
+    USERMEDIA_S3_DOWNLOAD_MAX_CONCURRENCY=(int, 8),
     ABYSS_S3_ENDPOINT_URL=(str, ""),
     ABYSS_S3_ACCESS_KEY_ID=(str, ""),
     ABYSS_S3_SECRET_ACCESS_KEY=(str, ""),
@@ -139,20 +147,35 @@ env = environ.Env(
     CACHALOT_TIMEOUT_SECONDS=(int, 60 * 15),  # 15 minutes by default
     CACHALOT_ENABLED=(bool, True),
     DOWNLOAD_METRICS_TTL_SECONDS=(int, 60 * 10),
+    MARKDOWN_RENDER_CACHE_TTL_SECONDS=(int, 60 * 60 * 24 * 7),
+    USER_PROFILE_CACHE_TTL_SECONDS=(int, 60 * 60 * 24),
+    DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS=(int, 60),
     KAFKA_ENABLED=(bool, False),
     KAFKA_TOPIC_PREFIX=(str, "dev"),
     KAFKA_CONFIG_PATH=(str, "config/kafka.json"),
+    KAFKA_LINGER_MS=(int, 50),
+    KAFKA_BATCH_NUM_MESSAGES=(int, 10000),
+    KAFKA_FLUSH_TIMEOUT_SECONDS=(int, 30),
+    KAFKA_BACKPRESSURE_TIMEOUT_SECONDS=(int, 1),
+    USE_BUFFERED_ANALYTICS=(bool, True),
+    WEBHOOK_TIMEOUT_SECONDS=(int, 10),
+    WEBHOOK_MAX_ATTEMPTS=(int, 5),
+    WEBHOOK_MAX_WAIT_SECONDS=(int, 5),
+    WEBHOOK_RETRY_BACKOFF_SECONDS=(int, 10),
+    ANALYTICS_BUFFER_BATCH_SIZE=(int, 1000),
     # FEATURE FLAGS UNDER HERE
     IS_CYBERSTORM_ENABLED=(bool, False),
     SHOW_CYBERSTORM_API_DOCS=(bool, False),
     USE_ASYNC_PACKAGE_SUBMISSION_FLOW=(bool, False),
     USE_TIME_SERIES_PACKAGE_DOWNLOAD_METRICS=(bool, True),
+    USE_BATCHED_DOWNLOAD_COUNTER=(bool, True),
     MIRROR_DEFAULT_STORAGE=(bool, True),
     MIRROR_THUMBNAIL_STORAGE=(bool, True),
     MIRROR_PACKAGE_STORAGE=(bool, True),
     MIRROR_MODPACK_STORAGE=(bool, True),
     MIRROR_SCHEMA_STORAGE=(bool, True),
     MIRROR_BLOB_STORAGE=(bool, True),
+    BLOB_UPLOAD_MAX_WORKERS=(int, 8),
 )
 
 ALWAYS_RAISE_EXCEPTIONS = env.bool("ALWAYS_RAISE_EXCEPTIONS")
@@ -401,6 +424,7 @@ class CeleryQueues:
     BackgroundTask = "background.task"
     BackgroundLongRunning = "background.long_running"
     Analytics = "analytics"
+    PackageSubmission = "package.submission"
 
 
 CELERY_BROKER_URL = env.str("CELERY_BROKER_URL")
@@ -485,6 +509,27 @@ if DEBUG_TOOLBAR_ENABLED:
 DISABLED_CACHE_BUST_CONDITIONS = env.list("DISABLED_CACHE_BUST_CONDITIONS")
 USE_MULTIPLE_CACHES = env.bool("USE_MULTIPLE_CACHES")
 
+# Serve expired entries of thunderstore.cache.cache for another expiry
+# period while a single background thread regenerates them. Entries that
+# have been invalidated are still regenerated on the request path.
+CACHE_STALE_WHILE_REVALIDATE = env.bool("CACHE_STALE_WHILE_REVALIDATE")
+# Refresh stale entries inline (after reading them) if disabled, used in tests
+CACHE_REFRESH_IN_BACKGROUND = env.bool("CACHE_REFRESH_IN_BACKGROUND")
+CACHE_REFRESH_MAX_WORKERS = env.int("CACHE_REFRESH_MAX_WORKERS")
+# How often the per-process cache hit/stale/miss counters are written to redis
+CACHE_METRICS_FLUSH_INTERVAL_SECONDS = env.int("CACHE_METRICS_FLUSH_INTERVAL_SECONDS")
+
+# How the cached v1 package list is delivered to clients:
+#   stream   - Stream the file from storage through the web worker
+#   redirect - Redirect the client to the storage (or an allowed CDN) URL
+#   accel    - Let the reverse proxy serve the file via X-Accel-Redirect,
+#              using APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX + file name
+APIV1_PACKAGE_LIST_DELIVERY_MODE = env.str("APIV1_PACKAGE_LIST_DELIVERY_MODE")
+APIV1_PACKAGE_LIST_STREAM_CHUNK_SIZE = env.int("APIV1_PACKAGE_LIST_STREAM_CHUNK_SIZE")
+APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX = env.str(
+    "APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX"
+)
+
 
 def get_redis_cache(env_key: str, fallback_key: Optional[str] = None):
     url = env.str(env_key)
@@ -605,6 +650,22 @@ KAFKA_ENABLED = env.bool("KAFKA_ENABLED")
 # An empty string will lead to no prefix of any kind
 KAFKA_TOPIC_PREFIX = env.str("KAFKA_TOPIC_PREFIX")
 
+# Producer defaults for batching messages, overridden by the values of the
+# producer configuration file if present.
+KAFKA_LINGER_MS = env.int("KAFKA_LINGER_MS")
+KAFKA_BATCH_NUM_MESSAGES = env.int("KAFKA_BATCH_NUM_MESSAGES")
+
+# Seconds to wait for a batch of messages to be delivered
+KAFKA_FLUSH_TIMEOUT_SECONDS = env.int("KAFKA_FLUSH_TIMEOUT_SECONDS")
+# Seconds to wait for room in the producer queue once it's full
+KAFKA_BACKPRESSURE_TIMEOUT_SECONDS = env.int("KAFKA_BACKPRESSURE_TIMEOUT_SECONDS")
+
+# Buffer analytics events in redis and send them to Kafka in bulk by a
+# periodic task, instead of running a task per event
+USE_BUFFERED_ANALYTICS = env.bool("USE_BUFFERED_ANALYTICS")
+# Maximum number of buffered events sent to Kafka by a single task
+ANALYTICS_BUFFER_BATCH_SIZE = env.int("ANALYTICS_BUFFER_BATCH_SIZE")
+
 
 class ConfigValidationError(RuntimeError):
     pass
@@ -692,6 +753,8 @@ USERMEDIA_S3_SIGNING_ENDPOINT_URL = env.str("USERMEDIA_S3_SIGNING_ENDPOINT_URL")
 USERMEDIA_S3_REGION_NAME = env.str("USERMEDIA_S3_REGION_NAME")
 USERMEDIA_S3_STORAGE_BUCKET_NAME = env.str("USERMEDIA_S3_STORAGE_BUCKET_NAME")
 USERMEDIA_S3_LOCATION = validate_filepath_prefix(env.str("USERMEDIA_S3_LOCATION"))
+# Number of parallel ranged GET requests used for downloading an upload
+USERMEDIA_S3_DOWNLOAD_MAX_CONCURRENCY = env.int("USERMEDIA_S3_DOWNLOAD_MAX_CONCURRENCY")
 USERMEDIA_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=2592000",  # 30 days
 }
@@ -806,6 +869,8 @@ PACKAGE_FILE_STORAGE = get_storage_class_or_stub(PACKAGE_FILE_STORAGE)
 MODPACK_FILE_STORAGE = get_storage_class_or_stub(MODPACK_FILE_STORAGE)
 SCHEMA_FILE_STORAGE = get_storage_class_or_stub(SCHEMA_FILE_STORAGE)
 BLOB_FILE_STORAGE = get_storage_class_or_stub(BLOB_FILE_STORAGE)
+# Number of threads used for uploading new blobs when creating them in bulk
+BLOB_UPLOAD_MAX_WORKERS = env.int("BLOB_UPLOAD_MAX_WORKERS")
 
 # Social auth
 
@@ -888,4 +953,32 @@ USE_TIME_SERIES_PACKAGE_DOWNLOAD_METRICS = env.bool(
 # Seconds to wait between logging download events
 DOWNLOAD_METRICS_TTL_SECONDS = env.int("DOWNLOAD_METRICS_TTL_SECONDS")
 
+# Seconds to keep rendered markdown documents cached. Entries are keyed by
+# the content, so they never need to be invalidated.
+MARKDOWN_RENDER_CACHE_TTL_SECONDS = env.int("MARKDOWN_RENDER_CACHE_TTL_SECONDS")
+
+# Seconds to keep the profile documents of the current user API cached.
+# Entries are versioned per user and replaced whenever the user changes.
+USER_PROFILE_CACHE_TTL_SECONDS = env.int("USER_PROFILE_CACHE_TTL_SECONDS")
+
+# Aggregate download counts in redis and apply them to the database in bulk
+# by a periodic task, instead of running a task per download
+USE_BATCHED_DOWNLOAD_COUNTER = env.bool("USE_BATCHED_DOWNLOAD_COUNTER")
+
+# Width in seconds of the time buckets download counts are aggregated into.
+# A bucket is flushed to the database once it has been closed.
+DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS = env.int(
+    "DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS"
+)
+
+# Seconds to wait for a webhook endpoint to respond
+WEBHOOK_TIMEOUT_SECONDS = env.int("WEBHOOK_TIMEOUT_SECONDS")
+# Attempts made at delivering a webhook before giving up
+WEBHOOK_MAX_ATTEMPTS = env.int("WEBHOOK_MAX_ATTEMPTS")
+# Longest rate limit waited out within a delivery task. Deliveries limited
+# for longer are retried by a later task instead.
+WEBHOOK_MAX_WAIT_SECONDS = env.int("WEBHOOK_MAX_WAIT_SECONDS")
+# Base delay of the exponential backoff between failed delivery attempts
+WEBHOOK_RETRY_BACKOFF_SECONDS = env.int("WEBHOOK_RETRY_BACKOFF_SECONDS")
+
 globals().update(plugin_registry.get_django_settings(globals()))
@@ -1,12 +1,16 @@
-from typing import IO, Any, Dict, Optional, TypedDict
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional, TypedDict
 
 from django.conf import settings
 from django.utils.deconstruct import deconstructible
 from storages.backends.s3boto3 import S3Boto3Storage  # type: ignore
+from storages.utils import clean_name  # type: ignore
 
 from thunderstore.utils.contexts import TemporarySpooledCopy
 from thunderstore.utils.makemigrations import is_migrate_check
 
+if TYPE_CHECKING:
+    from django.db.models.fields.files import FieldFile
+
 
 # These are required as a placeholder stub for migrations, otherwise Django thinks
 # something keeps changing due to settings being different.
@@ -60,3 +64,24 @@ class MirroredS3Storage(S3Boto3Storage):
 
         for storage_mirror in self.mirrors:
             storage_mirror.delete(name)
+
+
+def iterate_file_chunks(file: "FieldFile", chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a stored file in chunks of at most chunk_size bytes.
+
+    S3Boto3StorageFile downloads the whole object before returning the
+    first byte, so S3 objects are instead read straight from the response
+    body of a GET request.
+    """
+    storage = file.storage
+    if isinstance(storage, S3Boto3Storage):
+        name = storage._normalize_name(clean_name(file.name))
+        body = storage.bucket.Object(name).get()["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+    else:
+        with file.open("rb"):
+            yield from file.chunks(chunk_size)
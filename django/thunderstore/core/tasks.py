@@ -2,6 +2,7 @@ from typing import Dict, Optional, Union
 
 import requests
 from celery import shared_task
+from django.conf import settings
 
 from thunderstore.core.settings import CeleryQueues
 
@@ -16,6 +17,7 @@ def celery_post(
         webhook_url,
         data=data,
         headers=headers,
+        timeout=settings.WEBHOOK_TIMEOUT_SECONDS,
     )
     return {
         "url": response.url,
@@ -32,16 +32,27 @@ KNOWN_CELERY_IDS = (
     "thunderstore.core.tasks.celery_post",
     "thunderstore.cache.tasks.invalidate_cache",
     "thunderstore.repository.tasks.update_api_caches",
+    "thunderstore.repository.tasks.update_api_cache_for_community",
+    "thunderstore.repository.tasks.finalize_api_caches_update",
     "thunderstore.usermedia.tasks.celery_cleanup_expired_uploads",
     "thunderstore.schema_import.tasks.sync_ecosystem_schema",
     "thunderstore.repository.tasks.files.extract_package_version_file_tree",
+    "thunderstore.repository.tasks.process_package_version",
+    "thunderstore.repository.tasks.retry_package_version_processing",
+    "thunderstore.repository.tasks.update_total_used_disk_space",
     "thunderstore.repository.tasks.update_chunked_package_caches",
+    "thunderstore.repository.tasks.update_chunked_package_cache",
+    "thunderstore.repository.tasks.finalize_chunked_package_caches_update",
     "thunderstore.repository.tasks.update_experimental_package_index",
     "thunderstore.repository.tasks.process_package_submission",
     "thunderstore.repository.tasks.cleanup_package_submissions",
     "thunderstore.repository.tasks.log_version_download",
+    "thunderstore.repository.tasks.flush_download_counters",
     "thunderstore.webhooks.tasks.process_audit_event",
+    "thunderstore.webhooks.tasks.deliver_webhooks",
     "thunderstore.ts_analytics.tasks.send_kafka_message",
+    "thunderstore.ts_analytics.tasks.send_kafka_messages",
+    "thunderstore.ts_analytics.tasks.flush_analytics_buffer",
 )
 
 
@@ -3,7 +3,7 @@ from django.core.files.storage import default_storage
 from django.test import override_settings
 from PIL import Image  # type: ignore
 
-from thunderstore.core.storage import get_storage_class_or_stub
+from thunderstore.core.storage import get_storage_class_or_stub, iterate_file_chunks
 from thunderstore.repository.factories import PackageVersionFactory
 from thunderstore.repository.models.package_version import get_version_png_filepath
 
@@ -55,3 +55,15 @@ def test_mirrored_storage(dummy_image: Image) -> None:
     assert not default_storage.exists(icon_path)
     for mirror_storage in default_storage.mirrors:
         assert not mirror_storage.exists(icon_path)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("chunk_size", (1, 3, 1024))
+def test_iterate_file_chunks(community, chunk_size: int) -> None:
+    from thunderstore.repository.models import APIV1PackageCache
+
+    cache = APIV1PackageCache.update_for_community(community, b"test content")
+    chunks = list(iterate_file_chunks(cache.data, chunk_size))
+
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert b"".join(chunks) == cache.data.open("rb").read()
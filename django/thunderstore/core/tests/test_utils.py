@@ -1,12 +1,16 @@
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.http import HttpResponse
 from django.test import RequestFactory, override_settings
+from django.utils.http import http_date
 
 from thunderstore.core.utils import (
     capture_exception,
     check_validity,
+    conditional_response,
     extend_update_fields_if_present,
     make_full_url,
     replace_cdn,
@@ -226,3 +230,56 @@ def test_extend_update_fields_if_present__accepts_tuple_and_empty_new_fields() -
     original = {"update_fields": ("x",)}
     result = extend_update_fields_if_present(original)
     assert result["update_fields"] == {"x"}
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected_status"),
+    (
+        ({}, 200),
+        ({"HTTP_IF_NONE_MATCH": '"abc"'}, 304),
+        ({"HTTP_IF_NONE_MATCH": '"def"'}, 200),
+        ({"HTTP_IF_MODIFIED_SINCE": http_date(1700000000)}, 304),
+        ({"HTTP_IF_MODIFIED_SINCE": http_date(1600000000)}, 200),
+        # If-Modified-Since is ignored when If-None-Match is present
+        (
+            {
+                "HTTP_IF_NONE_MATCH": '"def"',
+                "HTTP_IF_MODIFIED_SINCE": http_date(1700000000),
+            },
+            200,
+        ),
+    ),
+)
+def test_conditional_response(
+    rf: RequestFactory,
+    headers: dict,
+    expected_status: int,
+) -> None:
+    built = []
+
+    def get_response():
+        built.append(True)
+        return HttpResponse(b"content")
+
+    response = conditional_response(
+        rf.get("", **headers),
+        get_response,
+        etag="abc",
+        last_modified=datetime.fromtimestamp(1700000000, tz=timezone.utc),
+    )
+
+    assert response.status_code == expected_status
+    assert bool(built) == (expected_status == 200)
+    assert response["ETag"] == '"abc"'
+    assert response["Last-Modified"] == http_date(1700000000)
+
+
+def test_conditional_response_without_validators(rf: RequestFactory) -> None:
+    response = conditional_response(
+        rf.get("", HTTP_IF_NONE_MATCH='"abc"'),
+        lambda: HttpResponse(b"content"),
+    )
+
+    assert response.status_code == 200
+    assert "ETag" not in response
+    assert "Last-Modified" not in response
@@ -1,10 +1,14 @@
 import re
 import urllib.parse
+from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from sentry_sdk import capture_exception as capture_sentry_exception
 
 
@@ -130,6 +134,33 @@ def validate_filepath_prefix(filepath: Optional[str]) -> Optional[str]:
     return stripped
 
 
+def conditional_response(
+    request: HttpRequest,
+    get_response: Callable[[], HttpResponseBase],
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+) -> HttpResponseBase:
+    """
+    Build a response with the given validators, or a 304 Not Modified
+    response without calling `get_response` if the client's copy is current.
+
+    :param etag: Unquoted strong ETag of the content, e.g. its checksum
+    :param last_modified: Time the content was last modified
+    """
+    etag = quote_etag(etag) if etag else None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = get_response()
+
+    if etag:
+        response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    return response
+
+
 def replace_cdn(absolute_url: str, domain: Optional[str]):
     # The implementation would change any relative URL to a
     # "protocol-relative URL", which may or may not be what some future
@@ -1,7 +1,7 @@
 from typing import Optional, OrderedDict
 
 from django.core.paginator import EmptyPage, Page
-from django.db.models import Count, Prefetch, Q, QuerySet, Sum
+from django.db.models import Prefetch, Q, QuerySet
 from django.http import HttpRequest, HttpResponse
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -10,7 +10,7 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
 from thunderstore.cache.pagination import CachedPaginator
 from thunderstore.community.consts import PackageListingReviewStatus
 from thunderstore.community.models import Community, PackageListingSection
@@ -20,6 +20,7 @@ from thunderstore.frontend.api.experimental.serializers.views import (
     PackageSearchQueryParameterSerializer,
 )
 from thunderstore.repository.models import Package
+from thunderstore.repository.search import filter_packages_by_search_query
 
 
 class CommunityPackageListApiView(APIView):
@@ -85,7 +86,6 @@ class CommunityPackageListApiView(APIView):
         community_listings = Prefetch(
             "community_listings", community.package_listings.all()
         )
-
         return (
             Package.objects.active()
             .filter(
@@ -98,8 +98,6 @@ class CommunityPackageListApiView(APIView):
                 "community_listings__community",
             )
             .select_related("latest", "namespace", "owner")
-            .annotate(total_downloads=Sum("versions__downloads"))
-            .annotate(total_rating=Count("package_ratings"))
         )
 
     def filter_deprecated(
@@ -186,20 +184,7 @@ class CommunityPackageListApiView(APIView):
         """
         Filter packages by free text search.
         """
-        if not query:
-            return queryset
-
-        search_fields = ("name", "owner__name", "latest__description")
-        icontains_query = Q()
-        parts = [x for x in query.split(" ") if x]
-
-        for part in parts:
-            part_query = Q()
-            for field in search_fields:
-                part_query |= Q(**{f"{field}__icontains": part})
-            icontains_query &= part_query
-
-        return queryset.filter(icontains_query).distinct()
+        return filter_packages_by_search_query(query, queryset)
 
     def order_queryset(
         self, ordering: str, queryset: QuerySet[Package]
@@ -211,7 +196,7 @@ class CommunityPackageListApiView(APIView):
             "last-updated": "-date_updated",
             "most-downloaded": "-total_downloads",
             "newest": "-date_created",
-            "top-rated": "-total_rating",
+            "top-rated": "-rating_score",
         }.get(ordering, "-date_updated")
 
         return queryset.order_by("-is_pinned", "is_deprecated", order_arg)
@@ -226,6 +211,7 @@ class CommunityPackageListApiView(APIView):
             cache_key="frontend.community_package_list.paginator",
             cache_vary=self.get_full_cache_vary(params),
             cache_bust_condition=CacheBustCondition.any_package_updated,
+            cache_tags=[CacheTag.community(self.kwargs["community_identifier"])],
         )
 
         # PageNotAnInteger error won't be raised here since deserializer
@@ -260,7 +246,7 @@ class CommunityPackageListApiView(APIView):
                 "last_updated": p.date_updated,
                 "namespace": p.namespace.name,
                 "package_name": p.name,
-                "rating_score": p.total_rating,
+                "rating_score": p.rating_score,
                 "team_name": p.owner.name,
             }
             for p in package_page.object_list
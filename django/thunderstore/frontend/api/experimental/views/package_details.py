@@ -1,4 +1,4 @@
-from django.db.models import Count, QuerySet, Sum
+from django.db.models import Count, QuerySet
 from django.http import Http404, HttpRequest, HttpResponse
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -72,8 +72,6 @@ class PackageDetailApiView(APIView):
                 "package__latest__dependencies__package__namespace",
             )
             .annotate(package_dependant_count=Count("package__latest__dependants"))
-            .annotate(package_total_downloads=Sum("package__versions__downloads"))
-            .annotate(package_total_rating=Count("package__package_ratings"))
         )
 
     def serialize_results(
@@ -118,7 +116,7 @@ class PackageDetailApiView(APIView):
                 "dependencies": dependencies,
                 "dependency_string": latest.full_version_name,
                 "description": latest.description,
-                "download_count": listing.package_total_downloads,
+                "download_count": listing.package.total_downloads,
                 "download_url": latest.full_download_url,
                 "image_src": latest.icon.url if bool(latest.icon) else None,
                 "install_url": latest.install_url,
@@ -126,7 +124,7 @@ class PackageDetailApiView(APIView):
                 "markdown": latest.readme,
                 "namespace": listing.package.namespace.name,
                 "package_name": listing.package.name,
-                "rating_score": listing.package_total_rating,
+                "rating_score": listing.package.rating_score,
                 "team_name": listing.package.owner.name,
                 "versions": [
                     PackageVersionSerializer(
@@ -1,3 +1,5 @@
+from copy import copy
+
 from django.template import Library, Node, TemplateSyntaxError, VariableDoesNotExist
 
 from thunderstore.cache.cache import (
@@ -41,6 +43,9 @@ class CacheNode(Node):
                 )
 
         vary_on = [var.resolve(context) for var in self.vary_on]
+        # The context is in use by the rest of the template, so stale
+        # fragments are refreshed in the background with a copy of it.
+        refresh_context = copy(context)
 
         return cache_get_or_set(
             key=get_cache_key(
@@ -51,6 +56,8 @@ class CacheNode(Node):
             ),
             default=lambda: self.nodelist.render(context),
             expiry=expire_time,
+            cache_bust_condition=cache_until,
+            refresh=lambda: self.nodelist.render(refresh_context),
         )
 
 
@@ -1,9 +1,16 @@
+import hashlib
+import json
+from typing import Iterable, Optional
+
 import bleach
+import markdown_it
 from django import template
+from django.conf import settings
 from django.template.defaultfilters import stringfilter
-from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeString, mark_safe
 from markdown_it import MarkdownIt
 
+from thunderstore.cache.utils import get_cache
 from thunderstore.markdown.allowed_tags import (
     ALLOWED_ATTRIBUTES,
     ALLOWED_PROTOCOLS,
@@ -12,6 +19,24 @@ from thunderstore.markdown.allowed_tags import (
 
 register = template.Library()
 md = MarkdownIt("gfm-like")
+cache = get_cache("legacy")
+
+# Bump if the rendered output changes in a way not covered by the render
+# config below, so that previously cached renders are no longer used.
+RENDER_CACHE_VERSION = 1
+RENDER_CONFIG_VERSION = hashlib.sha256(
+    json.dumps(
+        [
+            RENDER_CACHE_VERSION,
+            ALLOWED_TAGS,
+            ALLOWED_ATTRIBUTES,
+            ALLOWED_PROTOCOLS,
+            bleach.__version__,
+            markdown_it.__version__,
+        ],
+        sort_keys=True,
+    ).encode()
+).hexdigest()[:16]
 
 
 def render_markdown(value: str):
@@ -27,7 +52,44 @@ def render_markdown(value: str):
     )
 
 
+def get_render_cache_key(value: str) -> str:
+    checksum = hashlib.sha256(value.encode()).hexdigest()
+    return f"cache.markdown.{RENDER_CONFIG_VERSION}.{checksum}"
+
+
+def render_markdown_cached(value: str) -> SafeString:
+    """
+    Render markdown through a cache keyed by the checksum of the source, so
+    the same document is only rendered once per render config.
+    """
+    if not value:
+        return render_markdown(value)
+
+    key = get_render_cache_key(value)
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered = render_markdown(value)
+        cache.set(key, str(rendered), settings.MARKDOWN_RENDER_CACHE_TTL_SECONDS)
+    return mark_safe(rendered)
+
+
+def precompute_rendered_markdown(values: Iterable[Optional[str]]) -> None:
+    """
+    Populate the render cache with the given documents ahead of their first
+    request, skipping the ones which are cached already.
+    """
+    keys = {get_render_cache_key(x): x for x in values if x}
+    cached = cache.get_many(keys.keys())
+    rendered = {
+        key: str(render_markdown(value))
+        for key, value in keys.items()
+        if key not in cached
+    }
+    if rendered:
+        cache.set_many(rendered, settings.MARKDOWN_RENDER_CACHE_TTL_SECONDS)
+
+
 @register.filter
 @stringfilter
 def markdownify(value):
-    return render_markdown(value)
+    return render_markdown_cached(value)
@@ -1,6 +1,14 @@
+from unittest.mock import patch
+
 import pytest
 
-from thunderstore.markdown.templatetags.markdownify import render_markdown
+from thunderstore.markdown.templatetags.markdownify import (
+    cache,
+    get_render_cache_key,
+    precompute_rendered_markdown,
+    render_markdown,
+    render_markdown_cached,
+)
 
 EDGE_CASE_MARKDOWN = "> QUOTE\n+ UNORDERED LIST ITEM\n  > INDENTED QUOTE\n\n\n"
 
@@ -32,3 +40,33 @@ def test_markdown_is_rendered_to_markup(markdown: str, expected: str) -> None:
     actual = render_markdown(markdown)
 
     assert actual == expected
+
+
+def test_render_markdown_cached_renders_once() -> None:
+    target = "thunderstore.markdown.templatetags.markdownify.render_markdown"
+    with patch(target, wraps=render_markdown) as mocked:
+        assert render_markdown_cached(EDGE_CASE_MARKDOWN) == EDGE_CASE_MARKUP
+        assert render_markdown_cached(EDGE_CASE_MARKDOWN) == EDGE_CASE_MARKUP
+    assert mocked.call_count == 1
+    assert cache.get(get_render_cache_key(EDGE_CASE_MARKDOWN)) == EDGE_CASE_MARKUP
+
+
+def test_render_markdown_cached_key_depends_on_render_config() -> None:
+    key = get_render_cache_key(EDGE_CASE_MARKDOWN)
+    assert key != get_render_cache_key("This is some text")
+    with patch(
+        "thunderstore.markdown.templatetags.markdownify.RENDER_CONFIG_VERSION",
+        "other",
+    ):
+        assert get_render_cache_key(EDGE_CASE_MARKDOWN) != key
+
+
+def test_precompute_rendered_markdown() -> None:
+    precompute_rendered_markdown((EDGE_CASE_MARKDOWN, None, ""))
+    assert cache.get(get_render_cache_key(EDGE_CASE_MARKDOWN)) == EDGE_CASE_MARKUP
+
+    target = "thunderstore.markdown.templatetags.markdownify.render_markdown"
+    with patch(target, wraps=render_markdown) as mocked:
+        precompute_rendered_markdown((EDGE_CASE_MARKDOWN, "This is some text"))
+        assert render_markdown_cached(EDGE_CASE_MARKDOWN) == EDGE_CASE_MARKUP
+    assert mocked.call_count == 1
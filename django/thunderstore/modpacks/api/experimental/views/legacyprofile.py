@@ -16,8 +16,8 @@ from rest_framework.views import APIView
 
 from thunderstore.core.utils import replace_cdn
 from thunderstore.modpacks.models import LegacyProfile
+from thunderstore.ts_analytics.buffer import queue_kafka_message
 from thunderstore.ts_analytics.kafka import KafkaTopic
-from thunderstore.ts_analytics.tasks import send_kafka_message
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ class LegacyProfileCreateApiView(APIView):
         key = LegacyProfile.objects.get_or_create_from_upload(content=file_obj)
 
         transaction.on_commit(
-            lambda: send_kafka_message.delay(
+            lambda: queue_kafka_message(
                 topic=KafkaTopic.A_LEGACY_PROFILE_EXPORT_V1,
                 payload_string=AnalyticsEventLegacyProfileExport(
                     id=str(key),
@@ -1,3 +1,4 @@
+from .cache import CacheRebuildSummaryAdmin
 from .discord_bot import DiscordUserBotPermissionAdmin
 from .namespace import NamespaceAdmin
 from .package import PackageAdmin
@@ -0,0 +1,26 @@
+from django.contrib import admin
+from django.http import HttpRequest
+
+from thunderstore.repository.models import CacheRebuildSummary
+
+
+@admin.register(CacheRebuildSummary)
+class CacheRebuildSummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "community",
+        "cache_type",
+        "status",
+        "started_at",
+        "duration_seconds",
+        "size_bytes",
+    )
+    list_select_related = ("community",)
+    list_filter = ("cache_type", "status", "community")
+    date_hierarchy = "started_at"
+
+    def has_add_permission(self, request: HttpRequest, obj=None) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj=None) -> bool:
+        return False
@@ -8,15 +8,15 @@ from django.utils.safestring import mark_safe
 from thunderstore.community.models import PackageListing
 from thunderstore.repository.consts import PackageVersionReviewStatus
 from thunderstore.repository.models import PackageVersion
-from thunderstore.repository.tasks.files import extract_package_version_file_tree
+from thunderstore.repository.tasks.files import process_package_version
 
 
 def extract_file_list(modeladmin, request, queryset: QuerySet):
     for entry in queryset:
-        extract_package_version_file_tree.delay(entry.pk)
+        process_package_version.delay(entry.pk, force=True)
 
 
-extract_file_list.short_description = "Queue file list extraction"
+extract_file_list.short_description = "Queue processing (e.g. file list extraction)"
 
 
 @transaction.atomic
@@ -51,7 +51,7 @@ class PackageVersionAdmin(admin.ModelAdmin):
         "package",
         "package__owner",
     )
-    list_filter = ("is_active", "date_created")
+    list_filter = ("is_active", "processing_status", "date_created")
     list_display = (
         "package",
         "version_number",
@@ -61,6 +61,7 @@ class PackageVersionAdmin(admin.ModelAdmin):
         "downloads",
         "date_created",
         "has_file_tree",
+        "processing_status",
     )
     search_fields = (
         "package__name",
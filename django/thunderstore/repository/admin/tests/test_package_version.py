@@ -51,12 +51,12 @@ def test_admin_package_version_extract_file_list(
     mocker,
 ):
     mocked_task = mocker.patch(
-        "thunderstore.repository.admin.package_version.extract_package_version_file_tree.delay"
+        "thunderstore.repository.admin.package_version.process_package_version.delay"
     )
 
     extract_file_list(None, None, PackageVersion.objects.all())
 
-    mocked_task.assert_called_once_with(package_version.pk)
+    mocked_task.assert_called_once_with(package_version.pk, force=True)
 
 
 @pytest.mark.django_db
@@ -1,2 +1,3 @@
+from .dependencies import *
 from .main import *
 from .markdown import *
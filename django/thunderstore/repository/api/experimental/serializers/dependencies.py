@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+# Limits the amount of closures resolved per request
+MAX_DEPENDENCY_RESOLUTION_ROOTS = 100
+
+
+class PackageDependenciesSerializer(serializers.Serializer):
+    package = serializers.CharField()
+    dependencies = serializers.ListField(child=serializers.CharField())
+
+
+class PackageDependencyResolutionParamsSerializer(serializers.Serializer):
+    packages = serializers.ListField(
+        child=serializers.CharField(),
+        allow_empty=False,
+        max_length=MAX_DEPENDENCY_RESOLUTION_ROOTS,
+    )
+
+
+class PackageDependencyResolutionResponseSerializer(serializers.Serializer):
+    results = PackageDependenciesSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.CharField())
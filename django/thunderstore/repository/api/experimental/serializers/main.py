@@ -96,10 +96,10 @@ class PackageSerializerExperimental(serializers.ModelSerializer):
         return make_full_url(self.context["request"], instance.get_absolute_url())
 
     def get_total_downloads(self, instance):
-        return -1
+        return instance.total_downloads
 
     def get_rating_score(self, instance):
-        return -1
+        return instance.rating_score
 
     class Meta:
         model = Package
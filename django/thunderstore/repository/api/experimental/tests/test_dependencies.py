@@ -0,0 +1,82 @@
+import pytest
+from rest_framework.test import APIClient
+
+from thunderstore.repository.factories import PackageVersionFactory
+from thunderstore.repository.models import PackageVersion
+
+
+@pytest.mark.django_db
+def test_api_experimental_package_version_dependencies(
+    api_client: APIClient,
+    package_version: PackageVersion,
+) -> None:
+    dependency, transitive = PackageVersionFactory.create_batch(2)
+    package_version.dependencies.set([dependency])
+    dependency.dependencies.set([transitive])
+
+    response = api_client.get(
+        f"/api/experimental/package/"
+        f"{package_version.package.owner.name}/"
+        f"{package_version.package.name}/"
+        f"{package_version.version_number}/"
+        "dependencies/"
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "package": package_version.full_version_name,
+        "dependencies": sorted(
+            [dependency.full_version_name, transitive.full_version_name]
+        ),
+    }
+
+
+@pytest.mark.django_db
+def test_api_experimental_package_dependency_resolution(
+    api_client: APIClient,
+) -> None:
+    a, b, c = PackageVersionFactory.create_batch(3)
+    a.dependencies.set([b])
+    b.dependencies.set([c])
+    missing = f"{a.package.owner.name}-{a.package.name}-9.9.9"
+
+    response = api_client.post(
+        "/api/experimental/package/dependencies/",
+        {"packages": [a.full_version_name, c.full_version_name, missing]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {
+                "package": a.full_version_name,
+                "dependencies": sorted([b.full_version_name, c.full_version_name]),
+            },
+            {"package": c.full_version_name, "dependencies": []},
+        ],
+        "not_found": [missing],
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "packages",
+    (
+        [],
+        ["invalid"],
+        ["Namespace-Name"],
+        [f"Namespace-Name-1.0.{x}" for x in range(101)],
+    ),
+)
+def test_api_experimental_package_dependency_resolution_invalid_input(
+    api_client: APIClient,
+    packages,
+) -> None:
+    response = api_client.post(
+        "/api/experimental/package/dependencies/",
+        {"packages": packages},
+        format="json",
+    )
+
+    assert response.status_code == 400
@@ -5,6 +5,7 @@ import requests
 from django.db import connection
 from django.db.models import F
 from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
 from rest_framework.test import APIClient
 
 from thunderstore.repository.api.experimental.views.package_index import (
@@ -12,7 +13,10 @@ from thunderstore.repository.api.experimental.views.package_index import (
     update_api_experimental_package_index,
 )
 from thunderstore.repository.factories import PackageVersionFactory
-from thunderstore.repository.models import PackageVersion
+from thunderstore.repository.models import (
+    APIExperimentalPackageIndexCache,
+    PackageVersion,
+)
 
 
 @pytest.mark.django_db
@@ -39,6 +43,31 @@ def test_api_experimental_package_index(api_client: APIClient):
         assert entry in results
 
 
+@pytest.mark.django_db
+def test_api_experimental_package_index_conditional_response(api_client: APIClient):
+    PackageVersionFactory()
+    update_api_experimental_package_index()
+    cache = APIExperimentalPackageIndexCache.get_latest()
+    assert cache.data_checksum_sha256
+
+    response = api_client.get("/api/experimental/package-index/")
+    assert response.status_code == 302
+    assert response["ETag"] == f'"{cache.data_checksum_sha256}"'
+    assert response["Last-Modified"] == http_date(int(cache.last_modified.timestamp()))
+
+    response = api_client.get(
+        "/api/experimental/package-index/",
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert response.status_code == 304
+
+    response = api_client.get(
+        "/api/experimental/package-index/",
+        HTTP_IF_NONE_MATCH='"outdated"',
+    )
+    assert response.status_code == 302
+
+
 @pytest.mark.django_db
 def test_update_api_experimental_package_index_query_count():
     [PackageVersionFactory() for _ in range(10)]
@@ -8,6 +8,10 @@ from thunderstore.repository.api.experimental.views import (
     PackageVersionReadmeApiView,
     UploadPackageApiView,
 )
+from thunderstore.repository.api.experimental.views.dependencies import (
+    PackageDependencyResolutionApiView,
+    PackageVersionDependenciesApiView,
+)
 from thunderstore.repository.api.experimental.views.package_index import (
     PackageIndexApiView,
 )
@@ -48,6 +52,11 @@ urls = [
     path("package-index/", PackageIndexApiView.as_view(), name="package-index"),
     path("package/", PackageListApiView.as_view(), name="package-list"),
     path("package/wikis/", PackageWikiListAPIView.as_view(), name="package-wiki-list"),
+    path(
+        "package/dependencies/",
+        PackageDependencyResolutionApiView.as_view(),
+        name="package-dependencies",
+    ),
     path(
         "package/<str:namespace>/<str:name>/",
         PackageDetailApiView.as_view(),
@@ -73,6 +82,11 @@ urls = [
         PackageVersionReadmeApiView.as_view(),
         name="package-version-readme",
     ),
+    path(
+        "package/<str:namespace>/<str:name>/<str:version>/dependencies/",
+        PackageVersionDependenciesApiView.as_view(),
+        name="package-version-dependencies",
+    ),
     path(
         "submission/submit/", SubmitPackageApiView.as_view(), name="submission.submit"
     ),
@@ -0,0 +1,133 @@
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, List
+
+from django.db.models import Q
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from thunderstore.repository.api.experimental.serializers import (
+    PackageDependenciesSerializer,
+    PackageDependencyResolutionParamsSerializer,
+    PackageDependencyResolutionResponseSerializer,
+)
+from thunderstore.repository.api.experimental.views.package_version import (
+    PackageVersionDetailMixin,
+)
+from thunderstore.repository.models import (
+    PackageVersion,
+    PackageVersionDependencyClosure,
+)
+from thunderstore.repository.package_reference import PackageReference
+from thunderstore.utils.batch import batch
+
+
+def get_dependency_closures(versions: Iterable[PackageVersion]) -> List[Dict]:
+    """
+    Return the full version names of the transitive dependencies of each of
+    the given versions.
+    """
+    versions = list(versions)
+    closures = PackageVersionDependencyClosure.resolve(x.pk for x in versions)
+
+    names = {}
+    dependency_ids = set().union(*closures.values())
+    for id_batch in batch(1000, dependency_ids):
+        entries = PackageVersion.objects.filter(pk__in=id_batch).values_list(
+            "pk",
+            "package__owner__name",
+            "package__name",
+            "version_number",
+        )
+        for pk, namespace, name, version_number in entries:
+            names[pk] = f"{namespace}-{name}-{version_number}"
+
+    return [
+        {
+            "package": version.full_version_name,
+            "dependencies": sorted(names[x] for x in closures[version.pk]),
+        }
+        for version in versions
+    ]
+
+
+class PackageVersionDependenciesApiView(PackageVersionDetailMixin):
+    """
+    Get the transitive dependencies of a package version
+    """
+
+    serializer_class = PackageDependenciesSerializer
+
+    @swagger_auto_schema(
+        operation_id="experimental_package_version_dependencies_read",
+        tags=["experimental"],
+    )
+    def get(self, *args, **kwargs):
+        return super().get(*args, **kwargs)
+
+    def get_queryset(self):
+        return PackageVersion.objects.active().select_related(
+            "package",
+            "package__owner",
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(get_dependency_closures([instance])[0])
+        return Response(serializer.data)
+
+
+class PackageDependencyResolutionApiView(APIView):
+    """
+    Get the transitive dependencies of multiple package versions at once
+    """
+
+    params_serializer_class = PackageDependencyResolutionParamsSerializer
+    response_serializer_class = PackageDependencyResolutionResponseSerializer
+
+    @swagger_auto_schema(
+        request_body=params_serializer_class(),
+        responses={200: response_serializer_class()},
+        operation_id="experimental.package.dependencies",
+        tags=["experimental"],
+    )
+    def post(self, request):
+        serializer = self.params_serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        references = self._parse_references(serializer.validated_data["packages"])
+        versions = {
+            x.full_version_name: x
+            for x in PackageVersion.objects.active()
+            .filter(reduce(or_, (Q(**x.get_filter_kwargs()) for x in references)))
+            .select_related("package", "package__owner")
+        }
+        found = [versions[str(x)] for x in references if str(x) in versions]
+
+        return Response(
+            self.response_serializer_class(
+                instance={
+                    "results": get_dependency_closures(found),
+                    "not_found": [str(x) for x in references if str(x) not in versions],
+                },
+                context={"request": request},
+            ).data
+        )
+
+    @staticmethod
+    def _parse_references(packages: List[str]) -> List[PackageReference]:
+        references = []
+        for package in packages:
+            try:
+                reference = PackageReference.parse(package)
+            except ValueError as e:
+                raise ValidationError({"packages": [str(e)]})
+            if not reference.version:
+                raise ValidationError(
+                    {"packages": [f"Package version is required: {package}"]}
+                )
+            if reference not in references:
+                references.append(reference)
+        return references
@@ -1,5 +1,4 @@
-from io import BytesIO
-from typing import List
+from typing import Iterator, List
 
 from django.conf import settings
 from django.db.models import F
@@ -11,6 +10,7 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 from sentry_sdk import capture_exception
 
+from thunderstore.core.utils import conditional_response
 from thunderstore.repository.models import (
     APIExperimentalPackageIndexCache,
     PackageVersion,
@@ -41,26 +41,22 @@ class PackageIndexEntry(serializers.Serializer):
         return [x.full_version_name for x in instance.dependencies.all()]
 
 
-def serialize_package_index() -> bytes:
+def iterate_package_index() -> Iterator[bytes]:
     versions: PackageVersionQuerySet = (
         PackageVersion.objects.active()
         .annotate(namespace=F("package__namespace"))
         .prefetch_related("dependencies", "dependencies__package")
     )
     renderer = JSONRenderer()
-    result = BytesIO()
 
     for entry in versions.chunked_enumerate():
-        result.write(renderer.render(PackageIndexEntry(instance=entry).data))
-        result.write(b"\n")
-
-    return result.getvalue()
+        yield renderer.render(PackageIndexEntry(instance=entry).data) + b"\n"
 
 
 def update_api_experimental_package_index() -> None:
     """Called periodically by a Celery background task"""
     try:
-        APIExperimentalPackageIndexCache.update(content=serialize_package_index())
+        APIExperimentalPackageIndexCache.update(content=iterate_package_index())
     except Exception as e:  # pragma: no cover
         capture_exception(e)
     APIExperimentalPackageIndexCache.drop_stale_cache()
@@ -91,4 +87,9 @@ class PackageIndexApiView(APIView):
         cache = APIExperimentalPackageIndexCache.get_latest()
         if not cache:
             raise ServiceUnavailable("Package index not yet built, try again later")
-        return redirect(self.request.build_absolute_uri(cache.data.url))
+        return conditional_response(
+            request,
+            lambda: redirect(request.build_absolute_uri(cache.data.url)),
+            etag=cache.data_checksum_sha256,
+            last_modified=cache.last_modified,
+        )
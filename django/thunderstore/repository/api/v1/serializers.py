@@ -1,5 +1,3 @@
-from distutils.version import StrictVersion
-
 from rest_framework.fields import Field
 from rest_framework.serializers import ModelSerializer, SerializerMethodField
 
@@ -75,7 +73,7 @@ class PackageListingSerializer(ModelSerializer):
     def get_versions(self, instance):
         versions = sorted(
             [v for v in instance.package.versions.all() if v.is_active],
-            key=lambda v: StrictVersion(v.version_number),
+            key=lambda v: v.version_key,
             reverse=True,
         )
         return PackageVersionSerializer(versions, many=True, context=self.context).data
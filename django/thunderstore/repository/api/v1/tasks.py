@@ -1,42 +1,190 @@
-from thunderstore.community.models import Community, CommunitySite
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from django.db.models import F, Sum
+from django.utils import timezone
+from redis.exceptions import LockError
+from redis.lock import Lock
+
+from thunderstore.cache.utils import get_cache
+from thunderstore.community.models import Community
 from thunderstore.core.utils import capture_exception
-from thunderstore.repository.api.v1.viewsets import serialize_package_list_for_community
-from thunderstore.repository.models import APIV1ChunkedPackageCache, APIV1PackageCache
+from thunderstore.repository.api.v1.viewsets import iterate_package_list_for_community
+from thunderstore.repository.consts import CacheRebuildStatus, CacheRebuildType
+from thunderstore.repository.models import (
+    APIV1ChunkedPackageCache,
+    APIV1PackageCache,
+    CacheRebuildSummary,
+)
 
+# Rebuild locks are extended for as long as the rebuild keeps running, so
+# the timeout only bounds how long a lock outlives a killed worker.
+CACHE_REBUILD_LOCK_TIMEOUT = 60 * 5
 
-def update_api_v1_caches() -> None:
-    update_api_v1_indexes()
+cache = get_cache("legacy")
 
 
-def update_api_v1_indexes() -> None:
-    for site in CommunitySite.objects.iterator():
-        try:
-            APIV1PackageCache.update_for_community(
-                community=site.community,
-                content=serialize_package_list_for_community(
-                    community=site.community,
-                ),
-            )
-        except Exception as e:  # pragma: no cover
-            capture_exception(e)
-    for community in Community.objects.filter(sites=None).iterator():
-        try:
-            APIV1PackageCache.update_for_community(
-                community=community,
-                content=serialize_package_list_for_community(
-                    community=community,
-                ),
-            )
-        except Exception as e:  # pragma: no cover
-            capture_exception(e)
-    APIV1PackageCache.drop_stale_cache()
+def get_community_ids_by_traffic() -> List[int]:
+    """
+    Return the ids of all communities, the ones with the most downloads
+    first, so that the caches seeing the most traffic are rebuilt first.
+    """
+    return list(
+        Community.objects.order_by(
+            F("aggregated_fields__download_count").desc(nulls_last=True),
+            "pk",
+        ).values_list("pk", flat=True)
+    )
 
 
-def update_api_v1_chunked_package_caches() -> None:
-    for community in Community.objects.iterator():
+@contextmanager
+def keep_lock_alive(lock: Lock, timeout: int) -> Iterator[None]:
+    """
+    Extend the lock from a background thread while the block is running, so
+    that a lock with a short timeout can be held for as long as needed but
+    expires soon after the holding process dies.
+    """
+    interval = timeout / 3
+    stop = threading.Event()
+
+    def extend():
+        while not stop.wait(interval):
+            try:
+                lock.extend(interval)
+            except LockError:  # pragma: no cover
+                # The lock was lost, there's nothing left to extend
+                return
+
+    thread = threading.Thread(target=extend, name="cache-rebuild-lock", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def rebuild_community_cache(
+    community_id: int,
+    cache_type: str,
+    rebuild: Callable[[Community], int],
+    lock_timeout: int = CACHE_REBUILD_LOCK_TIMEOUT,
+) -> Optional[CacheRebuildSummary]:
+    """
+    Rebuild a single cache of a community and record the outcome.
+
+    A per-community lock prevents overlapping rebuilds of the same cache,
+    e.g. if the previous scheduled update is still running. Such rebuilds
+    are skipped rather than queued behind the running one. The lock is kept
+    alive for the duration of the rebuild.
+
+    :param rebuild: Callable rebuilding the cache and returning its size in
+        bytes.
+    """
+    community = Community.objects.filter(pk=community_id).first()
+    if community is None:
+        return None
+
+    started_at = timezone.now()
+    start = time.monotonic()
+    size = None
+
+    lock = cache.lock(
+        f"lock.cacherebuild.{cache_type}.{community_id}",
+        timeout=lock_timeout,
+    )
+    if not lock.acquire(blocking=False):
+        status = CacheRebuildStatus.skipped
+    else:
         try:
-            APIV1ChunkedPackageCache.update_for_community(community)
+            with keep_lock_alive(lock, lock_timeout):
+                size = rebuild(community)
+            status = CacheRebuildStatus.completed
         except Exception as e:  # pragma: no cover
             capture_exception(e)
+            status = CacheRebuildStatus.failed
+        finally:
+            try:
+                lock.release()
+            except LockError:  # pragma: no cover
+                # The lock expired while the rebuild was running
+                pass
+
+    return CacheRebuildSummary.objects.create(
+        community=community,
+        cache_type=cache_type,
+        status=status,
+        started_at=started_at,
+        duration_seconds=time.monotonic() - start,
+        size_bytes=size,
+    )
 
+
+def _rebuild_api_v1_index(community: Community) -> int:
+    entry = APIV1PackageCache.update_for_community(
+        community=community,
+        content=iterate_package_list_for_community(community=community),
+    )
+    return entry.data.size
+
+
+def _rebuild_chunked_package_cache(community: Community) -> int:
+    entry = APIV1ChunkedPackageCache.update_for_community(
+        community,
+        incremental=True,
+    )
+    chunks_size = entry.chunks.entries.aggregate(size=Sum("blob__data_size"))["size"]
+    return entry.index.data_size + (chunks_size or 0)
+
+
+def update_api_v1_index_for_community(
+    community_id: int,
+) -> Optional[CacheRebuildSummary]:
+    return rebuild_community_cache(
+        community_id,
+        CacheRebuildType.api_v1_index,
+        _rebuild_api_v1_index,
+    )
+
+
+def update_chunked_package_cache_for_community(
+    community_id: int,
+) -> Optional[CacheRebuildSummary]:
+    return rebuild_community_cache(
+        community_id,
+        CacheRebuildType.chunked_package_list,
+        _rebuild_chunked_package_cache,
+    )
+
+
+def finalize_api_v1_index_update() -> None:
+    APIV1PackageCache.drop_stale_cache()
+    CacheRebuildSummary.drop_old()
+
+
+def finalize_chunked_package_cache_update() -> None:
     APIV1ChunkedPackageCache.drop_stale_cache()
+    CacheRebuildSummary.drop_old()
+
+
+def update_api_v1_caches() -> None:
+    update_api_v1_indexes()
+
+
+def update_api_v1_indexes() -> None:
+    """
+    Rebuild the package list caches of all communities serially in the
+    current process. Periodic updates are fanned out to a task per
+    community instead, see thunderstore.repository.tasks.caches.
+    """
+    for community_id in get_community_ids_by_traffic():
+        update_api_v1_index_for_community(community_id)
+    finalize_api_v1_index_update()
+
+
+def update_api_v1_chunked_package_caches() -> None:
+    for community_id in get_community_ids_by_traffic():
+        update_chunked_package_cache_for_community(community_id)
+    finalize_chunked_package_cache_update()
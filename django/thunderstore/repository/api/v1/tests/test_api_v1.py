@@ -55,7 +55,7 @@ def test_api_v1_package_list(
     assert response.status_code == 200
 
     # The response is gzipped
-    content = BytesIO(response.content)
+    content = BytesIO(b"".join(response.streaming_content))
     with gzip.GzipFile(fileobj=content, mode="r") as f:
         result = json.loads(f.read())
 
@@ -67,6 +67,7 @@ def test_api_v1_package_list(
     assert last_modified == http_date(int(cache.last_modified.timestamp()))
     assert response["Content-Type"] == cache.content_type
     assert response["Content-Encoding"] == cache.content_encoding
+    assert response["ETag"] == f'"{cache.data_checksum_sha256}"'
 
     # Should get a 304 since Last-Modified matches
     if old_urls:
@@ -115,6 +116,76 @@ def test_api_v1_package_list(
     )
 
 
+@pytest.mark.django_db
+def test_api_v1_package_list_etag(
+    api_client: APIClient,
+    community_site: CommunitySite,
+    active_package_listing: PackageListing,
+) -> None:
+    url = f"/c/{community_site.community.identifier}/api/v1/package/"
+    update_api_v1_caches()
+    response = api_client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    # Rebuilding the cache with unchanged content retains the ETag
+    time.sleep(1)
+    update_api_v1_caches()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH='"something-else"')
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_api_v1_package_list_delivery_mode_redirect(
+    api_client: APIClient,
+    community_site: CommunitySite,
+    active_package_listing: PackageListing,
+    settings: Any,
+) -> None:
+    settings.APIV1_PACKAGE_LIST_DELIVERY_MODE = "redirect"
+    update_api_v1_caches()
+    cache = APIV1PackageCache.get_latest_for_community(
+        community_identifier=community_site.community.identifier
+    )
+
+    response = api_client.get(
+        f"/c/{community_site.community.identifier}/api/v1/package/"
+    )
+    assert response.status_code == 302
+    assert response["Location"].endswith(cache.data.url)
+    assert response["ETag"] == f'"{cache.data_checksum_sha256}"'
+
+
+@pytest.mark.django_db
+def test_api_v1_package_list_delivery_mode_accel(
+    api_client: APIClient,
+    community_site: CommunitySite,
+    active_package_listing: PackageListing,
+    settings: Any,
+) -> None:
+    settings.APIV1_PACKAGE_LIST_DELIVERY_MODE = "accel"
+    settings.APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX = "/internal/"
+    update_api_v1_caches()
+    cache = APIV1PackageCache.get_latest_for_community(
+        community_identifier=community_site.community.identifier
+    )
+
+    response = api_client.get(
+        f"/c/{community_site.community.identifier}/api/v1/package/"
+    )
+    assert response.status_code == 200
+    assert response["X-Accel-Redirect"] == f"/internal/{cache.data.name}"
+    assert response["Content-Encoding"] == cache.content_encoding
+    assert response.content == b""
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize("old_urls", (False, True))
 def test_api_v1_package_detail(
@@ -231,7 +302,7 @@ def test_api_v1_package_listing_serializer_donation_link_omission(
     assert response.status_code == 200
 
     # The response is gzipped
-    content = BytesIO(response.content)
+    content = BytesIO(b"".join(response.streaming_content))
     with gzip.GzipFile(fileobj=content, mode="r") as f:
         result = json.loads(f.read())
 
@@ -288,3 +359,25 @@ def test_api_v1_community_package_listing_index_conditional_response(
     older_time = http_date(int(cache.created_at.timestamp()) - 100)
     response_older = api_client.get(url, HTTP_IF_MODIFIED_SINCE=older_time)
     assert response_older.status_code == 302
+
+
+@pytest.mark.django_db
+def test_api_v1_community_package_listing_index_etag(
+    api_client: APIClient,
+    community_site: CommunitySite,
+) -> None:
+    APIV1ChunkedPackageCache.update_for_community(community_site.community)
+    cache = APIV1ChunkedPackageCache.get_latest_for_community(community_site.community)
+
+    url = f"/c/{community_site.community.identifier}/api/v1/package-listing-index/"
+
+    response = api_client.get(url)
+    assert response.status_code == 302
+    assert response["ETag"] == f'"{cache.index.checksum_sha256}"'
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+    assert response["ETag"] == f'"{cache.index.checksum_sha256}"'
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH='"outdated"')
+    assert response.status_code == 302
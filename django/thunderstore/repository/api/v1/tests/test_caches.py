@@ -1,11 +1,14 @@
 import gzip
 import json
+import time
 from datetime import timedelta
 from random import shuffle
-from typing import Any
+from typing import Any, Callable
 
 import pytest
+from django.utils import timezone
 
+from thunderstore.cache.utils import get_cache
 from thunderstore.community.consts import PackageListingReviewStatus
 from thunderstore.community.factories import (
     CommunityFactory,
@@ -13,22 +16,39 @@ from thunderstore.community.factories import (
     PackageListingFactory,
     SiteFactory,
 )
-from thunderstore.community.models import Community, CommunitySite, PackageListing
+from thunderstore.community.models import (
+    Community,
+    CommunityAggregatedFields,
+    CommunitySite,
+    PackageListing,
+)
 from thunderstore.repository.api.v1.tasks import (
+    get_community_ids_by_traffic,
+    keep_lock_alive,
     update_api_v1_caches,
     update_api_v1_chunked_package_caches,
+    update_api_v1_index_for_community,
 )
 from thunderstore.repository.api.v1.viewsets import _get_prefetched_listing_queryset
+from thunderstore.repository.consts import CacheRebuildStatus, CacheRebuildType
 from thunderstore.repository.factories import (
     PackageRatingFactory,
     PackageVersionFactory,
 )
-from thunderstore.repository.models import APIV1ChunkedPackageCache, APIV1PackageCache
+from thunderstore.repository.models import (
+    APIV1ChunkedPackageCache,
+    APIV1PackageCache,
+    CacheRebuildSummary,
+)
 from thunderstore.repository.models.cache import (
     _get_sorted_active_versions,
     get_package_listing_chunk,
     get_package_listing_ids,
 )
+from thunderstore.repository.tasks.caches import (
+    update_api_caches,
+    update_chunked_community_package_caches,
+)
 
 
 @pytest.mark.django_db
@@ -246,11 +266,11 @@ def test_get_package_listing_chunk__rating_score_zero_when_no_ratings() -> None:
     result = get_package_listing_chunk([listing.id])
 
     assert len(result) == 1
-    assert result[0]._rating_score == 0
+    assert result[0].rating_score == 0
 
 
 @pytest.mark.django_db
-def test_get_package_listing_chunk__annotates_rating_score() -> None:
+def test_get_package_listing_chunk__includes_rating_score() -> None:
     listing = PackageListingFactory()
     PackageRatingFactory(package=listing.package)
     PackageRatingFactory(package=listing.package)
@@ -258,7 +278,7 @@ def test_get_package_listing_chunk__annotates_rating_score() -> None:
     result = get_package_listing_chunk([listing.id])
 
     assert len(result) == 1
-    assert result[0]._rating_score == 2
+    assert result[0].rating_score == 2
 
 
 @pytest.mark.django_db
@@ -339,3 +359,109 @@ def test_get_prefetched_listing_queryset__prefetches_versions_and_dependencies()
     assert len(ctx.captured_queries) == 0
     assert versions[0].is_active is True
     assert dependency_owner == dependency.package.owner.name
+
+
+@pytest.mark.django_db
+def test_get_community_ids_by_traffic() -> None:
+    quiet, busy, new = CommunityFactory(), CommunityFactory(), CommunityFactory()
+    CommunityAggregatedFields.create_missing()
+    CommunityAggregatedFields.objects.filter(pk=busy.aggregated_fields_id).update(
+        download_count=100,
+    )
+    CommunityAggregatedFields.objects.filter(pk=quiet.aggregated_fields_id).update(
+        download_count=10,
+    )
+    Community.objects.filter(pk=new.pk).update(aggregated_fields=None)
+
+    ids = get_community_ids_by_traffic()
+    assert ids[:2] == [busy.pk, quiet.pk]
+    assert ids[-1] == new.pk
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cache_type, update_fn",
+    (
+        (CacheRebuildType.api_v1_index, update_api_v1_caches),
+        (CacheRebuildType.chunked_package_list, update_api_v1_chunked_package_caches),
+    ),
+)
+def test_api_v1_cache_update__records_summary(
+    community: Community,
+    cache_type: str,
+    update_fn: Callable[[], None],
+) -> None:
+    PackageListingFactory(community_=community)
+    update_fn()
+
+    summary = CacheRebuildSummary.objects.get(community=community)
+    assert summary.cache_type == cache_type
+    assert summary.status == CacheRebuildStatus.completed
+    assert summary.duration_seconds >= 0
+    assert summary.size_bytes > 0
+
+
+@pytest.mark.django_db
+def test_api_v1_cache_update__skips_locked_community(community: Community) -> None:
+    lock = get_cache("legacy").lock(
+        f"lock.cacherebuild.{CacheRebuildType.api_v1_index}.{community.pk}",
+        timeout=60,
+    )
+    assert lock.acquire(blocking=False)
+    try:
+        summary = update_api_v1_index_for_community(community.pk)
+    finally:
+        lock.release()
+
+    assert summary.status == CacheRebuildStatus.skipped
+    assert summary.size_bytes is None
+    assert APIV1PackageCache.get_latest_for_community(community.identifier) is None
+
+
+def test_keep_lock_alive_extends_lock_while_running() -> None:
+    lock = get_cache("legacy").lock("lock.test.keepalive", timeout=1)
+    assert lock.acquire(blocking=False)
+    try:
+        with keep_lock_alive(lock, 1):
+            time.sleep(1.5)
+            # Would have expired without being extended
+            assert lock.owned()
+    finally:
+        lock.release()
+
+
+@pytest.mark.django_db
+def test_api_v1_cache_update__drops_old_summaries(community: Community) -> None:
+    old = CacheRebuildSummary.objects.create(
+        community=community,
+        cache_type=CacheRebuildType.api_v1_index,
+        status=CacheRebuildStatus.completed,
+        started_at=timezone.now() - CacheRebuildSummary.MAX_AGE,
+        duration_seconds=1.0,
+        size_bytes=1,
+    )
+    update_api_v1_caches()
+
+    assert not CacheRebuildSummary.objects.filter(pk=old.pk).exists()
+    assert CacheRebuildSummary.objects.filter(community=community).count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "task, cache_model",
+    (
+        (update_api_caches, APIV1PackageCache),
+        (update_chunked_community_package_caches, APIV1ChunkedPackageCache),
+    ),
+)
+def test_api_v1_cache_tasks__fan_out_per_community(
+    task: Any,
+    cache_model: Any,
+) -> None:
+    communities = [PackageListingFactory().community for _ in range(3)]
+
+    task.delay()
+
+    for community in communities:
+        assert cache_model.objects.filter(community=community).count() == 1
+        assert CacheRebuildSummary.objects.filter(community=community).count() == 1
@@ -14,9 +14,10 @@ def test_api_v1_package_metrics(
     active_package.latest.save()
 
     PackageRating.objects.get_or_create(rater=user, package=active_package)
+    active_package.refresh_from_db()
 
     assert active_package.rating_score == 1
-    assert active_package.downloads == 200
+    assert active_package.total_downloads == 200
 
     namespace = active_package.namespace.name
     name = active_package.name
@@ -37,8 +38,9 @@ def test_api_v1_package_version_metrics(
 ) -> None:
     active_package.latest.downloads = 200
     active_package.latest.save()
+    active_package.refresh_from_db()
 
-    assert active_package.downloads == 200
+    assert active_package.total_downloads == 200
 
     namespace = active_package.namespace.name
     name = active_package.name
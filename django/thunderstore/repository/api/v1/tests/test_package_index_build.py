@@ -1,3 +1,4 @@
+import json
 from io import BytesIO
 
 import pytest
@@ -8,6 +9,8 @@ from thunderstore.community.models import CommunitySite
 from thunderstore.repository.api.v1.viewsets import (
     PACKAGE_SERIALIZER,
     SERIALIZER_BATCH_SIZE,
+    _get_prefetched_listing_queryset,
+    iterate_package_list_for_community,
     serialize_package_list_for_community,
 )
 
@@ -21,3 +24,28 @@ def test_serialize_package_list_for_community(community_site: CommunitySite):
     buffer.seek(0)
     serializer = PACKAGE_SERIALIZER(data=JSONParser().parse(buffer), many=True)
     assert serializer.is_valid(raise_exception=True) is True
+
+
+@pytest.mark.django_db
+def test_iterate_package_list_for_community_skips_empty_batches(
+    community_site: CommunitySite,
+    mocker,
+):
+    PackageListingFactory(community=community_site.community)
+    PackageListingFactory(community=community_site.community)
+    mocker.patch("thunderstore.repository.api.v1.viewsets.SERIALIZER_BATCH_SIZE", 1)
+
+    # Simulate the first listing disappearing after the IDs were fetched
+    calls = []
+
+    def get_queryset(ids):
+        calls.append(ids)
+        return _get_prefetched_listing_queryset([] if len(calls) == 1 else ids)
+
+    mocker.patch(
+        "thunderstore.repository.api.v1.viewsets._get_prefetched_listing_queryset",
+        side_effect=get_queryset,
+    )
+    result = b"".join(iterate_package_list_for_community(community_site.community))
+    assert len(calls) == 2
+    assert len(json.loads(result)) == 1
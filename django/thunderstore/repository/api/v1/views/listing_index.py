@@ -1,13 +1,11 @@
 from django.shortcuts import get_object_or_404, redirect
-from django.utils.cache import get_conditional_response
-from django.utils.http import http_date
 from drf_yasg.utils import swagger_auto_schema  # type: ignore
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from thunderstore.community.models import Community
-from thunderstore.core.utils import replace_cdn
+from thunderstore.core.utils import conditional_response, replace_cdn
 from thunderstore.repository.models import APIV1ChunkedPackageCache
 
 
@@ -33,14 +31,15 @@ class PackageListingIndex(APIView):
         if not cache:
             return Response({"error": "No cache available"}, status=503)
 
-        last_modified = int(cache.created_at.timestamp())
-        response = get_conditional_response(request, last_modified=last_modified)
-
-        if response is None:
+        def get_response():
             url = request.build_absolute_uri(cache.index.data_url)
-            url = replace_cdn(url, request.query_params.get("cdn"))
-            response = redirect(url)
+            return redirect(replace_cdn(url, request.query_params.get("cdn")))
 
-        response["Last-Modified"] = http_date(last_modified)
+        response = conditional_response(
+            request,
+            get_response,
+            etag=cache.index.checksum_sha256,
+            last_modified=cache.created_at,
+        )
         response["Cache-Control"] = "public, max-age=0, s-maxage=300"
         return response
@@ -9,7 +9,7 @@ from thunderstore.repository.models import Package, PackageVersion
 
 
 class PackageMetricsSerializer(serializers.Serializer):
-    downloads = serializers.IntegerField()
+    downloads = serializers.IntegerField(source="total_downloads")
     rating_score = serializers.IntegerField()
     latest_version = serializers.CharField(source="version_number")
 
@@ -1,11 +1,11 @@
 import json
-from io import BytesIO
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
-from django.db.models import Count, Prefetch, QuerySet
-from django.http import HttpResponse
-from django.utils.cache import get_conditional_response
-from django.utils.http import http_date
+from django.conf import settings
+from django.db.models import Prefetch, QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.shortcuts import redirect
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
@@ -17,7 +17,9 @@ from rest_framework.response import Response
 
 from thunderstore.api.cyberstorm.services.package import rate_package
 from thunderstore.community.models import Community, PackageListing
+from thunderstore.core.storage import iterate_file_chunks
 from thunderstore.core.types import HttpRequestType
+from thunderstore.core.utils import ChoiceEnum, conditional_response, replace_cdn
 from thunderstore.repository.api.v1.serializers import PackageListingSerializer
 from thunderstore.repository.cache import (
     get_package_listing_queryset,
@@ -32,6 +34,12 @@ PACKAGE_SERIALIZER = PackageListingSerializer
 SERIALIZER_BATCH_SIZE = 200
 
 
+class PackageListDeliveryMode(ChoiceEnum):
+    stream = "stream"
+    redirect = "redirect"
+    accel = "accel"
+
+
 def _get_prefetched_listing_queryset(
     ids: Iterable[int],
 ) -> QuerySet[PackageListing]:
@@ -53,20 +61,23 @@ def _get_prefetched_listing_queryset(
             "community__sites__site",
             versions_prefetch,
         )
-        .annotate(_rating_score=Count("package__package_ratings"))
     )
 
 
-def serialize_package_list_for_community(community: Community) -> bytes:
+def iterate_package_list_for_community(community: Community) -> Iterator[bytes]:
+    """
+    Serialize the community's package list in batches, yielding the JSON
+    document piece by piece so it can be streamed into the cache file.
+    """
     listing_ids = get_package_listing_queryset(
         community_identifier=community.identifier
     ).values_list("id", flat=True)
     batch_size = SERIALIZER_BATCH_SIZE
     renderer = JSONRenderer()
-    result = BytesIO()
+    is_first = True
 
-    result.write(b"[")
-    for index, ids in enumerate(batch(batch_size, listing_ids)):
+    yield b"["
+    for ids in batch(batch_size, listing_ids):
         queryset = _get_prefetched_listing_queryset(ids)
         serializer = PACKAGE_SERIALIZER(
             queryset,
@@ -75,23 +86,32 @@ def serialize_package_list_for_community(community: Community) -> bytes:
                 "community": community,
             },
         )
+        rendered = renderer.render(serializer.data)
 
-        if index != 0:
-            result.write(b",")
+        # Include a sanity check since we're manually piecing together json which
+        # could lead to format bugs. Better to fail entirely than return broken json
+        # as it would be bad to overwrite the cached working version with a broken
+        # one. The batches themselves are produced by the JSON renderer, so it's
+        # enough to validate the parts we're responsible for joining together.
+        if rendered[:1] != b"[" or rendered[-1:] != b"]":
+            raise ValueError("Serialized package list batch is not a JSON array")
 
         # Skip the first and last byte as those are [ and ]
-        result.write(renderer.render(serializer.data)[1:-1])
+        content = rendered[1:-1]
+        if not content:
+            # Listings may have disappeared after the IDs were fetched, in
+            # which case the batch is empty and must not add a separator.
+            continue
+        if not is_first:
+            yield b","
+        yield content
+        is_first = False
 
-    result.write(b"]")
+    yield b"]"
 
-    # Include a sanity check since we're manually piecing together json which
-    # could lead to format bugs. Better to fail entirely than return broken json
-    # as it would be bad to overwrite the cached working version with a broken
-    # one.
-    result.seek(0)
-    json.load(result)
 
-    return result.getvalue()
+def serialize_package_list_for_community(community: Community) -> bytes:
+    return b"".join(iterate_package_list_for_community(community))
 
 
 class PackageViewSet(
@@ -123,21 +143,37 @@ class PackageViewSet(
         )
         if not cache or not cache.data:
             return self.get_no_cache_response()
-        last_modified = int(cache.last_modified.timestamp())
-
-        # TODO: Add ETag support if useful
-        # Check if we can return a 304 response, otherwise return full content
-        response = get_conditional_response(request, last_modified=last_modified)
-        if response is None:
-            # TODO: Stream directly from the S3 backend instead of buffering
-            # TODO: Should we support decompressing for non-gzip capable clients?
-            response = HttpResponse(
-                content=cache.data,
+        # TODO: Should we support decompressing for non-gzip capable clients?
+        return conditional_response(
+            request,
+            lambda: self.get_cache_file_response(request, cache),
+            etag=cache.data_checksum_sha256,
+            last_modified=cache.last_modified,
+        )
+
+    @staticmethod
+    def get_cache_file_response(
+        request: HttpRequestType,
+        cache: APIV1PackageCache,
+    ) -> HttpResponseBase:
+        mode = settings.APIV1_PACKAGE_LIST_DELIVERY_MODE
+        if mode == PackageListDeliveryMode.redirect:
+            url = request.build_absolute_uri(cache.data.url)
+            return redirect(replace_cdn(url, request.GET.get("cdn")))
+
+        if mode == PackageListDeliveryMode.accel:
+            prefix = settings.APIV1_PACKAGE_LIST_ACCEL_REDIRECT_PREFIX
+            response = HttpResponse(content_type=cache.content_type)
+            response["X-Accel-Redirect"] = f"{prefix}{cache.data.name}"
+        else:
+            response = StreamingHttpResponse(
+                iterate_file_chunks(
+                    cache.data,
+                    settings.APIV1_PACKAGE_LIST_STREAM_CHUNK_SIZE,
+                ),
                 content_type=cache.content_type,
             )
-            response["Last-Modified"] = http_date(last_modified)
-            response["Content-Encoding"] = cache.content_encoding
-
+        response["Content-Encoding"] = cache.content_encoding
         return response
 
     @swagger_auto_schema(deprecated=True, tags=["v1"])
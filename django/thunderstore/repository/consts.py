@@ -15,3 +15,21 @@ class PackageVersionReviewStatus(ChoiceEnum):
     unreviewed = "unreviewed"
     approved = "approved"
     rejected = "rejected"
+
+
+class PackageVersionProcessingStatus(ChoiceEnum):
+    pending = "pending"
+    processing = "processing"
+    complete = "complete"
+    failed = "failed"
+
+
+class CacheRebuildType(ChoiceEnum):
+    api_v1_index = "api_v1_index"
+    chunked_package_list = "chunked_package_list"
+
+
+class CacheRebuildStatus(ChoiceEnum):
+    completed = "completed"
+    failed = "failed"
+    skipped = "skipped"
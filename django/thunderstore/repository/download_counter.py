@@ -0,0 +1,206 @@
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Case,
+    F,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
+    Value,
+    When,
+)
+from pydantic import BaseModel
+from redis import Redis
+
+from thunderstore.cache.utils import get_cache
+from thunderstore.utils.batch import batch
+
+PENDING_BUCKETS_KEY = "downloads.counter.buckets"
+UPDATE_BATCH_SIZE = 1000
+
+# Seconds to keep the records of applied buckets around for. Buckets are
+# normally flushed within minutes of closing, so this only needs to outlast
+# an outage of the flush task.
+APPLIED_BUCKET_RETENTION_SECONDS = 60 * 60 * 24 * 7
+
+
+class AnalyticsEventPackageDownload(BaseModel):
+    id: int
+    version_id: int
+    timestamp: datetime
+
+
+def generate_download_event_id() -> int:
+    return (int(time.time() * 1000) << 20) | random.getrandbits(20)
+
+
+def _get_redis() -> Redis:
+    return get_cache("downloads").client.get_client(write=True)
+
+
+def get_current_bucket(now: Optional[float] = None) -> int:
+    now = time.time() if now is None else now
+    return int(now // settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS)
+
+
+def get_bucket_timestamp(bucket: int) -> datetime:
+    return datetime.fromtimestamp(
+        bucket * settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS,
+        tz=timezone.utc,
+    )
+
+
+def get_pending_key(bucket: int) -> str:
+    return f"downloads.counter.pending.{bucket}"
+
+
+def get_processing_key(bucket: int) -> str:
+    return f"downloads.counter.processing.{bucket}"
+
+
+def record_download(version_id: int) -> None:
+    """
+    Add a download to the currently open time bucket. The bucket is applied
+    to the database by flush_download_counters once it has been closed.
+    """
+    bucket = get_current_bucket()
+    pipe = _get_redis().pipeline(transaction=False)
+    pipe.hincrby(get_pending_key(bucket), str(version_id), 1)
+    pipe.sadd(PENDING_BUCKETS_KEY, bucket)
+    pipe.execute()
+
+
+def _claim_bucket(redis: Redis, bucket: int) -> Dict[int, int]:
+    """
+    Hand a closed bucket over from the writers to the flusher by renaming
+    it. The processing key is only deleted after the counts have been
+    committed to the database, so a crashed flush is picked up by the next
+    run instead of losing the downloads.
+    """
+    pending_key = get_pending_key(bucket)
+    processing_key = get_processing_key(bucket)
+    if redis.exists(pending_key):
+        if redis.exists(processing_key):
+            # A previous flush of this bucket crashed after more downloads
+            # had been recorded into it (e.g. due to clock skew between
+            # web workers), merge the late arrivals into the claimed bucket.
+            _move_counts(redis, pending_key, processing_key)
+        else:
+            redis.rename(pending_key, processing_key)
+    return {
+        int(version_id): int(count)
+        for version_id, count in redis.hgetall(processing_key).items()
+    }
+
+
+def _move_counts(redis: Redis, source_key: str, target_key: str) -> None:
+    for version_id, count in redis.hgetall(source_key).items():
+        redis.hincrby(target_key, version_id, int(count))
+    redis.delete(source_key)
+
+
+def _requeue_late_downloads(redis: Redis, bucket: int, current: int) -> None:
+    """
+    Move downloads recorded into an already applied bucket over to the open
+    bucket, as the applied bucket won't be applied again.
+    """
+    pending_key = get_pending_key(bucket)
+    if redis.exists(pending_key):
+        _move_counts(redis, pending_key, get_pending_key(current))
+        redis.sadd(PENDING_BUCKETS_KEY, current)
+
+
+def _apply_counts(counts: Dict[int, int]) -> None:
+    from thunderstore.community.models import PackageListing
+    from thunderstore.repository.models import Package, PackageVersion
+
+    for version_ids in batch(UPDATE_BATCH_SIZE, sorted(counts.keys())):
+        PackageVersion.objects.filter(id__in=version_ids).update(
+            downloads=F("downloads")
+            + Case(
+                *[When(id=x, then=Value(counts[x])) for x in version_ids],
+                default=Value(0),
+                output_field=PositiveIntegerField(),
+            ),
+        )
+
+        package_counts: Dict[int, int] = defaultdict(int)
+        versions = PackageVersion.objects.filter(id__in=version_ids).values_list(
+            "id", "package_id"
+        )
+        for version_id, package_id in versions:
+            package_counts[package_id] += counts[version_id]
+        package_ids = sorted(package_counts.keys())
+
+        Package.objects.filter(id__in=package_ids).update(
+            total_downloads=F("total_downloads")
+            + Case(
+                *[When(id=x, then=Value(package_counts[x])) for x in package_ids],
+                default=Value(0),
+                output_field=PositiveBigIntegerField(),
+            ),
+        )
+        PackageListing.objects.filter(package_id__in=package_ids).update_sort_keys()
+
+
+def _send_analytics_events(bucket: int, counts: Dict[int, int]) -> None:
+    from thunderstore.ts_analytics.kafka import KafkaTopic, get_kafka_client
+
+    timestamp = get_bucket_timestamp(bucket)
+    get_kafka_client().send_batch(
+        (
+            KafkaTopic.A_PACKAGE_DOWNLOAD_V1,
+            AnalyticsEventPackageDownload(
+                id=generate_download_event_id(),
+                version_id=version_id,
+                timestamp=timestamp,
+            ).json(),
+            None,
+        )
+        for version_id, count in counts.items()
+        for _ in range(count)
+    )
+
+
+def flush_download_counters() -> List[int]:
+    """
+    Apply all closed download buckets to PackageVersion.downloads and the
+    package download counters.
+
+    :return: The flushed buckets
+    """
+    from thunderstore.repository.models import DownloadCounterBucket
+
+    redis = _get_redis()
+    current = get_current_bucket()
+    buckets = sorted(
+        int(x) for x in redis.smembers(PENDING_BUCKETS_KEY) if int(x) < current
+    )
+
+    for bucket in buckets:
+        # A bucket which has already been applied was claimed by a flush
+        # which crashed before releasing it. Its analytics events are sent
+        # again, as there's no telling whether they were sent before.
+        is_applied = DownloadCounterBucket.objects.filter(bucket=bucket).exists()
+        if is_applied:
+            _requeue_late_downloads(redis, bucket, current)
+
+        counts = _claim_bucket(redis, bucket)
+        if counts and not is_applied:
+            with transaction.atomic():
+                DownloadCounterBucket.objects.create(bucket=bucket)
+                _apply_counts(counts)
+        if counts:
+            _send_analytics_events(bucket, counts)
+        redis.delete(get_processing_key(bucket))
+        redis.srem(PENDING_BUCKETS_KEY, bucket)
+
+    expired = get_current_bucket(time.time() - APPLIED_BUCKET_RETENTION_SECONDS)
+    DownloadCounterBucket.objects.filter(bucket__lt=expired).delete()
+
+    return buckets
@@ -1,22 +1,94 @@
 import logging
-from typing import IO, Any
-from zipfile import ZipFile
+from functools import partial
+from typing import IO, Any, Dict, List, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
 
+from thunderstore.cache.utils import get_cache
+from thunderstore.repository.validation.zip import ZipEntry, inspect_zip
 from thunderstore.storage.models import DataBlobGroup
+from thunderstore.storage.models.blob import BlobSource
 
 logger = logging.getLogger(__name__)
 
+# Seconds to keep the checksums computed by the upload validation around
+# for the file tree extraction of the uploaded version
+FILE_CHECKSUMS_TTL = 60 * 60 * 24
+
+cache = get_cache("default")
+
+
+def get_file_checksums_cache_key(package_version_id: int) -> str:
+    return f"repository.filetree.checksums.{package_version_id}"
+
+
+def store_file_checksums(package_version_id: int, entries: List[ZipEntry]) -> None:
+    """
+    Store the checksums of the entries of an uploaded package zip, so that
+    its file tree can be created without decompressing the zip again.
+    """
+    cache.set(
+        get_file_checksums_cache_key(package_version_id),
+        {entry.info.filename: entry.checksum_sha256 for entry in entries},
+        timeout=FILE_CHECKSUMS_TTL,
+    )
+
+
+def get_file_checksums(package_version_id: int) -> Optional[Dict[str, str]]:
+    return cache.get(get_file_checksums_cache_key(package_version_id))
+
+
+def clear_file_checksums(package_version_id: int) -> None:
+    cache.delete(get_file_checksums_cache_key(package_version_id))
+
+
+def get_zip_entries(
+    unzip: ZipFile,
+    checksums: Optional[Dict[str, str]] = None,
+) -> List[ZipEntry]:
+    """
+    Return the file entries of the zip along with their checksums. Known
+    checksums are used as is, otherwise every entry is decompressed to
+    compute them.
+    """
+    infolist = [x for x in unzip.infolist() if not x.is_dir()]
+    if checksums is not None and all(x.filename in checksums for x in infolist):
+        return [ZipEntry(x, checksums[x.filename]) for x in infolist]
+
+    inspection = inspect_zip(unzip)
+    if inspection.corrupted_file:
+        raise BadZipFile(f"Bad CRC-32 for file {inspection.corrupted_file}")
+    return inspection.entries
+
 
 def create_file_tree_from_zip_data(
     name: str,
     zip_data: IO[Any],
+    checksums: Optional[Dict[str, str]] = None,
 ) -> DataBlobGroup:
+    """
+    Store the files of a zip archive as a DataBlobGroup.
+
+    The checksums of the entries are either given, e.g. as computed by the
+    upload validation, or computed in a single pass over the zip. The group
+    is then populated in bulk, and only entries whose content isn't stored
+    yet are decompressed again for uploading.
+    """
     with ZipFile(zip_data) as unzip:
+        zip_entries = get_zip_entries(unzip, checksums)
+
         group: DataBlobGroup = DataBlobGroup.objects.create(name=name)
-        for entry in unzip.infolist():
-            logger.info(f"Processing {entry.filename}")
-            if entry.is_dir():
-                continue
-            group.add_entry(unzip.read(entry), entry.filename)
+        entries: List[Tuple[str, BlobSource]] = [
+            (
+                entry.info.filename,
+                BlobSource(
+                    checksum_sha256=entry.checksum_sha256,
+                    data_size=entry.info.file_size,
+                    open=partial(unzip.open, entry.info),
+                ),
+            )
+            for entry in zip_entries
+        ]
+        logger.info(f"Processing {len(entries)} files for {name}")
+        group.add_entries(entries)
         group.set_complete()
     return group
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from thunderstore.community.models import PackageListing
+from thunderstore.repository.models import Package
+from thunderstore.utils.batch import batch
+
+
+class Command(BaseCommand):
+    help = "Recomputes the denormalized package download and rating counters"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **kwargs):
+        package_ids = (
+            Package.objects.order_by("pk").values_list("pk", flat=True).iterator()
+        )
+        updated = 0
+        for ids in batch(kwargs["batch_size"], package_ids):
+            with transaction.atomic():
+                updated += Package.objects.filter(pk__in=ids).update_counters()
+                PackageListing.objects.filter(package_id__in=ids).update_sort_keys()
+            self.stdout.write(f"Reconciled {updated} packages")
+
+        self.stdout.write("All done!")
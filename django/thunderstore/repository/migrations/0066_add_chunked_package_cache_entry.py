@@ -0,0 +1,40 @@
+# Generated by Django 3.1.7 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0038_auto_20260430_0111"),
+        ("repository", "0065_delete_packageversiondownloadevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="APIV1ChunkedPackageCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("change_marker", models.CharField(max_length=64)),
+                ("content", models.BinaryField()),
+                ("datetime_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "listing",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="community.packagelisting",
+                    ),
+                ),
+            ],
+        ),
+    ]
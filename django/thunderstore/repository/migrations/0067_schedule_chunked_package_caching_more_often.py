@@ -0,0 +1,40 @@
+# Generated by Django 3.1.7 on 2026-10-17 09:14
+
+import pytz
+from django.db import migrations
+
+TASK = "thunderstore.repository.tasks.update_chunked_package_caches"
+
+
+def set_schedule(apps, minute: str) -> None:
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = CrontabSchedule.objects.get_or_create(
+        minute=minute,
+        hour="*",
+        day_of_week="*",
+        day_of_month="*",
+        month_of_year="*",
+        timezone=pytz.timezone("UTC"),
+    )
+    PeriodicTask.objects.filter(task=TASK).update(crontab=schedule)
+
+
+def forwards(apps, schema_editor):
+    set_schedule(apps, "*/5")
+
+
+def backwards(apps, schema_editor):
+    set_schedule(apps, "0")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("repository", "0066_add_chunked_package_cache_entry"),
+        ("django_celery_beat", "0014_remove_clockedschedule_enabled"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
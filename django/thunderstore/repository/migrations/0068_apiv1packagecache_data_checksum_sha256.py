@@ -0,0 +1,18 @@
+# Generated by Django 3.1.7 on 2026-10-17 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0067_schedule_chunked_package_caching_more_often"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apiv1packagecache",
+            name="data_checksum_sha256",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 3.1.7 on 2026-10-17 13:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+BACKFILL_SEARCH_VECTORS = """
+UPDATE repository_package AS p SET search_vector = (
+    setweight(to_tsvector('simple', p.name), 'A')
+    || setweight(to_tsvector('simple', COALESCE(
+        (SELECT t.name FROM repository_team AS t WHERE t.id = p.owner_id), ''
+    )), 'B')
+    || setweight(to_tsvector('simple', COALESCE(
+        (SELECT v.description FROM repository_packageversion AS v
+         WHERE v.id = p.latest_id), ''
+    )), 'C')
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0069_add_download_counter_flush_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="package",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text search document, maintained by update_search_vector",
+                null=True,
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_VECTORS, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="package",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="package_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="package",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="package_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
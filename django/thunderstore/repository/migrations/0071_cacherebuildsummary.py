@@ -0,0 +1,71 @@
+# Generated by Django 3.1.7 on 2026-10-17 15:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0039_packagelisting_sort_keys"),
+        ("repository", "0070_add_package_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheRebuildSummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "cache_type",
+                    models.CharField(
+                        choices=[
+                            ("api_v1_index", "api_v1_index"),
+                            ("chunked_package_list", "chunked_package_list"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("completed", "completed"),
+                            ("failed", "failed"),
+                            ("skipped", "skipped"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("duration_seconds", models.FloatField()),
+                ("size_bytes", models.BigIntegerField(blank=True, null=True)),
+                (
+                    "community",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="community.community",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "started_at",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="cacherebuildsummary",
+            index=models.Index(
+                fields=["community", "cache_type", "-started_at"],
+                name="cache_rebuild_summary_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.1.7 on 2026-10-17 16:55
+
+from django.db import migrations, models
+
+
+def mark_processed_versions(apps, schema_editor):
+    PackageVersion = apps.get_model("repository", "PackageVersion")
+    PackageVersion.objects.filter(file_tree__is_complete=True).update(
+        processing_status="complete",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0071_cacherebuildsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="packageversion",
+            name="processing_status",
+            field=models.TextField(
+                choices=[
+                    ("pending", "pending"),
+                    ("processing", "processing"),
+                    ("complete", "complete"),
+                    ("failed", "failed"),
+                ],
+                default="pending",
+            ),
+        ),
+        migrations.RunPython(mark_processed_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 3.1.7 on 2026-10-17 18:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0073_schedule_disk_space_reconciliation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PackageDependant",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dependant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependency_index",
+                        to="repository.package",
+                    ),
+                ),
+                (
+                    "package",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependant_index",
+                        to="repository.package",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="packagedependant",
+            index=models.Index(
+                fields=["dependant", "package"],
+                name="package_dependant_reverse_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="packagedependant",
+            constraint=models.UniqueConstraint(
+                fields=("package", "dependant"),
+                name="unique_package_dependant",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO repository_packagedependant (package_id, dependant_id)
+                SELECT DISTINCT pv.package_id, p.id
+                FROM repository_package p
+                JOIN repository_packageversion_dependencies d
+                    ON d.from_packageversion_id = p.latest_id
+                JOIN repository_packageversion pv
+                    ON pv.id = d.to_packageversion_id
+                ON CONFLICT DO NOTHING;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
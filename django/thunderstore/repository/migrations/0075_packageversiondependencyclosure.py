@@ -0,0 +1,51 @@
+# Generated by Django 3.1.7 on 2026-10-17 18:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0074_packagedependant"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PackageVersionDependencyClosure",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dependency",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="repository.packageversion",
+                    ),
+                ),
+                (
+                    "root",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependency_closure",
+                        to="repository.packageversion",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="packageversiondependencyclosure",
+            constraint=models.UniqueConstraint(
+                fields=("root", "dependency"),
+                name="unique_dependency_closure_entry",
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 3.1.7 on 2026-10-17 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0075_packageversiondependencyclosure"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="packageversion",
+            name="version_major",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packageversion",
+            name="version_minor",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="packageversion",
+            name="version_patch",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE repository_packageversion
+                SET
+                    version_major = split_part(version_number, '.', 1)::bigint,
+                    version_minor = split_part(version_number, '.', 2)::bigint,
+                    version_patch = split_part(version_number, '.', 3)::bigint
+                WHERE version_number ~ '^[0-9]+\\.[0-9]+\\.[0-9]+$';
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="packageversion",
+            index=models.Index(
+                fields=["package", "version_major", "version_minor", "version_patch"],
+                name="package_version_sort_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.1.7 on 2026-10-17 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0076_packageversion_version_components"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="package",
+            name="total_downloads",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="rating_score",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE repository_package p
+                SET
+                    total_downloads = COALESCE(
+                        (
+                            SELECT SUM(v.downloads)
+                            FROM repository_packageversion v
+                            WHERE v.package_id = p.id
+                        ),
+                        0
+                    ),
+                    rating_score = (
+                        SELECT COUNT(*)
+                        FROM repository_packagerating r
+                        WHERE r.package_id = p.id
+                    );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
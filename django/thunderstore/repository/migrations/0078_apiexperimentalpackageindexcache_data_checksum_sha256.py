@@ -0,0 +1,18 @@
+# Generated by Django 3.1.7 on 2026-10-17 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0077_package_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apiexperimentalpackageindexcache",
+            name="data_checksum_sha256",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.1.7 on 2026-10-17 20:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0078_apiexperimentalpackageindexcache_data_checksum_sha256"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DownloadCounterBucket",
+            fields=[
+                ("bucket", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("datetime_applied", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
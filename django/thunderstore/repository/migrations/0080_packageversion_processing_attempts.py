@@ -0,0 +1,18 @@
+# Generated by Django 3.1.7 on 2026-10-17 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repository", "0079_downloadcounterbucket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="packageversion",
+            name="processing_attempts",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from .cache import *
+from .dependant import *
+from .dependency_closure import *
 from .discord_bot import *
+from .download_counter import *
 from .namespace import *
 from .package import *
 from .package_installer import *
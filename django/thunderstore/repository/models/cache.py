@@ -1,14 +1,14 @@
 import gzip
-import io
 import json
 from datetime import timedelta
-from distutils.version import StrictVersion
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional
-
-from django.core.files.base import ContentFile
-from django.db import models
-from django.db.models import Count, OuterRef, Prefetch, Subquery, Value
-from django.db.models.functions import Coalesce, Concat, Lower
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.core.files.base import File
+from django.db import models, transaction
+from django.db.models import CharField, Count, OuterRef, Prefetch, Subquery, Sum, Value
+from django.db.models.functions import Cast, Concat, Lower
 from django.utils import timezone
 
 from thunderstore.community.models import Community, PackageListing
@@ -17,37 +17,59 @@ from thunderstore.repository.cache import (
     get_package_listing_base_queryset,
     order_package_listing_queryset,
 )
+from thunderstore.repository.consts import CacheRebuildStatus, CacheRebuildType
 from thunderstore.storage.models import DataBlob, DataBlobGroup
 from thunderstore.utils.batch import batch
+from thunderstore.utils.gzip import SpooledGzipWriter
 
 if TYPE_CHECKING:
     from thunderstore.repository.models import Package, PackageVersion
 
 
+def _write_gzipped_file(
+    writer: SpooledGzipWriter,
+    content: Union[bytes, Iterable[bytes]],
+    name: str,
+) -> File:
+    """
+    Compress content into the writer's spooled file and wrap it for storing
+    in a FileField. The storage backend streams the file from the spool,
+    using a multipart upload for large files.
+    """
+    if isinstance(content, bytes):
+        content = (content,)
+    for chunk in content:
+        writer.write(chunk)
+    return File(writer.finish(), name=name)
+
+
 class APIExperimentalPackageIndexCache(S3FileMixin):
+    # Checksum of the uncompressed content, used as the ETag of the file.
+    data_checksum_sha256 = models.CharField(max_length=64, blank=True, null=True)
+
     @classmethod
     def get_latest(cls) -> Optional["APIExperimentalPackageIndexCache"]:
         return cls.objects.active().order_by("-last_modified").first()
 
     @classmethod
-    def update(cls, content: bytes) -> "APIExperimentalPackageIndexCache":
-        gzipped = io.BytesIO()
-        with gzip.GzipFile(fileobj=gzipped, mode="wb") as f:
-            f.write(content)
+    def update(
+        cls,
+        content: Union[bytes, Iterable[bytes]],
+    ) -> "APIExperimentalPackageIndexCache":
         timestamp = timezone.now()
-        file = ContentFile(
-            # TODO: This is immediately passed to BytesIO again, meaning
-            #       we're just wasting memory. Find a way to pass this to
-            #       the Django model without the inefficiency.
-            gzipped.getvalue(),
-            name=f"full-index-{timestamp.isoformat()}.json.gz",
-        )
-        return cls.objects.create(
-            data=file,
-            content_type="application/json",
-            content_encoding="gzip",
-            last_modified=timestamp,
-        )
+        with SpooledGzipWriter() as writer:
+            file = _write_gzipped_file(
+                writer,
+                content,
+                name=f"full-index-{timestamp.isoformat()}.json.gz",
+            )
+            return cls.objects.create(
+                data=file,
+                content_type="application/json",
+                content_encoding="gzip",
+                last_modified=timestamp,
+                data_checksum_sha256=writer.checksum_sha256,
+            )
 
     @classmethod
     def drop_stale_cache(cls):
@@ -71,6 +93,8 @@ class APIV1PackageCache(S3FileMixin):
         blank=True,
         null=True,
     )
+    # Checksum of the uncompressed content, used as the ETag of the file.
+    data_checksum_sha256 = models.CharField(max_length=64, blank=True, null=True)
 
     @classmethod
     def get_latest_for_community(
@@ -89,26 +113,25 @@ class APIV1PackageCache(S3FileMixin):
 
     @classmethod
     def update_for_community(
-        cls, community: Community, content: bytes
+        cls,
+        community: Community,
+        content: Union[bytes, Iterable[bytes]],
     ) -> "APIV1PackageCache":
-        gzipped = io.BytesIO()
-        with gzip.GzipFile(fileobj=gzipped, mode="wb") as f:
-            f.write(content)
         timestamp = timezone.now()
-        file = ContentFile(
-            # TODO: This is immediately passed to BytesIO again, meaning
-            #       we're just wasting memory. Find a way to pass this to
-            #       the Django model without the inefficiency.
-            gzipped.getvalue(),
-            name=f"{timestamp.isoformat()}-{community.identifier}.json.gz",
-        )
-        return cls.objects.create(
-            community=community,
-            data=file,
-            content_type="application/json",
-            content_encoding="gzip",
-            last_modified=timestamp,
-        )
+        with SpooledGzipWriter() as writer:
+            file = _write_gzipped_file(
+                writer,
+                content,
+                name=f"{timestamp.isoformat()}-{community.identifier}.json.gz",
+            )
+            return cls.objects.create(
+                community=community,
+                data=file,
+                data_checksum_sha256=writer.checksum_sha256,
+                content_type="application/json",
+                content_encoding="gzip",
+                last_modified=timestamp,
+            )
 
     @classmethod
     def drop_stale_cache(cls):
@@ -165,10 +188,17 @@ class APIV1ChunkedPackageCache(SafeDeleteMixin):
         cls,
         community: Community,
         chunk_size_limit: Optional[int] = None,
-    ) -> None:
+        incremental: bool = False,
+    ) -> "APIV1ChunkedPackageCache":
         """
         Chunk community's PackageListings into blob files and create an
         index blob that points to URLs of the chunks.
+
+        In incremental mode the serialized JSON of each listing is reused
+        from APIV1ChunkedPackageCacheEntry if the listing hasn't changed
+        since it was last serialized. Since the chunking is deterministic,
+        chunks containing only unchanged listings result in identical blobs
+        which are deduplicated by DataBlob.
         """
         uncompressed_blob_size = chunk_size_limit or cls.UNCOMPRESSED_CHUNK_LIMIT
         group = DataBlobGroup.objects.create(
@@ -184,29 +214,31 @@ class APIV1ChunkedPackageCache(SafeDeleteMixin):
                 content_encoding="gzip",
             )
 
-        for listing_ids in get_package_listing_ids(community):
-            for listing in get_package_listing_chunk(listing_ids):
-                listing_bytes = listing_to_json(listing)
-
-                # Always add the first listing regardless of the size limit.
-                if not chunk_content:
-                    chunk_content.extend(listing_bytes)
-                # Start new blob if adding current chunck would exceed the size limit.
-                # +2 for opening and closing brackets
-                elif (
-                    len(chunk_content) + len(listing_bytes) + 2 > uncompressed_blob_size
-                ):
-                    finalize_blob()
-                    chunk_content = bytearray(listing_bytes)
-                else:
-                    chunk_content.extend(b"," + listing_bytes)
+        if incremental:
+            listings_json = APIV1ChunkedPackageCacheEntry.iterate_listing_json(
+                community,
+            )
+        else:
+            listings_json = iterate_listing_json(community)
+
+        for listing_bytes in listings_json:
+            # Always add the first listing regardless of the size limit.
+            if not chunk_content:
+                chunk_content.extend(listing_bytes)
+            # Start new blob if adding current chunck would exceed the size limit.
+            # +2 for opening and closing brackets
+            elif len(chunk_content) + len(listing_bytes) + 2 > uncompressed_blob_size:
+                finalize_blob()
+                chunk_content = bytearray(listing_bytes)
+            else:
+                chunk_content.extend(b"," + listing_bytes)
 
         if len(chunk_content) or not group.entries.exists():
             finalize_blob()
 
         group.set_complete()
         index = get_index_blob(group)
-        cls.objects.create(community=community, index=index, chunks=group)
+        return cls.objects.create(community=community, index=index, chunks=group)
 
     @classmethod
     def drop_stale_cache(cls) -> None:
@@ -241,6 +273,130 @@ class APIV1ChunkedPackageCache(SafeDeleteMixin):
             return json.loads(f.read())
 
 
+class APIV1ChunkedPackageCacheEntry(models.Model):
+    """
+    Serialized JSON of a single PackageListing, used by the incremental
+    mode of APIV1ChunkedPackageCache to skip re-serializing listings that
+    haven't changed between cache updates.
+    """
+
+    listing: PackageListing = models.OneToOneField(
+        "community.PackageListing",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    change_marker = models.CharField(max_length=64)
+    content = models.BinaryField()
+    datetime_updated = models.DateTimeField(auto_now=True)
+
+    # Entries are rebuilt periodically even if their change marker matches,
+    # as the marker doesn't cover e.g. renamed categories or site domains.
+    MAX_AGE = timedelta(hours=24)
+
+    def __str__(self):
+        return f"{self.listing_id}: {self.change_marker}"
+
+    @classmethod
+    def iterate_listing_json(cls, community: Community) -> Iterable[bytes]:
+        """
+        Yield the serialized JSON of community's PackageListings in the
+        order used by the package list caches, serializing only listings
+        whose change marker differs from the stored entry.
+        """
+        for markers in get_package_listing_change_markers(community):
+            listing_ids = [listing_id for listing_id, _ in markers]
+            entries: Dict[int, Tuple[str, bytes]] = {
+                listing_id: (marker, bytes(content))
+                for listing_id, marker, content in cls.objects.filter(
+                    listing_id__in=listing_ids,
+                    datetime_updated__gte=timezone.now() - cls.MAX_AGE,
+                ).values_list("listing_id", "change_marker", "content")
+            }
+
+            stale = {
+                listing_id: marker
+                for listing_id, marker in markers
+                if listing_id not in entries or entries[listing_id][0] != marker
+            }
+            if stale:
+                entries.update(cls.refresh_entries(stale))
+
+            for listing_id in listing_ids:
+                # Listings might disappear between the queries, in which
+                # case they're skipped like they would be in a full update.
+                if listing_id in entries:
+                    yield entries[listing_id][1]
+
+    @classmethod
+    @transaction.atomic
+    def refresh_entries(cls, markers: Dict[int, str]) -> Dict[int, Tuple[str, bytes]]:
+        """
+        Serialize the given listings and store the results, replacing any
+        existing entries.
+        """
+        result = {
+            listing.id: (markers[listing.id], listing_to_json(listing))
+            for listing in get_package_listing_chunk(list(markers.keys()))
+        }
+        cls.objects.filter(listing_id__in=result.keys()).delete()
+        cls.objects.bulk_create(
+            [
+                cls(listing_id=listing_id, change_marker=marker, content=content)
+                for listing_id, (marker, content) in result.items()
+            ],
+        )
+        return result
+
+
+class CacheRebuildSummary(models.Model):
+    """
+    Outcome of rebuilding a single community's package list cache, used for
+    monitoring the duration and size of the periodic cache updates.
+    """
+
+    community: Community = models.ForeignKey(
+        "community.Community",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    cache_type = models.CharField(
+        max_length=32,
+        choices=CacheRebuildType.as_choices(),
+    )
+    status = models.CharField(
+        max_length=32,
+        choices=CacheRebuildStatus.as_choices(),
+    )
+    started_at = models.DateTimeField()
+    duration_seconds = models.FloatField()
+    # Total size of the stored (compressed) cache files in bytes
+    size_bytes = models.BigIntegerField(blank=True, null=True)
+
+    MAX_AGE = timedelta(days=7)
+
+    class Meta:
+        get_latest_by = "started_at"
+        indexes = [
+            models.Index(
+                fields=["community", "cache_type", "-started_at"],
+                name="cache_rebuild_summary_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.cache_type}: {self.community_id} ({self.status})"
+
+    @classmethod
+    def drop_old(cls) -> None:
+        cls.objects.filter(started_at__lte=timezone.now() - cls.MAX_AGE).delete()
+
+
+def iterate_listing_json(community: Community) -> Iterable[bytes]:
+    for listing_ids in get_package_listing_ids(community):
+        for listing in get_package_listing_chunk(listing_ids):
+            yield listing_to_json(listing)
+
+
 def get_package_listing_ids(community: Community) -> Iterable[List[int]]:
     """
     Iterate over the PackageListing in chunks to limit the amount of
@@ -257,18 +413,80 @@ def get_package_listing_ids(community: Community) -> Iterable[List[int]]:
     yield from batch(1000, listing_ids)
 
 
-def get_package_listing_chunk(
-    listing_ids: List[int],
-) -> List[PackageListing]:
-    from thunderstore.repository.models import PackageRating, PackageVersion
+def get_package_listing_change_markers(
+    community: Community,
+) -> Iterable[List[Tuple[int, str]]]:
+    """
+    Iterate over (listing id, change marker) pairs of the PackageListings
+    in chunks. The change marker is a hash of the fields that affect the
+    listing's serialized content, and is computed in a single query to keep
+    it considerably cheaper than serializing the listing itself.
+    """
+    from thunderstore.repository.models import PackageVersion
 
-    # Use an isolated subquery for ratings to prevent massive joins
-    ratings_subquery = Subquery(
-        PackageRating.objects.filter(package_id=OuterRef("package_id"))
+    active_versions = (
+        PackageVersion.objects.filter(package_id=OuterRef("package_id"), is_active=True)
+        .order_by()
         .values("package_id")
-        .annotate(count=Count("id"))
-        .values("count")
     )
+    categories = (
+        PackageListing.categories.through.objects.filter(
+            packagelisting_id=OuterRef("pk"),
+        )
+        .order_by()
+        .values("packagelisting_id")
+    )
+
+    rows = (
+        order_package_listing_queryset(
+            get_package_listing_base_queryset(community.identifier)
+        )
+        .annotate(
+            _version_count=Subquery(
+                active_versions.annotate(count=Count("id")).values("count"),
+            ),
+            _version_downloads=Subquery(
+                active_versions.annotate(total=Sum("downloads")).values("total"),
+            ),
+            _category_ids=Subquery(
+                categories.annotate(
+                    ids=StringAgg(
+                        Cast("packagecategory_id", output_field=CharField()),
+                        delimiter=",",
+                        ordering="packagecategory_id",
+                    ),
+                ).values("ids"),
+            ),
+        )
+        .values_list(
+            "id",
+            "datetime_updated",
+            "has_nsfw_content",
+            "package__date_updated",
+            "package__is_pinned",
+            "package__is_deprecated",
+            "package__latest_id",
+            "package__owner__donation_link",
+            "_version_count",
+            "_version_downloads",
+            "package__rating_score",
+            "_category_ids",
+        )
+        .iterator(chunk_size=1000)
+    )
+
+    for rows_batch in batch(1000, rows):
+        yield [(row[0], _get_change_marker(row[1:])) for row in rows_batch]
+
+
+def _get_change_marker(values: Iterable[Any]) -> str:
+    return sha256("|".join(str(v) for v in values).encode()).hexdigest()
+
+
+def get_package_listing_chunk(
+    listing_ids: List[int],
+) -> List[PackageListing]:
+    from thunderstore.repository.models import PackageVersion
 
     dependencies_prefetch = Prefetch(
         "dependencies",
@@ -300,7 +518,6 @@ def get_package_listing_chunk(
             "community__sites__site",
             versions_prefetch,
         )
-        .annotate(_rating_score=Coalesce(ratings_subquery, 0))
     )
 
     order_map = {lid: pos for pos, lid in enumerate(listing_ids)}
@@ -311,7 +528,7 @@ def _get_sorted_active_versions(
     package: "Package",
 ) -> List["PackageVersion"]:
     versions = [v for v in package.versions.all() if v.is_active]
-    versions.sort(key=lambda v: StrictVersion(v.version_number), reverse=True)
+    versions.sort(key=lambda v: v.version_key, reverse=True)
     return versions
 
 
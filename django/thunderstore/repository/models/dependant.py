@@ -0,0 +1,138 @@
+from typing import Iterable, Optional
+
+from django.db import models, transaction
+from django.db.models import QuerySet
+
+from thunderstore.community.models import Community, PackageListing
+from thunderstore.repository.models.package import Package
+from thunderstore.repository.models.package_version import PackageVersion
+
+
+class PackageDependant(models.Model):
+    """
+    Reverse dependency index, listing the packages whose latest version
+    depends on a version of the package.
+
+    Maintained whenever the latest version of a package, or the
+    dependencies of a latest version, change. Looking up dependants through
+    the versions instead requires joining the whole dependency table.
+    """
+
+    package = models.ForeignKey(
+        "repository.Package",
+        related_name="dependant_index",
+        on_delete=models.CASCADE,
+    )
+    dependant = models.ForeignKey(
+        "repository.Package",
+        related_name="dependency_index",
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("package", "dependant"),
+                name="unique_package_dependant",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=("dependant", "package"),
+                name="package_dependant_reverse_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.dependant_id} -> {self.package_id}"
+
+    @classmethod
+    @transaction.atomic
+    def update_for_dependant(cls, dependant: Package) -> None:
+        """
+        Sync the index entries of a package with its latest version.
+        """
+        if dependant.latest_id is None:
+            target = set()
+        else:
+            target = set(
+                PackageVersion.dependencies.through.objects.filter(
+                    from_packageversion_id=dependant.latest_id,
+                ).values_list("to_packageversion__package_id", flat=True)
+            )
+        current = set(
+            cls.objects.filter(dependant=dependant).values_list("package_id", flat=True)
+        )
+
+        if current - target:
+            cls.objects.filter(
+                dependant=dependant,
+                package_id__in=current - target,
+            ).delete()
+        if target - current:
+            cls.objects.bulk_create(
+                [cls(package_id=x, dependant=dependant) for x in target - current],
+                ignore_conflicts=True,
+            )
+
+    @classmethod
+    def update_for_versions(cls, version_ids: Iterable[int]) -> None:
+        """
+        Update the index entries of the packages whose latest version is one
+        of the given versions.
+        """
+        for package in Package.objects.filter(latest_id__in=list(version_ids)):
+            cls.update_for_dependant(package)
+
+    @staticmethod
+    def dependencies_changed(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ("post_add", "post_remove", "post_clear"):
+            return
+        if reverse:
+            # The dependants of `instance` were modified. Cleared sets don't
+            # carry the affected versions, but reverse clears aren't used.
+            PackageDependant.update_for_versions(pk_set or ())
+        else:
+            PackageDependant.update_for_versions((instance.pk,))
+
+
+def get_package_dependants(package_pk: int) -> QuerySet[Package]:
+    """
+    Return the active packages whose latest version depends on the package.
+    """
+    return Package.objects.filter(dependency_index__package_id=package_pk).active()
+
+
+def get_package_dependant_listings(
+    package_pk: int,
+    community: Optional[Community] = None,
+) -> QuerySet[PackageListing]:
+    """
+    Return the active listings of the packages depending on the package,
+    optionally limited to a single community.
+    """
+    listings = PackageListing.objects.active().filter(
+        package__dependency_index__package_id=package_pk,
+    )
+    if community is not None:
+        listings = listings.filter(community=community)
+    return listings
+
+
+def get_package_dependant_count(
+    package_pk: int,
+    community: Optional[Community] = None,
+) -> int:
+    """
+    Count the dependants of the package, optionally only counting those
+    listed in the community.
+    """
+    if community is None:
+        return get_package_dependants(package_pk).count()
+    return get_package_dependant_listings(package_pk, community).count()
+
+
+models.signals.m2m_changed.connect(
+    PackageDependant.dependencies_changed,
+    sender=PackageVersion.dependencies.through,
+)
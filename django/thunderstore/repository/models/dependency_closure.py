@@ -0,0 +1,138 @@
+from typing import Dict, Iterable, Set
+
+from django.db import models
+
+from thunderstore.repository.models.package_version import PackageVersion
+from thunderstore.utils.batch import batch
+
+
+class PackageVersionDependencyClosure(models.Model):
+    """
+    Memoized transitive dependencies of package versions.
+
+    The closure of a version is computed when first requested and stored as
+    a row per dependency, along with a row referring to the version itself
+    which marks the closure as computed. The closures containing a version
+    are dropped whenever the dependencies of that version change.
+    """
+
+    root = models.ForeignKey(
+        "repository.PackageVersion",
+        related_name="dependency_closure",
+        on_delete=models.CASCADE,
+    )
+    dependency = models.ForeignKey(
+        "repository.PackageVersion",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("root", "dependency"),
+                name="unique_dependency_closure_entry",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.root_id} -> {self.dependency_id}"
+
+    @classmethod
+    def resolve(cls, root_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """
+        Return the ids of the transitive dependencies of each of the given
+        package versions, computing the closures which aren't stored yet.
+        """
+        root_ids = set(root_ids)
+        closures: Dict[int, Set[int]] = {}
+        for id_batch in batch(1000, root_ids):
+            entries = cls.objects.filter(root_id__in=id_batch).values_list(
+                "root_id", "dependency_id"
+            )
+            for root_id, dependency_id in entries:
+                closures.setdefault(root_id, set()).add(dependency_id)
+
+        missing = root_ids - closures.keys()
+        if missing:
+            closures.update(cls._compute(missing))
+
+        return {root: deps - {root} for root, deps in closures.items()}
+
+    @classmethod
+    def _compute(cls, root_ids: Set[int]) -> Dict[int, Set[int]]:
+        # The dependency graph reachable from the roots is loaded a level at
+        # a time, after which the closures are walked in memory.
+        graph: Dict[int, Set[int]] = {}
+        frontier = set(root_ids)
+        while frontier:
+            for version_id in frontier:
+                graph[version_id] = set()
+            for id_batch in batch(1000, frontier):
+                edges = PackageVersion.dependencies.through.objects.filter(
+                    from_packageversion_id__in=id_batch,
+                ).values_list("from_packageversion_id", "to_packageversion_id")
+                for from_id, to_id in edges:
+                    graph[from_id].add(to_id)
+            frontier = {d for v in frontier for d in graph[v]} - graph.keys()
+
+        closures = {root: cls._walk(graph, root) for root in root_ids}
+        cls.objects.bulk_create(
+            [
+                cls(root_id=root, dependency_id=dependency)
+                for root, dependencies in closures.items()
+                for dependency in dependencies
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        return closures
+
+    @staticmethod
+    def _walk(graph: Dict[int, Set[int]], root: int) -> Set[int]:
+        visited = {root}
+        stack = [root]
+        while stack:
+            for dependency in graph[stack.pop()]:
+                if dependency not in visited:
+                    visited.add(dependency)
+                    stack.append(dependency)
+        return visited
+
+    @classmethod
+    def invalidate(cls, version_ids: Iterable[int]) -> None:
+        """
+        Drop the stored closures containing any of the given versions.
+        """
+        roots = cls.objects.filter(
+            dependency_id__in=list(version_ids),
+        ).values("root_id")
+        cls.objects.filter(root_id__in=roots).delete()
+
+    @staticmethod
+    def dependencies_changed(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ("post_add", "post_remove", "post_clear"):
+            return
+        if reverse and pk_set:
+            # The dependencies of the versions in pk_set were modified
+            changed = pk_set
+        else:
+            # Either the dependencies of `instance` were modified, or
+            # `instance` was removed from the dependencies of any version.
+            # Every closure affected by the latter also contains `instance`.
+            changed = (instance.pk,)
+        PackageVersionDependencyClosure.invalidate(changed)
+
+    @staticmethod
+    def version_deleted(sender, instance, **kwargs):
+        PackageVersionDependencyClosure.invalidate((instance.pk,))
+
+
+models.signals.m2m_changed.connect(
+    PackageVersionDependencyClosure.dependencies_changed,
+    sender=PackageVersion.dependencies.through,
+)
+models.signals.pre_delete.connect(
+    PackageVersionDependencyClosure.version_deleted,
+    sender=PackageVersion,
+)
@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class DownloadCounterBucket(models.Model):
+    """
+    A download counter bucket which has been applied to the download counts.
+
+    Created in the same transaction as the counts are applied in, so that a
+    bucket which is claimed again after a crashed flush isn't counted twice.
+    """
+
+    bucket = models.BigIntegerField(primary_key=True)
+    datetime_applied = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return str(self.bucket)
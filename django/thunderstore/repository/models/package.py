@@ -1,19 +1,20 @@
 import re
 import uuid
-from distutils.version import StrictVersion
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.sites.models import Site
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models, transaction
-from django.db.models import Case, Exists, OuterRef, Sum, When, signals
+from django.db.models import Count, Exists, F, OuterRef, Subquery, Sum, signals
+from django.db.models.functions import Coalesce, Greatest
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 
-from thunderstore.cache.cache import cache_function_result
-from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
 from thunderstore.cache.tasks import invalidate_cache_on_commit_async
 from thunderstore.core.enums import OptionalBoolChoice
 from thunderstore.core.mixins import AdminLinkMixin
@@ -23,6 +24,7 @@ from thunderstore.permissions.mixins import VisibilityMixin
 from thunderstore.permissions.models.visibility import VisibilityFlagsQuerySet
 from thunderstore.permissions.utils import validate_user
 from thunderstore.repository.consts import PACKAGE_NAME_REGEX
+from thunderstore.repository.search import get_package_search_vector
 
 if TYPE_CHECKING:
     from thunderstore.repository.models import PackageWiki
@@ -38,16 +40,31 @@ class PackageQueryset(VisibilityFlagsQuerySet):
         )
         return self.exclude(is_active=False).filter(Exists(has_active_versions))
 
-
-def get_package_dependants(package_pk: int):
-    return Package.objects.filter(
-        latest__dependencies__package_id=package_pk,
-    ).active()
-
-
-@cache_function_result(CacheBustCondition.any_package_updated)
-def get_package_dependants_list(package_pk: int):
-    return list(get_package_dependants(package_pk))
+    def update_counters(self) -> int:
+        """
+        Recompute the denormalized total_downloads and rating_score columns
+        of the packages from their versions and ratings.
+        """
+        from thunderstore.repository.models import PackageRating, PackageVersion
+
+        downloads = (
+            PackageVersion.objects.filter(package_id=OuterRef("pk"))
+            .order_by()
+            .values("package_id")
+            .annotate(total=Sum("downloads"))
+            .values("total")
+        )
+        ratings = (
+            PackageRating.objects.filter(package_id=OuterRef("pk"))
+            .order_by()
+            .values("package_id")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return self.update(
+            total_downloads=Coalesce(Subquery(downloads), 0),
+            rating_score=Coalesce(Subquery(ratings), 0),
+        )
 
 
 class Package(VisibilityMixin, AdminLinkMixin):
@@ -99,6 +116,30 @@ class Package(VisibilityMixin, AdminLinkMixin):
         default=OptionalBoolChoice.NONE,
     )
 
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document, maintained by update_search_vector",
+    )
+
+    # Denormalized from the versions and ratings, kept up to date with
+    # queryset updates and reconciled by PackageQueryset.update_counters
+    total_downloads = models.PositiveBigIntegerField(default=0, editable=False)
+    rating_score = models.PositiveIntegerField(default=0, editable=False)
+
+    # Changes to these fields require the search vector to be rebuilt
+    SEARCH_VECTOR_FIELDS = {"name", "owner", "latest"}
+    # Never written by save(), as saving an outdated instance would revert
+    # the updates made since it was loaded
+    COUNTER_FIELDS = {"total_downloads", "rating_score"}
+    # Copied to the listings by PackageListingQueryset.update_sort_keys
+    LISTING_SORT_KEY_FIELDS = {"is_pinned", "is_deprecated", "date_updated"}
+    # Left out of full saves when unchanged since the instance was loaded, so
+    # that the data derived from them isn't rebuilt needlessly
+    TRACKED_FIELDS = SEARCH_VECTOR_FIELDS | LISTING_SORT_KEY_FIELDS
+
+    _loaded_values: Dict[str, Any] = {}
+
     class Meta:
         permissions = (("deprecate_package", "Can manage package deprecation status"),)
         constraints = [
@@ -106,6 +147,14 @@ class Package(VisibilityMixin, AdminLinkMixin):
                 fields=("owner", "name"), name="unique_name_per_namespace"
             ),
         ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="package_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                name="package_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def validate(self):
         if not re.match(PACKAGE_NAME_REGEX, self.name):
@@ -113,9 +162,67 @@ class Package(VisibilityMixin, AdminLinkMixin):
                 "Package names can only contain a-z A-Z 0-9 _ characters"
             )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance.get_tracked_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        # Refreshed fields hold the database values from now on, while the
+        # others keep the values they were loaded with
+        refreshed = {
+            name: value
+            for name, value in self.get_tracked_values().items()
+            if fields is None
+            or name in fields
+            or self._meta.get_field(name).attname in fields
+        }
+        self._loaded_values = {**self._loaded_values, **refreshed}
+
+    def get_tracked_values(self) -> Dict[str, Any]:
+        deferred = self.get_deferred_fields()
+        fields = (self._meta.get_field(x) for x in self.TRACKED_FIELDS)
+        return {
+            x.name: getattr(self, x.attname)
+            for x in fields
+            if x.attname not in deferred
+        }
+
+    def is_unchanged(self, field: models.Field) -> bool:
+        return field.name in self._loaded_values and self._loaded_values[
+            field.name
+        ] == getattr(self, field.attname)
+
     def save(self, *args, **kwargs):
         self.validate()
-        return super().save(*args, **kwargs)
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                x.name
+                for x in self._meta.concrete_fields
+                if not x.primary_key
+                and x.name not in self.COUNTER_FIELDS
+                and x.attname not in deferred
+                and not self.is_unchanged(x)
+            ]
+        result = super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or self.SEARCH_VECTOR_FIELDS & set(update_fields):
+            self.update_search_vector()
+        self._loaded_values = self.get_tracked_values()
+        return result
+
+    def update_search_vector(self):
+        description = self.latest.description if self.latest else ""
+        Package.objects.filter(pk=self.pk).update(
+            search_vector=get_package_search_vector(
+                name=self.name,
+                owner_name=self.owner.name,
+                description=description,
+            ),
+        )
 
     def get_or_create_package_listing(self, community):
         from thunderstore.community.models import PackageListing
@@ -175,15 +282,9 @@ class Package(VisibilityMixin, AdminLinkMixin):
     @cached_property
     def available_versions(self):
         # TODO: Caching
-        versions = self.versions.filter(is_active=True).values_list(
-            "pk", "version_number"
-        )
-        ordered = sorted(versions, key=lambda version: StrictVersion(version[1]))
-        pk_list = [version[0] for version in reversed(ordered)]
-        preserved = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(pk_list)])
         return (
-            self.versions.filter(pk__in=pk_list)
-            .order_by(preserved)
+            self.versions.filter(is_active=True)
+            .order_by_version()
             .prefetch_related(
                 "dependencies",
                 "dependencies__package",
@@ -195,15 +296,6 @@ class Package(VisibilityMixin, AdminLinkMixin):
             )
         )
 
-    @cached_property
-    def downloads(self):
-        # TODO: Caching
-        return self.versions.aggregate(downloads=Sum("downloads"))["downloads"]
-
-    @cached_property
-    def rating_score(self):
-        return self.package_ratings.count()
-
     @cached_property
     def icon(self):
         return self.latest.icon
@@ -226,10 +318,8 @@ class Package(VisibilityMixin, AdminLinkMixin):
 
     @cached_property
     def sorted_dependencies(self):
-        return (
-            self.latest.dependencies.select_related("package")
-            .annotate(total_downloads=Sum("package__versions__downloads"))
-            .order_by("-package__is_pinned", "-total_downloads")
+        return self.latest.dependencies.select_related("package").order_by(
+            "-package__is_pinned", "-package__total_downloads"
         )
 
     @cached_property
@@ -240,10 +330,6 @@ class Package(VisibilityMixin, AdminLinkMixin):
     def is_effectively_active(self):
         return self.is_active and self.versions.filter(is_active=True).count() > 0
 
-    @cached_property
-    def dependants_list(self):
-        return get_package_dependants_list(self.pk)
-
     def readme(self):
         return self.latest.readme
 
@@ -291,6 +377,12 @@ class Package(VisibilityMixin, AdminLinkMixin):
         self.latest = self.available_versions.first()
         if old_latest != self.latest:
             self.save()
+            self.update_dependant_index()
+
+    def update_dependant_index(self):
+        from thunderstore.repository.models import PackageDependant
+
+        PackageDependant.update_for_dependant(self)
 
     def handle_created_version(self, version):
         self.date_updated = timezone.now()
@@ -299,9 +391,21 @@ class Package(VisibilityMixin, AdminLinkMixin):
 
     def handle_updated_version(self, version):
         self.recache_latest()
+        self.update_counters()
 
     def handle_deleted_version(self, version):
         self.recache_latest()
+        self.update_counters()
+
+    def update_counters(self):
+        Package.objects.filter(pk=self.pk).update_counters()
+        self.community_listings.all().update_sort_keys()
+
+    def adjust_rating_score(self, delta: int):
+        Package.objects.filter(pk=self.pk).update(
+            rating_score=Greatest(F("rating_score") + delta, 0),
+        )
+        self.community_listings.all().update_sort_keys()
 
     def deprecate(self):
         self.is_deprecated = True
@@ -440,12 +544,32 @@ class Package(VisibilityMixin, AdminLinkMixin):
         #     self.recache_latest()  # latest available version could potentially change if visibility changes
         #     # TODO: Available versions should be affected by visibility
 
+    def get_cache_tags(self) -> List[str]:
+        communities = self.community_listings.values_list(
+            "community__identifier",
+            flat=True,
+        )
+        return [
+            CacheTag.package(self.pk),
+            CacheTag.team(self.owner_id),
+            *(CacheTag.community(x) for x in communities),
+        ]
+
     @staticmethod
-    def post_save(sender, instance, created, **kwargs):
-        invalidate_cache_on_commit_async(CacheBustCondition.any_package_updated)
+    def post_save(sender, instance, created, update_fields=None, **kwargs):
+        if not created and (
+            update_fields is None
+            or Package.LISTING_SORT_KEY_FIELDS & set(update_fields)
+        ):
+            instance.community_listings.all().update_sort_keys()
+        invalidate_cache_on_commit_async(
+            CacheBustCondition.any_package_updated,
+            instance.get_cache_tags(),
+        )
 
     @staticmethod
     def post_delete(sender, instance, **kwargs):
+        # The listings are gone at this point, invalidate everything
         invalidate_cache_on_commit_async(CacheBustCondition.any_package_updated)
 
 
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Literal, Optional, Union
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import signals
 
 from thunderstore.core.types import UserType
 from thunderstore.repository.permissions import ensure_can_rate_package
@@ -54,3 +55,16 @@ class PackageRating(models.Model):
         else:
             PackageRating.objects.filter(rater=agent, package=package).delete()
             return "unrated"
+
+    @staticmethod
+    def post_save(sender, instance, created, **kwargs):
+        if created:
+            instance.package.adjust_rating_score(1)
+
+    @staticmethod
+    def post_delete(sender, instance, **kwargs):
+        instance.package.adjust_rating_score(-1)
+
+
+signals.post_save.connect(PackageRating.post_save, sender=PackageRating)
+signals.post_delete.connect(PackageRating.post_delete, sender=PackageRating)
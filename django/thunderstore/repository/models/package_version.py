@@ -1,6 +1,6 @@
 import re
 import uuid
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
 
 from django.conf import settings
 from django.core.cache import cache
@@ -14,9 +14,11 @@ from django.utils.functional import cached_property
 
 from thunderstore.core.mixins import AdminLinkMixin
 from thunderstore.core.types import UserType
+from thunderstore.core.utils import capture_exception
 from thunderstore.permissions.mixins import VisibilityMixin, VisibilityQuerySet
 from thunderstore.repository.consts import (
     PACKAGE_NAME_REGEX,
+    PackageVersionProcessingStatus,
     PackageVersionReviewStatus,
 )
 from thunderstore.repository.models import Package
@@ -38,6 +40,23 @@ if TYPE_CHECKING:
     )
 
 
+VERSION_NUMBER_REGEX = re.compile(r"^([0-9]+)\.([0-9]+)\.([0-9]+)$")
+
+
+def parse_version_number(version_number: str) -> Tuple[int, int, int]:
+    """
+    Split a version number in the major.minor.patch format into integers.
+
+    Legacy version numbers not in the format are sorted as 0.0.0, as they
+    were when the components were first populated by a migration.
+    """
+    match = VERSION_NUMBER_REGEX.match(version_number)
+    if match is None:
+        return 0, 0, 0
+    major, minor, patch = (int(x) for x in match.groups())
+    return major, minor, patch
+
+
 def get_version_zip_filepath(instance, filename):
     return f"repository/packages/{instance}.zip"
 
@@ -72,6 +91,12 @@ class PackageVersionQuerySet(VisibilityQuerySet):
             for entry in page:
                 yield entry
 
+    def order_by_version(self) -> "QuerySet[PackageVersion]":
+        """
+        Order by version number, latest version first.
+        """
+        return self.order_by("-version_major", "-version_minor", "-version_patch")
+
     def listed_in(self, community_identifier: str):
         return self.exclude(
             ~Q(package__community_listings__community__identifier=community_identifier),
@@ -115,10 +140,14 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
         max_length=Package._meta.get_field("name").max_length,
     )
 
-    # TODO: Split to three fields for each number in the version for better querying performance
     version_number = models.CharField(
         max_length=16,
     )
+    # Components of the version number, populated on save to allow ordering
+    # versions in the database.
+    version_major = models.PositiveBigIntegerField(default=0, editable=False)
+    version_minor = models.PositiveBigIntegerField(default=0, editable=False)
+    version_patch = models.PositiveBigIntegerField(default=0, editable=False)
     website_url = models.CharField(
         max_length=1024,
     )
@@ -156,6 +185,15 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
         blank=True,
         null=True,
     )
+    # Status of the background processing producing the derived data of the
+    # version, such as the file tree.
+    processing_status = models.TextField(
+        default=PackageVersionProcessingStatus.pending,
+        choices=PackageVersionProcessingStatus.as_choices(),
+    )
+    # Number of times the processing has been started, which bounds how many
+    # times failed processing is retried
+    processing_attempts = models.PositiveIntegerField(default=0, editable=False)
 
     # <packagename>.png
     icon = models.ImageField(
@@ -171,11 +209,20 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
 
     def save(self, *args, **kwargs):
         self.validate()
+        (
+            self.version_major,
+            self.version_minor,
+            self.version_patch,
+        ) = parse_version_number(self.version_number)
         return super().save(*args, **kwargs)
 
     class Meta:
         indexes = [
             models.Index(fields=["date_created", "id"]),
+            models.Index(
+                fields=["package", "version_major", "version_minor", "version_patch"],
+                name="package_version_sort_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -242,6 +289,10 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
     def is_effectively_active(self):
         return self.is_active and self.package.is_active
 
+    @property
+    def version_key(self) -> Tuple[int, int, int]:
+        return self.version_major, self.version_minor, self.version_patch
+
     @cached_property
     def full_version_name(self):
         return f"{self.package.full_package_name}-{self.version_number}"
@@ -286,24 +337,54 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
     @staticmethod
     def post_save(sender, instance, created, **kwargs):
         if created:
+            PackageVersion._adjust_total_used_disk_space(instance.file_size)
             instance.package.handle_created_version(instance)
             instance.announce_release()
         instance.package.handle_updated_version(instance)
 
     @staticmethod
     def post_delete(sender, instance, **kwargs):
+        PackageVersion._adjust_total_used_disk_space(-instance.file_size)
         instance.package.handle_deleted_version(instance)
 
+    @staticmethod
+    def _get_total_used_disk_space_key() -> str:
+        return "repository.packageversion.total_size"
+
+    @classmethod
+    def get_total_used_disk_space(cls) -> int:
+        """
+        Return the total size of package files, maintained as a running total
+        in the cache which is periodically reconciled with the database.
+        """
+        size = cache.get(cls._get_total_used_disk_space_key())
+        if size is None:
+            size = cls.update_total_used_disk_space()
+        return size
+
     @classmethod
-    def get_total_used_disk_space(cls):
-        return cls.objects.aggregate(total=Sum("file_size"))["total"] or 0
+    def update_total_used_disk_space(cls) -> int:
+        size = cls.objects.aggregate(total=Sum("file_size"))["total"] or 0
+        cache.set(cls._get_total_used_disk_space_key(), size, timeout=None)
+        return size
+
+    @classmethod
+    def _adjust_total_used_disk_space(cls, delta: int) -> None:
+        try:
+            cache.incr(cls._get_total_used_disk_space_key(), delta=delta)
+        except ValueError:
+            # The total hasn't been computed yet, it will be on the next read
+            pass
+
+    def schedule_processing(self):
+        from thunderstore.repository.tasks.files import process_package_version
+
+        transaction.on_commit(lambda: process_package_version.delay(self.pk))
 
     @run_after_commit
     def announce_release(self):
         webhooks = Webhook.get_for_package_release(self.package)
-
-        for webhook in webhooks:
-            webhook.post_package_version_release(self)
+        Webhook.post_package_version_release_to_all(webhooks, self)
 
     def _increase_download_counter(self):
         self.downloads += 1
@@ -333,11 +414,21 @@ class PackageVersion(VisibilityMixin, AdminLinkMixin):
 
     @staticmethod
     def log_download_event(version_id: int, client_ip: Optional[str]):
+        from thunderstore.repository.download_counter import record_download
         from thunderstore.repository.tasks.downloads import log_version_download
 
         if not PackageVersion._can_log_download_event(version_id, client_ip):
             return
 
+        if settings.USE_BATCHED_DOWNLOAD_COUNTER:
+            try:
+                record_download(version_id)
+                return
+            except Exception as e:  # pragma: no cover
+                # Fall back to logging the download immediately, as it's
+                # better to pay the cost than to lose the download.
+                capture_exception(e)
+
         log_version_download.delay(version_id, timezone.now().isoformat())
 
     def build_audit_event(
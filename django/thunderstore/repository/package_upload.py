@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from zipfile import BadZipFile, ZipFile
 
 from django import forms
@@ -10,7 +10,7 @@ from django.db import transaction
 from thunderstore.community.models import Community, PackageCategory
 from thunderstore.core.types import UserType
 from thunderstore.repository.consts import PackageVersionReviewStatus
-from thunderstore.repository.filetree import create_file_tree_from_zip_data
+from thunderstore.repository.filetree import store_file_checksums
 from thunderstore.repository.models import Package, PackageVersion, Team
 from thunderstore.repository.package_formats import PackageFormats
 from thunderstore.repository.validation.categories import clean_community_categories
@@ -18,10 +18,13 @@ from thunderstore.repository.validation.icon import validate_icon
 from thunderstore.repository.validation.manifest import validate_manifest
 from thunderstore.repository.validation.markdown import validate_markdown
 from thunderstore.repository.validation.zip import (
+    PACKAGE_METADATA_FILES,
+    ZipEntry,
     check_duplicate_filenames,
     check_exceeds_max_file_count_per_zip,
     check_unsafe_paths,
     check_zero_offset,
+    inspect_zip,
 )
 
 MAX_PACKAGE_SIZE = 1024 * 1024 * settings.REPOSITORY_MAX_PACKAGE_SIZE_MB
@@ -90,6 +93,7 @@ class PackageUploadForm(forms.ModelForm):
         self.readme: Optional[str] = None
         self.changelog: Optional[str] = None
         self.file_size: Optional[int] = None
+        self.zip_entries: List[ZipEntry] = []
 
     def validate_manifest(self, manifest: bytes):
         self.manifest = validate_manifest(
@@ -140,10 +144,8 @@ class PackageUploadForm(forms.ModelForm):
 
         try:
             with ZipFile(file) as unzip:
-
-                if unzip.testzip():
-                    raise ValidationError("Corrupted zip file")
-
+                # Metadata checks are done first, as they don't require
+                # decompressing the contents of the zip.
                 if check_unsafe_paths(unzip.infolist()):
                     raise ValidationError(
                         "There is an error with the zip's folder structure"
@@ -162,29 +164,33 @@ class PackageUploadForm(forms.ModelForm):
                 if check_exceeds_max_file_count_per_zip(unzip.infolist(), team):
                     raise ValidationError("There are too many files in the zip.")
 
-                try:
-                    manifest = unzip.read("manifest.json")
-                    self.validate_manifest(manifest)
-                except KeyError:
-                    raise ValidationError("Package is missing manifest.json")
-
-                try:
-                    icon = unzip.read("icon.png")
-                    self.validate_icon(icon)
-                except KeyError:
-                    raise ValidationError("Package is missing icon.png")
-
-                try:
-                    name = "README.md"
-                    self.readme = self.validate_markdown(name, unzip.read(name))
-                except KeyError:
-                    raise ValidationError("Package is missing README.md")
-
-                try:
-                    name = "CHANGELOG.md"
-                    self.changelog = self.validate_markdown(name, unzip.read(name))
-                except KeyError:
-                    pass
+                inspection = inspect_zip(unzip, extract=PACKAGE_METADATA_FILES)
+
+            if inspection.corrupted_file:
+                raise ValidationError("Corrupted zip file")
+            self.zip_entries = inspection.entries
+
+            try:
+                self.validate_manifest(inspection.files["manifest.json"])
+            except KeyError:
+                raise ValidationError("Package is missing manifest.json")
+
+            try:
+                self.validate_icon(inspection.files["icon.png"])
+            except KeyError:
+                raise ValidationError("Package is missing icon.png")
+
+            try:
+                name = "README.md"
+                self.readme = self.validate_markdown(name, inspection.files[name])
+            except KeyError:
+                raise ValidationError("Package is missing README.md")
+
+            try:
+                name = "CHANGELOG.md"
+                self.changelog = self.validate_markdown(name, inspection.files[name])
+            except KeyError:
+                pass
 
         except (BadZipFile, NotImplementedError):
             raise ValidationError("Invalid zip file format")
@@ -210,11 +216,6 @@ class PackageUploadForm(forms.ModelForm):
             owner=team, name=self.instance.name, namespace=namespace
         )[0]
 
-        self.instance.file_tree = create_file_tree_from_zip_data(
-            name=f"File tree of package: {self.instance.full_version_name}",
-            zip_data=self.cleaned_data["file"],
-        )
-
         community_categories = self.cleaned_data.get("community_categories", {})
         for community in self.cleaned_data.get("communities", []):
             categories = community_categories.get(community.identifier, [])
@@ -238,4 +239,9 @@ class PackageUploadForm(forms.ModelForm):
         for installer in self.manifest.get("installers", []):
             instance.installers.add(installer["identifier"])
 
+        # The file tree and other derived data are produced in the background
+        # once the version has been committed. The checksums computed above
+        # are handed over so that the zip doesn't need to be inspected again.
+        store_file_checksums(instance.pk, self.zip_entries)
+        instance.schedule_processing()
         return instance
@@ -0,0 +1,98 @@
+import re
+from typing import List, Optional
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorCombinable,
+)
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Coalesce
+
+# The "simple" configuration doesn't stem or drop stop words, which keeps
+# prefix matching of package & team names predictable.
+SEARCH_CONFIG = "simple"
+
+# Postgres' parser treats underscores as word separators, match that here
+# so that e.g. "Fish_and_Birds" yields the same terms on both sides.
+_TERM_REGEX = re.compile(r"[^\W_]+")
+
+
+def get_package_search_vector(
+    name: str,
+    owner_name: str,
+    description: str,
+) -> SearchVectorCombinable:
+    """
+    Build the weighted search document of a package. Package name is the
+    most relevant field, followed by the owner name and the description.
+    """
+    return (
+        SearchVector(Value(name), weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(owner_name), weight="B", config=SEARCH_CONFIG)
+        + SearchVector(Value(description), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def get_search_terms(query: str) -> List[str]:
+    return [x.lower() for x in _TERM_REGEX.findall(query)]
+
+
+def build_prefix_query(query: str) -> Optional[SearchQuery]:
+    """
+    Build a tsquery matching documents which contain a word starting with
+    each of the search terms. Terms are stripped of everything but word
+    characters, so the raw query can't be used to inject tsquery syntax.
+    """
+    terms = get_search_terms(query)
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{x}:*" for x in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def filter_packages_by_search_query(
+    query: Optional[str],
+    queryset: QuerySet,
+    package_prefix: str = "",
+) -> QuerySet:
+    """
+    Filter a queryset by free text search and annotate it with the search
+    relevance as `search_rank`.
+
+    Every whitespace separated part of the query must either match the
+    full-text search document of the package, or be a substring of the
+    package name. The former is served by a GIN index on the search vector
+    and the latter by a trigram index on the name.
+
+    :param package_prefix: Lookup path from the queryset model to the
+        package, e.g. "package__" for PackageListing querysets.
+    """
+    if not query:
+        return queryset
+
+    vector_field = f"{package_prefix}search_vector"
+    name_field = f"{package_prefix}name"
+
+    search_query = Q()
+    parts = [x for x in query.split(" ") if x]
+    for part in parts:
+        part_query = Q(**{f"{name_field}__icontains": part})
+        ts_query = build_prefix_query(part)
+        if ts_query is not None:
+            part_query |= Q(**{vector_field: ts_query})
+        search_query &= part_query
+
+    no_rank = Value(0.0, output_field=FloatField())
+    ts_query = build_prefix_query(query)
+    if ts_query is not None:
+        # Rank is null for packages whose search vector hasn't been built
+        rank = Coalesce(SearchRank(F(vector_field), ts_query), no_rank)
+    else:
+        rank = no_rank
+
+    return queryset.filter(search_query).annotate(search_rank=rank)
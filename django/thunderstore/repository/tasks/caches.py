@@ -1,12 +1,15 @@
-from celery import shared_task  # type: ignore
+from celery import chord, shared_task  # type: ignore
 
 from thunderstore.core.settings import CeleryQueues
 from thunderstore.repository.api.experimental.views.package_index import (
     update_api_experimental_package_index,
 )
 from thunderstore.repository.api.v1.tasks import (
-    update_api_v1_caches,
-    update_api_v1_chunked_package_caches,
+    finalize_api_v1_index_update,
+    finalize_chunked_package_cache_update,
+    get_community_ids_by_traffic,
+    update_api_v1_index_for_community,
+    update_chunked_package_cache_for_community,
 )
 
 
@@ -15,7 +18,35 @@ from thunderstore.repository.api.v1.tasks import (
     queue=CeleryQueues.BackgroundCache,
 )
 def update_api_caches():
-    update_api_v1_caches()
+    """
+    Fan out the package list cache rebuild to a task per community. Tasks
+    are queued in order of community traffic, and stale caches are dropped
+    once all of them have finished.
+    """
+    community_ids = get_community_ids_by_traffic()
+    if not community_ids:
+        finalize_api_caches_update.delay()
+        return
+    chord(
+        update_api_cache_for_community.si(community_id)
+        for community_id in community_ids
+    )(finalize_api_caches_update.si())
+
+
+@shared_task(
+    name="thunderstore.repository.tasks.update_api_cache_for_community",
+    queue=CeleryQueues.BackgroundCache,
+)
+def update_api_cache_for_community(community_id: int):
+    update_api_v1_index_for_community(community_id)
+
+
+@shared_task(
+    name="thunderstore.repository.tasks.finalize_api_caches_update",
+    queue=CeleryQueues.BackgroundCache,
+)
+def finalize_api_caches_update():
+    finalize_api_v1_index_update()
 
 
 @shared_task(
@@ -31,8 +62,39 @@ def update_experimental_package_index():
 @shared_task(
     name="thunderstore.repository.tasks.update_chunked_package_caches",
     queue=CeleryQueues.BackgroundLongRunning,
+)
+def update_chunked_community_package_caches():
+    """
+    Fan out the chunked package list cache rebuild to a task per community,
+    see update_api_caches.
+    """
+    community_ids = get_community_ids_by_traffic()
+    if not community_ids:
+        finalize_chunked_package_caches_update.delay()
+        return
+    chord(
+        update_chunked_package_cache.si(community_id) for community_id in community_ids
+    )(finalize_chunked_package_caches_update.si())
+
+
+@shared_task(
+    name="thunderstore.repository.tasks.update_chunked_package_cache",
+    queue=CeleryQueues.BackgroundLongRunning,
     soft_time_limit=60 * 60 * 23,
     time_limit=60 * 60 * 24,
 )
-def update_chunked_community_package_caches():
-    update_api_v1_chunked_package_caches()
+def update_chunked_package_cache(community_id: int):
+    update_chunked_package_cache_for_community(community_id)
+
+
+@shared_task(
+    name="thunderstore.repository.tasks.finalize_chunked_package_caches_update",
+    queue=CeleryQueues.BackgroundLongRunning,
+)
+def finalize_chunked_package_caches_update():
+    """
+    Drop stale chunked package caches. Runs after every update and also on
+    a schedule of its own, as the update chord never finishes if one of the
+    per-community tasks is killed.
+    """
+    finalize_chunked_package_cache_update()
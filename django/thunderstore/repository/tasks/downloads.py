@@ -1,25 +1,23 @@
-import random
-import time
 from datetime import datetime
 
 from celery import shared_task
 from django.db import transaction
 from django.db.models import F
-from pydantic import BaseModel
 
+from thunderstore.community.models import PackageListing
 from thunderstore.core.settings import CeleryQueues
 from thunderstore.metrics.models import PackageVersionDownloadEvent
-from thunderstore.repository.models import PackageVersion
+from thunderstore.repository.download_counter import (
+    AnalyticsEventPackageDownload,
+    flush_download_counters,
+    generate_download_event_id,
+)
+from thunderstore.repository.models import Package, PackageVersion
 from thunderstore.ts_analytics.kafka import KafkaTopic
 from thunderstore.ts_analytics.tasks import send_kafka_message
 
 TASK_LOG_VERSION_DOWNLOAD = "thunderstore.repository.tasks.log_version_download"
-
-
-class AnalyticsEventPackageDownload(BaseModel):
-    id: int
-    version_id: int
-    timestamp: datetime
+TASK_FLUSH_DOWNLOAD_COUNTERS = "thunderstore.repository.tasks.flush_download_counters"
 
 
 @shared_task(
@@ -29,7 +27,7 @@ class AnalyticsEventPackageDownload(BaseModel):
 )
 def log_version_download(version_id: int, timestamp: str):
     timestamp_dt = datetime.fromisoformat(timestamp)
-    generated_id = (int(time.time() * 1000) << 20) | random.getrandbits(20)
+    generated_id = generate_download_event_id()
     with transaction.atomic():
         ### Download events are now stored in our analytics database
         # event = PackageVersionDownloadEvent.objects.create(
@@ -39,6 +37,12 @@ def log_version_download(version_id: int, timestamp: str):
         PackageVersion.objects.filter(id=version_id).update(
             downloads=F("downloads") + 1
         )
+        Package.objects.filter(versions__id=version_id).update(
+            total_downloads=F("total_downloads") + 1
+        )
+        PackageListing.objects.filter(
+            package__versions__id=version_id
+        ).update_sort_keys()
 
         # Celery task, but intentionally called synchronously as we're already
         # in a celery task context.
@@ -52,3 +56,12 @@ def log_version_download(version_id: int, timestamp: str):
                 ).json(),
             )
         )
+
+
+@shared_task(
+    queue=CeleryQueues.LogDownloads,
+    name=TASK_FLUSH_DOWNLOAD_COUNTERS,
+    ignore_result=True,
+)
+def flush_download_counters_task():
+    flush_download_counters()
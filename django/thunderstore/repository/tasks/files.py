@@ -1,25 +1,32 @@
 import logging
 import tempfile
+from datetime import timedelta
+from typing import Callable, Tuple
 
 from celery import shared_task
+from django.db.models import F, Q
+from django.utils import timezone
 
 from thunderstore.core.settings import CeleryQueues
-from thunderstore.repository.filetree import create_file_tree_from_zip_data
+from thunderstore.markdown.templatetags.markdownify import precompute_rendered_markdown
+from thunderstore.repository.consts import PackageVersionProcessingStatus
+from thunderstore.repository.filetree import (
+    clear_file_checksums,
+    create_file_tree_from_zip_data,
+    get_file_checksums,
+)
 from thunderstore.repository.models import PackageVersion
+from thunderstore.storage.models import DataBlobGroup
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task(queue=CeleryQueues.BackgroundTask)
-def extract_package_version_file_tree(
-    package_version_id: str,
-) -> str:
-    package_version: PackageVersion = PackageVersion.objects.get(pk=package_version_id)
+def extract_file_tree(package_version: PackageVersion) -> DataBlobGroup:
     if package_version.file_tree is not None and package_version.file_tree.is_complete:
         logger.warning(
             f"{package_version.full_version_name} already has a file tree, skipping"
         )
-        return package_version.file_tree.pk
+        return package_version.file_tree
 
     logger.info(f"Extracting file tree for package {package_version.full_version_name}")
     with tempfile.TemporaryFile() as local_copy:
@@ -30,11 +37,130 @@ def extract_package_version_file_tree(
         group = create_file_tree_from_zip_data(
             name=f"File tree of package: {package_version.full_version_name}",
             zip_data=local_copy,
+            checksums=get_file_checksums(package_version.pk),
         )
 
     package_version.file_tree = group
     package_version.save(update_fields=("file_tree",))
+    clear_file_checksums(package_version.pk)
     logger.info(
         f"File tree for package {package_version.full_version_name} finished processing"
     )
-    return group.pk
+    return group
+
+
+def render_markdown_documents(package_version: PackageVersion) -> None:
+    precompute_rendered_markdown(
+        (package_version.readme, package_version.changelog),
+    )
+
+
+# Stages producing the derived data of an uploaded package version, run in
+# order by process_package_version. Every stage must be idempotent, as the
+# processing is retried from the start by retry_package_version_processing
+# if any of them fails.
+PROCESSING_STAGES: Tuple[Callable[[PackageVersion], object], ...] = (
+    extract_file_tree,
+    render_markdown_documents,
+)
+
+
+@shared_task(queue=CeleryQueues.BackgroundTask)
+def extract_package_version_file_tree(
+    package_version_id: str,
+) -> str:
+    package_version: PackageVersion = PackageVersion.objects.get(pk=package_version_id)
+    return extract_file_tree(package_version).pk
+
+
+@shared_task(
+    queue=CeleryQueues.BackgroundTask,
+    name="thunderstore.repository.tasks.process_package_version",
+)
+def process_package_version(package_version_id: str, force: bool = False) -> str:
+    """
+    Run the processing stages of an uploaded package version outside of the
+    upload request and track the progress in the version's status.
+
+    Completed versions are skipped unless processing is forced.
+    """
+    package_version: PackageVersion = PackageVersion.objects.get(pk=package_version_id)
+    if (
+        package_version.processing_status == PackageVersionProcessingStatus.complete
+        and not force
+    ):
+        return package_version.processing_status
+
+    PackageVersion.objects.filter(pk=package_version.pk).update(
+        processing_attempts=F("processing_attempts") + 1,
+    )
+    set_processing_status(package_version, PackageVersionProcessingStatus.processing)
+    try:
+        for stage in PROCESSING_STAGES:
+            stage(package_version)
+    except Exception:
+        set_processing_status(package_version, PackageVersionProcessingStatus.failed)
+        raise
+
+    set_processing_status(package_version, PackageVersionProcessingStatus.complete)
+    return package_version.processing_status
+
+
+# Versions are retried until they've been attempted this many times
+MAX_PROCESSING_ATTEMPTS = 3
+# Number of versions scheduled for processing per sweep, which bounds the
+# load caused by a backlog of unprocessed versions
+PROCESSING_RETRY_BATCH_SIZE = 200
+# Pending versions are left alone for this long after being uploaded, as
+# their processing has been scheduled by the upload
+PROCESSING_RETRY_GRACE_PERIOD = timedelta(hours=1)
+
+
+@shared_task(
+    queue=CeleryQueues.BackgroundTask,
+    name="thunderstore.repository.tasks.retry_package_version_processing",
+)
+def retry_package_version_processing() -> int:
+    """
+    Schedule processing of the versions whose processing failed or never ran,
+    e.g. as they predate it or the task was lost.
+
+    :return: The number of versions scheduled
+    """
+    threshold = timezone.now() - PROCESSING_RETRY_GRACE_PERIOD
+    version_ids = list(
+        PackageVersion.objects.filter(
+            Q(processing_status=PackageVersionProcessingStatus.failed)
+            | Q(
+                processing_status=PackageVersionProcessingStatus.pending,
+                date_created__lt=threshold,
+            ),
+            processing_attempts__lt=MAX_PROCESSING_ATTEMPTS,
+        )
+        .order_by("-date_created")
+        .values_list("pk", flat=True)[:PROCESSING_RETRY_BATCH_SIZE]
+    )
+    for version_id in version_ids:
+        process_package_version.delay(version_id)
+    return len(version_ids)
+
+
+def set_processing_status(package_version: PackageVersion, status: str) -> None:
+    # Updated without save() as the status doesn't concern the post_save
+    # handlers, which e.g. invalidate caches.
+    PackageVersion.objects.filter(pk=package_version.pk).update(
+        processing_status=status,
+    )
+    package_version.processing_status = status
+
+
+@shared_task(
+    queue=CeleryQueues.BackgroundTask,
+    name="thunderstore.repository.tasks.update_total_used_disk_space",
+)
+def update_total_used_disk_space() -> int:
+    """
+    Reconcile the running total of package file sizes with the database, as
+    e.g. rolled back uploads might have left it off.
+    """
+    return PackageVersion.update_total_used_disk_space()
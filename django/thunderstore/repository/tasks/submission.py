@@ -1,12 +1,16 @@
 import traceback
 from datetime import timedelta
+from typing import Optional
 
 from celery import shared_task
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
+from redis.exceptions import LockError
 
+from thunderstore.cache.utils import get_cache
 from thunderstore.core.exception_handler import serialize_validation_error
 from thunderstore.core.settings import CeleryQueues
 from thunderstore.core.utils import capture_exception
@@ -18,9 +22,16 @@ from thunderstore.repository.package_upload import PackageUploadForm
 from thunderstore.usermedia.s3_client import get_s3_client
 from thunderstore.usermedia.s3_upload import download_file
 
+cache = get_cache("legacy")
+
+# The processing lock outlives the task TTL, after which the submission may be
+# scheduled again, so that a requeued task can't start processing it while
+# the previous one is still running.
+SUBMISSION_LOCK_TTL = AsyncPackageSubmission.TASK_TTL * 3
+
 
 @shared_task(
-    queue=CeleryQueues.BackgroundTask,
+    queue=CeleryQueues.PackageSubmission,
     name="thunderstore.repository.tasks.process_package_submission",
 )
 def process_submission_task(submission_id: str):
@@ -45,38 +56,89 @@ def cleanup_submissions():
     ).delete()
 
 
-@transaction.atomic
 def process_submission_idempotent(submission_id: str) -> bool:
     """
     Process a submission by ID with idempotency guarantees.
 
+    The upload is fetched and validated without holding a database
+    transaction open. A lock prevents processing the same submission
+    concurrently, and the submission's state is re-checked under a row
+    lock before any results are persisted, in case the lock has expired.
+    The created version and the finished state are persisted atomically.
+
     :param submission_id: The submission to process
     :return: 'True' if processing was needed, 'False' if it could be skipped.
     """
-    submission = (
-        AsyncPackageSubmission.objects.select_for_update(skip_locked=True)
-        .filter(pk=submission_id, status=PackageSubmissionStatus.PENDING)
-        .first()
+    lock = cache.lock(
+        f"lock.submission.{submission_id}",
+        timeout=SUBMISSION_LOCK_TTL,
     )
-    if not submission:
+    if not lock.acquire(blocking=False):
         return False
 
     try:
-        _process_submission(submission)
-    except Exception as e:
-        capture_exception(e)
-        submission.task_error = traceback.format_exc()
+        submission = AsyncPackageSubmission.objects.filter(
+            pk=submission_id,
+            status=PackageSubmissionStatus.PENDING,
+        ).first()
+        if not submission:
+            return False
+
+        try:
+            _process_submission(submission)
+        except Exception as e:
+            capture_exception(e)
+            submission.task_error = traceback.format_exc()
+        finally:
+            _finish_submission(submission)
     finally:
-        submission.status = PackageSubmissionStatus.FINISHED
-        submission.datetime_finished = timezone.now()
-        submission.save()
+        try:
+            lock.release()
+        except LockError:  # pragma: no cover
+            # The lock expired while the submission was being processed
+            pass
 
     return True
 
 
+def _lock_pending_submission(submission_id: str) -> bool:
+    return (
+        AsyncPackageSubmission.objects.select_for_update()
+        .filter(pk=submission_id, status=PackageSubmissionStatus.PENDING)
+        .exists()
+    )
+
+
+def _mark_finished(submission: AsyncPackageSubmission):
+    submission.status = PackageSubmissionStatus.FINISHED
+    submission.datetime_finished = timezone.now()
+    submission.save()
+
+
+@transaction.atomic
+def _finish_submission(submission: AsyncPackageSubmission):
+    if not _lock_pending_submission(submission.pk):
+        # Finished by another run while this one was processing
+        return
+    _mark_finished(submission)
+
+
 def _process_submission(submission: AsyncPackageSubmission):
+    with _fetch_submission_file(submission) as file:
+        form = _validate_submission(submission, file)
+        if form is not None:
+            _persist_submission(submission, form)
+
+
+def _fetch_submission_file(submission: AsyncPackageSubmission) -> UploadedFile:
     client = get_s3_client()
-    file = download_file(submission.owner, client, submission.file)
+    return download_file(submission.owner, client, submission.file)
+
+
+def _validate_submission(
+    submission: AsyncPackageSubmission,
+    file: UploadedFile,
+) -> Optional[PackageUploadForm]:
     data = submission.form_data
 
     form = PackageUploadForm(
@@ -92,10 +154,21 @@ def _process_submission(submission: AsyncPackageSubmission):
     )
 
     if form.is_valid():
-        try:
-            submission.created_version = form.save()
-        except ValidationError as e:
-            submission.form_errors = serialize_validation_error(e)
-    else:
-        error = ValidationError(form.errors)
-        submission.form_errors = serialize_validation_error(error)
+        return form
+
+    error = ValidationError(form.errors)
+    submission.form_errors = serialize_validation_error(error)
+    return None
+
+
+@transaction.atomic
+def _persist_submission(submission: AsyncPackageSubmission, form: PackageUploadForm):
+    if not _lock_pending_submission(submission.pk):
+        return
+    try:
+        submission.created_version = form.save()
+    except ValidationError as e:
+        submission.form_errors = serialize_validation_error(e)
+    # Finished in the same transaction as the version is created in, so that
+    # the submission can't be left pending for a version that already exists
+    _mark_finished(submission)
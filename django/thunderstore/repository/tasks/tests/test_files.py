@@ -1,8 +1,20 @@
+from zipfile import BadZipFile
+
 import pytest
 from django.core.files.base import ContentFile
+from django.utils import timezone
 
+from thunderstore.markdown.templatetags.markdownify import cache, get_render_cache_key
+from thunderstore.repository.consts import PackageVersionProcessingStatus
 from thunderstore.repository.factories import PackageVersionFactory
-from thunderstore.repository.tasks.files import extract_package_version_file_tree
+from thunderstore.repository.models import PackageVersion
+from thunderstore.repository.tasks.files import (
+    MAX_PROCESSING_ATTEMPTS,
+    PROCESSING_RETRY_GRACE_PERIOD,
+    extract_package_version_file_tree,
+    process_package_version,
+    retry_package_version_processing,
+)
 from thunderstore.storage.models import DataBlobGroup
 
 
@@ -24,3 +36,85 @@ def test_repository_tasks_extract_package_version_file_tree(
 
     rerun_id = extract_package_version_file_tree.delay(version.pk).wait()
     assert rerun_id == group_id
+
+
+@pytest.mark.django_db
+def test_repository_tasks_process_package_version(
+    manifest_v1_package_bytes: bytes,
+):
+    file = ContentFile(manifest_v1_package_bytes, name="package.zip")
+    version = PackageVersionFactory(
+        file=file,
+        file_size=len(manifest_v1_package_bytes),
+        readme="# Test readme",
+    )
+    assert version.processing_status == PackageVersionProcessingStatus.pending
+
+    process_package_version.delay(version.pk).wait()
+    version.refresh_from_db()
+    assert version.processing_status == PackageVersionProcessingStatus.complete
+    assert version.file_tree.entries.count() == 3
+    assert cache.get(get_render_cache_key(version.readme)) is not None
+
+    # Completed versions are not processed again
+    file_tree_id = version.file_tree_id
+    process_package_version.delay(version.pk).wait()
+    version.refresh_from_db()
+    assert version.file_tree_id == file_tree_id
+
+
+@pytest.mark.django_db
+def test_repository_tasks_process_package_version_failure():
+    file = ContentFile(b"not a zip", name="package.zip")
+    version = PackageVersionFactory(file=file, file_size=9)
+
+    with pytest.raises(BadZipFile):
+        process_package_version.delay(version.pk).wait()
+    version.refresh_from_db()
+    assert version.processing_status == PackageVersionProcessingStatus.failed
+    assert version.file_tree is None
+
+
+@pytest.mark.django_db
+def test_repository_tasks_process_package_version_force(
+    manifest_v1_package_bytes: bytes,
+    mocker,
+):
+    file = ContentFile(manifest_v1_package_bytes, name="package.zip")
+    version = PackageVersionFactory(file=file, file_size=len(manifest_v1_package_bytes))
+    process_package_version.delay(version.pk).wait()
+    render = mocker.patch(
+        "thunderstore.repository.tasks.files.precompute_rendered_markdown"
+    )
+
+    process_package_version.delay(version.pk).wait()
+    assert render.call_count == 0
+
+    process_package_version.delay(version.pk, force=True).wait()
+    assert render.call_count == 1
+    version.refresh_from_db()
+    assert version.processing_status == PackageVersionProcessingStatus.complete
+    assert version.processing_attempts == 2
+
+
+@pytest.mark.django_db
+def test_repository_tasks_retry_package_version_processing(mocker):
+    delay = mocker.patch(
+        "thunderstore.repository.tasks.files.process_package_version.delay"
+    )
+    Status = PackageVersionProcessingStatus
+    failed = PackageVersionFactory(processing_status=Status.failed)
+    exhausted = PackageVersionFactory(
+        processing_status=Status.failed,
+        processing_attempts=MAX_PROCESSING_ATTEMPTS,
+    )
+    PackageVersionFactory(processing_status=Status.complete)
+    PackageVersionFactory(processing_status=Status.pending)
+    stale = PackageVersionFactory(processing_status=Status.pending)
+    PackageVersion.objects.filter(pk=stale.pk).update(
+        date_created=timezone.now() - PROCESSING_RETRY_GRACE_PERIOD * 2,
+    )
+
+    assert retry_package_version_processing() == 2
+    assert {x.args[0] for x in delay.call_args_list} == {failed.pk, stale.pk}
+    assert exhausted.pk not in {x.args[0] for x in delay.call_args_list}
@@ -1,12 +1,15 @@
 import pytest
 
+from thunderstore.cache.utils import get_cache
 from thunderstore.repository.models import (
     AsyncPackageSubmission,
     PackageSubmissionStatus,
     Team,
     TeamMember,
+    TeamMemberRole,
 )
 from thunderstore.repository.tasks.submission import (
+    SUBMISSION_LOCK_TTL,
     _process_submission,
     process_submission_idempotent,
 )
@@ -53,3 +56,74 @@ def test_process_submission_form_save_errors(
     # Team is set but filtered out because the user isn't a member of it, so
     # we expect to see errors claiming the team is not set.
     assert "A team must be selected" in str(async_package_submission.form_errors)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_submission_skips_locked_submission(
+    async_package_submission: AsyncPackageSubmission,
+):
+    lock = get_cache("legacy").lock(
+        f"lock.submission.{async_package_submission.pk}",
+        timeout=60,
+    )
+    assert lock.acquire(blocking=False)
+    try:
+        assert process_submission_idempotent(async_package_submission.pk) is False
+    finally:
+        lock.release()
+
+    async_package_submission.refresh_from_db()
+    assert async_package_submission.status == PackageSubmissionStatus.PENDING
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_submission_does_not_overwrite_concurrent_result(
+    async_package_submission: AsyncPackageSubmission,
+    mocker,
+):
+    def finish_concurrently(submission: AsyncPackageSubmission):
+        AsyncPackageSubmission.objects.filter(pk=submission.pk).update(
+            status=PackageSubmissionStatus.FINISHED,
+            form_errors={"concurrent": True},
+        )
+        submission.form_errors = {"overwritten": True}
+
+    mocker.patch(
+        "thunderstore.repository.tasks.submission._process_submission",
+        side_effect=finish_concurrently,
+    )
+
+    assert process_submission_idempotent(async_package_submission.pk) is True
+    async_package_submission.refresh_from_db()
+    assert async_package_submission.form_errors == {"concurrent": True}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_submission_finishes_with_created_version(
+    user,
+    team: Team,
+    community,
+    manifest_v1_package_upload_id: str,
+    mocker,
+):
+    TeamMember.objects.create(user=user, team=team, role=TeamMemberRole.owner)
+    submission = AsyncPackageSubmission.objects.create(
+        owner=user,
+        file_id=manifest_v1_package_upload_id,
+        form_data={
+            "author_name": team.name,
+            "communities": [community.identifier],
+        },
+    )
+    # The separate finishing step is only a fallback for failed submissions
+    mocker.patch("thunderstore.repository.tasks.submission._finish_submission")
+
+    assert process_submission_idempotent(submission.pk) is True
+    submission.refresh_from_db()
+    assert submission.status == PackageSubmissionStatus.FINISHED
+    assert submission.datetime_finished is not None
+    assert submission.created_version is not None
+
+
+def test_process_submission_lock_outlives_task_ttl():
+    assert SUBMISSION_LOCK_TTL > AsyncPackageSubmission.TASK_TTL
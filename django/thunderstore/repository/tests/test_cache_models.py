@@ -10,9 +10,12 @@ from storages.backends.s3boto3 import S3Boto3Storage
 from thunderstore.cache.storage import get_cache_storage
 from thunderstore.community.factories import CommunityFactory, PackageListingFactory
 from thunderstore.community.models import Community
+from thunderstore.repository.factories import PackageRatingFactory
 from thunderstore.repository.models.cache import (
     APIV1ChunkedPackageCache,
+    APIV1ChunkedPackageCacheEntry,
     APIV1PackageCache,
+    listing_to_json,
 )
 from thunderstore.storage.models import DataBlob, DataBlobGroup
 from thunderstore.utils.makemigrations import StubStorage
@@ -96,6 +99,17 @@ def test_api_v1_packge_cache_update_for_community(community: Community) -> None:
     assert result == content
 
 
+@pytest.mark.django_db
+def test_api_v1_packge_cache_update_for_community_streamed(
+    community: Community,
+) -> None:
+    chunks = [b"[", b'{"a": 1}', b",", b'{"b": 2}', b"]"]
+    latest = APIV1PackageCache.update_for_community(community, content=iter(chunks))
+    with gzip.GzipFile(fileobj=latest.data, mode="r") as f:
+        result = f.read()
+    assert result == b"".join(chunks)
+
+
 @pytest.mark.django_db
 def test_api_v1_package_cache_drop_stale_cache(
     freezer: FrozenDateTimeFactory, settings: Any
@@ -354,3 +368,92 @@ def test_api_v1_chunked_package_cache__when_no_changes_in_packages__reuses_old_b
     assert cache1.chunks.entries.get().blob.pk == cache2.chunks.entries.get().blob.pk
     assert DataBlobGroup.objects.count() == 2  # While blobs are shared, groups are not
     assert cache1.chunks.pk != cache2.chunks.pk
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("listing_count", (0, 1, 3))
+def test_api_v1_chunked_package_cache__incremental_update__matches_full_update(
+    community: Community,
+    listing_count: int,
+) -> None:
+    for _ in range(listing_count):
+        PackageListingFactory(
+            community_=community,
+            package_version_kwargs={"is_active": True},
+        )
+
+    APIV1ChunkedPackageCache.update_for_community(community)
+    full = APIV1ChunkedPackageCache.get_latest_for_community(community)
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    incremental = APIV1ChunkedPackageCache.get_latest_for_community(community)
+
+    assert full.pk != incremental.pk
+    assert full.index.pk == incremental.index.pk
+    assert APIV1ChunkedPackageCacheEntry.objects.count() == listing_count
+
+
+@pytest.mark.django_db
+def test_api_v1_chunked_package_cache__incremental_update__skips_unchanged_listings(
+    community: Community,
+    mocker,
+) -> None:
+    PackageListingFactory(
+        community_=community,
+        package_version_kwargs={"is_active": True},
+    )
+    serializer = mocker.patch(
+        "thunderstore.repository.models.cache.listing_to_json",
+        wraps=listing_to_json,
+    )
+
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    assert serializer.call_count == 1
+
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    assert serializer.call_count == 1
+
+
+@pytest.mark.django_db
+def test_api_v1_chunked_package_cache__incremental_update__rebuilds_changed_listings(
+    community: Community,
+) -> None:
+    listing = PackageListingFactory(
+        community_=community,
+        package_version_kwargs={"is_active": True},
+    )
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    cache1 = APIV1ChunkedPackageCache.get_latest_for_community(community)
+    marker1 = APIV1ChunkedPackageCacheEntry.objects.get().change_marker
+
+    PackageRatingFactory(package=listing.package)
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    cache2 = APIV1ChunkedPackageCache.get_latest_for_community(community)
+    marker2 = APIV1ChunkedPackageCacheEntry.objects.get().change_marker
+
+    assert marker1 != marker2
+    assert cache1.index.pk != cache2.index.pk
+    chunk = APIV1ChunkedPackageCache.get_blob_content(cache2.chunks.entries.get().blob)
+    assert chunk[0]["rating_score"] == 1
+
+
+@pytest.mark.django_db
+def test_api_v1_chunked_package_cache__incremental_update__rebuilds_expired_entries(
+    community: Community,
+    mocker,
+) -> None:
+    PackageListingFactory(
+        community_=community,
+        package_version_kwargs={"is_active": True},
+    )
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    APIV1ChunkedPackageCacheEntry.objects.update(
+        datetime_updated=timezone.now() - APIV1ChunkedPackageCacheEntry.MAX_AGE,
+    )
+    serializer = mocker.patch(
+        "thunderstore.repository.models.cache.listing_to_json",
+        wraps=listing_to_json,
+    )
+
+    APIV1ChunkedPackageCache.update_for_community(community, incremental=True)
+    assert serializer.call_count == 1
+    assert APIV1ChunkedPackageCacheEntry.objects.count() == 1
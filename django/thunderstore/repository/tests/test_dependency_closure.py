@@ -0,0 +1,66 @@
+import pytest
+
+from thunderstore.repository.factories import PackageVersionFactory
+from thunderstore.repository.models import PackageVersionDependencyClosure
+
+
+@pytest.mark.django_db
+def test_dependency_closure_resolve() -> None:
+    a, b, c, d = PackageVersionFactory.create_batch(4)
+    a.dependencies.set([b, c])
+    b.dependencies.set([d])
+    c.dependencies.set([d])
+    d.dependencies.set([a])  # Cycles don't prevent resolution
+
+    closures = PackageVersionDependencyClosure.resolve([a.pk, b.pk])
+
+    assert closures == {a.pk: {b.pk, c.pk, d.pk}, b.pk: {d.pk, a.pk, c.pk}}
+
+
+@pytest.mark.django_db
+def test_dependency_closure_resolve_without_dependencies() -> None:
+    version = PackageVersionFactory()
+
+    assert PackageVersionDependencyClosure.resolve([version.pk]) == {version.pk: set()}
+    # The computed closure is stored even though it's empty
+    assert PackageVersionDependencyClosure.objects.filter(root=version).exists()
+
+
+@pytest.mark.django_db
+def test_dependency_closure_is_memoized(django_assert_num_queries) -> None:
+    a, b, c = PackageVersionFactory.create_batch(3)
+    a.dependencies.set([b])
+    b.dependencies.set([c])
+    PackageVersionDependencyClosure.resolve([a.pk])
+
+    with django_assert_num_queries(1):
+        assert PackageVersionDependencyClosure.resolve([a.pk]) == {a.pk: {b.pk, c.pk}}
+
+
+@pytest.mark.django_db
+def test_dependency_closure_invalidated_on_dependency_change() -> None:
+    a, b, c, d = PackageVersionFactory.create_batch(4)
+    a.dependencies.set([b])
+    b.dependencies.set([c])
+    PackageVersionDependencyClosure.resolve([a.pk, d.pk])
+
+    b.dependencies.add(d)
+    assert PackageVersionDependencyClosure.resolve([a.pk]) == {a.pk: {b.pk, c.pk, d.pk}}
+
+    c.dependants.clear()
+    assert PackageVersionDependencyClosure.resolve([a.pk]) == {a.pk: {b.pk, d.pk}}
+
+    # Unrelated closures are kept
+    assert PackageVersionDependencyClosure.objects.filter(root=d).exists()
+
+
+@pytest.mark.django_db
+def test_dependency_closure_invalidated_on_version_delete() -> None:
+    a, b, c = PackageVersionFactory.create_batch(3)
+    a.dependencies.set([b])
+    b.dependencies.set([c])
+    PackageVersionDependencyClosure.resolve([a.pk])
+
+    b.delete()
+
+    assert PackageVersionDependencyClosure.resolve([a.pk]) == {a.pk: set()}
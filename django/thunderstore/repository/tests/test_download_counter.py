@@ -0,0 +1,161 @@
+import json
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from thunderstore.repository.download_counter import (
+    PENDING_BUCKETS_KEY,
+    _get_redis,
+    flush_download_counters,
+    get_current_bucket,
+    get_pending_key,
+    get_processing_key,
+    record_download,
+)
+from thunderstore.repository.factories import PackageVersionFactory
+from thunderstore.repository.models import PackageVersion
+from thunderstore.ts_analytics.kafka import KafkaTopic
+
+
+def test_download_counter__get_current_bucket(settings: Any) -> None:
+    settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS = 60
+    assert get_current_bucket(0) == 0
+    assert get_current_bucket(59.9) == 0
+    assert get_current_bucket(60) == 1
+    assert get_current_bucket(6000) == 100
+
+
+@pytest.mark.django_db
+def test_download_counter__open_bucket_is_not_flushed(
+    package_version: PackageVersion,
+) -> None:
+    record_download(package_version.id)
+    assert flush_download_counters() == []
+    package_version.refresh_from_db()
+    assert package_version.downloads == 0
+
+
+@pytest.mark.django_db
+def test_download_counter__flush_applies_counts_in_bulk(freezer, settings) -> None:
+    versions = [PackageVersionFactory() for _ in range(3)]
+    for i, version in enumerate(versions):
+        for _ in range(i + 1):
+            record_download(version.id)
+    bucket = get_current_bucket()
+
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+    assert flush_download_counters() == [bucket]
+
+    for i, version in enumerate(versions):
+        version.refresh_from_db()
+        assert version.downloads == i + 1
+
+    redis = _get_redis()
+    assert not redis.exists(get_pending_key(bucket))
+    assert not redis.exists(get_processing_key(bucket))
+    assert not redis.sismember(PENDING_BUCKETS_KEY, bucket)
+
+    # Flushing again is a no-op
+    assert flush_download_counters() == []
+    versions[0].refresh_from_db()
+    assert versions[0].downloads == 1
+
+
+@pytest.mark.django_db
+def test_download_counter__flush_resumes_crashed_bucket(
+    package_version: PackageVersion,
+    freezer,
+    settings,
+    mocker,
+) -> None:
+    record_download(package_version.id)
+    record_download(package_version.id)
+    bucket = get_current_bucket()
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+
+    mocker.patch(
+        "thunderstore.repository.download_counter._apply_counts",
+        side_effect=RuntimeError("Crash"),
+    )
+    with pytest.raises(RuntimeError):
+        flush_download_counters()
+    mocker.stopall()
+
+    redis = _get_redis()
+    assert redis.exists(get_processing_key(bucket))
+    package_version.refresh_from_db()
+    assert package_version.downloads == 0
+
+    assert flush_download_counters() == [bucket]
+    package_version.refresh_from_db()
+    assert package_version.downloads == 2
+
+
+@pytest.mark.django_db
+def test_download_counter__flush_sends_analytics_events(
+    package_version: PackageVersion,
+    freezer,
+    settings,
+    mocker,
+) -> None:
+    client = mocker.Mock()
+    mocker.patch(
+        "thunderstore.ts_analytics.kafka.get_kafka_client",
+        return_value=client,
+    )
+    record_download(package_version.id)
+    record_download(package_version.id)
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+
+    flush_download_counters()
+    client.send_batch.assert_called_once()
+    messages = list(client.send_batch.call_args.args[0])
+    assert len(messages) == 2
+    topic, payload_string, key = messages[0]
+    assert topic == KafkaTopic.A_PACKAGE_DOWNLOAD_V1
+    assert json.loads(payload_string)["version_id"] == package_version.id
+
+
+@pytest.mark.django_db
+def test_download_counter__flush_does_not_reapply_committed_bucket(
+    package_version: PackageVersion,
+    freezer,
+    settings,
+    mocker,
+) -> None:
+    record_download(package_version.id)
+    record_download(package_version.id)
+    bucket = get_current_bucket()
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+
+    # Crash after the counts have been committed
+    mocker.patch(
+        "thunderstore.repository.download_counter._send_analytics_events",
+        side_effect=RuntimeError("Crash"),
+    )
+    with pytest.raises(RuntimeError):
+        flush_download_counters()
+    mocker.stopall()
+
+    redis = _get_redis()
+    assert redis.exists(get_processing_key(bucket))
+    package_version.refresh_from_db()
+    assert package_version.downloads == 2
+
+    # Downloads recorded into the bucket late are moved to the open bucket
+    redis.hincrby(get_pending_key(bucket), str(package_version.id), 1)
+    send_analytics = mocker.patch(
+        "thunderstore.repository.download_counter._send_analytics_events",
+    )
+
+    assert flush_download_counters() == [bucket]
+    package_version.refresh_from_db()
+    assert package_version.downloads == 2
+    send_analytics.assert_called_once_with(bucket, {package_version.id: 2})
+    assert not redis.exists(get_processing_key(bucket))
+
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+    assert flush_download_counters() == [bucket + 1]
+    package_version.refresh_from_db()
+    assert package_version.downloads == 3
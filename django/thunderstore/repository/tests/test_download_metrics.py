@@ -9,6 +9,7 @@ from django.utils import timezone
 from thunderstore.metrics.models import (
     PackageVersionDownloadEvent as TimeseriesDownloadEvent,
 )
+from thunderstore.repository.download_counter import flush_download_counters
 from thunderstore.repository.models import PackageVersion
 from thunderstore.repository.tasks.downloads import log_version_download
 
@@ -64,7 +65,9 @@ def test_download_metrics__can_log_download_event__rate_limit(
 @pytest.mark.django_db
 def test_download_metrics_log_download_event(
     package_version: PackageVersion,
+    settings: Any,
 ):
+    settings.USE_BATCHED_DOWNLOAD_COUNTER = False
     # assert TimeseriesDownloadEvent.objects.count() == 0
     assert package_version.downloads == 0
 
@@ -85,3 +88,24 @@ def test_download_metrics_log_download_event(
     #     == 2
     # )
     assert package_version.downloads == 2
+
+
+@pytest.mark.django_db
+def test_download_metrics_log_download_event_batched(
+    package_version: PackageVersion,
+    settings: Any,
+    freezer,
+):
+    settings.USE_BATCHED_DOWNLOAD_COUNTER = True
+    assert package_version.downloads == 0
+
+    PackageVersion.log_download_event(package_version.id, "127.0.0.1")
+    PackageVersion.log_download_event(package_version.id, "127.0.0.2")
+    PackageVersion.log_download_event(package_version.id, "127.0.0.2")
+    package_version.refresh_from_db()
+    assert package_version.downloads == 0
+
+    freezer.tick(timedelta(seconds=settings.DOWNLOAD_COUNTER_FLUSH_INTERVAL_SECONDS))
+    flush_download_counters()
+    package_version.refresh_from_db()
+    assert package_version.downloads == 2
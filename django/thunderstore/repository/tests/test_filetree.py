@@ -0,0 +1,86 @@
+import hashlib
+import io
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from thunderstore.repository import filetree
+from thunderstore.repository.filetree import create_file_tree_from_zip_data
+from thunderstore.storage.models import DataBlob
+
+
+def _create_zip(files: dict) -> io.BytesIO:
+    data = io.BytesIO()
+    with ZipFile(data, "w", ZIP_DEFLATED) as zf:
+        zf.writestr("plugins/", "")
+        for name, content in files.items():
+            zf.writestr(name, content)
+    data.seek(0)
+    return data
+
+
+@pytest.mark.django_db
+def test_create_file_tree_from_zip_data() -> None:
+    files = {
+        "README.md": b"# Readme",
+        "plugins/a.dll": b"duplicate",
+        "plugins/b.dll": b"duplicate",
+        "empty.txt": b"",
+    }
+
+    group = create_file_tree_from_zip_data("test", _create_zip(files))
+
+    assert group.is_complete
+    assert {e.name: e.data for e in group.entries.all()} == files
+    # Identical files are backed by the same blob
+    assert DataBlob.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_create_file_tree_from_zip_data_reuses_existing_blobs() -> None:
+    existing = DataBlob.get_or_create(b"existing")
+    files = {"old.txt": b"existing", "new.txt": b"new"}
+
+    group = create_file_tree_from_zip_data("test", _create_zip(files))
+
+    assert group.entries.get(name="old.txt").blob == existing
+    assert DataBlob.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_create_file_tree_from_zip_data_query_count() -> None:
+    small = _create_zip({f"{i}.txt": f"{i}".encode() for i in range(2)})
+    large = _create_zip({f"{i}.txt": f"{i}".encode() for i in range(50)})
+
+    with CaptureQueriesContext(connection) as small_ctx:
+        create_file_tree_from_zip_data("small", small)
+    with CaptureQueriesContext(connection) as large_ctx:
+        create_file_tree_from_zip_data("large", large)
+
+    assert len(large_ctx.captured_queries) == len(small_ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_create_file_tree_from_zip_data_uses_known_checksums(mocker) -> None:
+    files = {"README.md": b"# Readme", "plugins/a.dll": b"dll"}
+    checksums = {name: hashlib.sha256(data).hexdigest() for name, data in files.items()}
+    inspect_zip = mocker.spy(filetree, "inspect_zip")
+
+    group = create_file_tree_from_zip_data("test", _create_zip(files), checksums)
+
+    assert inspect_zip.call_count == 0
+    assert {e.name: e.data for e in group.entries.all()} == files
+
+
+@pytest.mark.django_db
+def test_create_file_tree_from_zip_data_inspects_unknown_entries(mocker) -> None:
+    files = {"README.md": b"# Readme", "plugins/a.dll": b"dll"}
+    checksums = {"README.md": hashlib.sha256(files["README.md"]).hexdigest()}
+    inspect_zip = mocker.spy(filetree, "inspect_zip")
+
+    group = create_file_tree_from_zip_data("test", _create_zip(files), checksums)
+
+    assert inspect_zip.call_count == 1
+    assert {e.name: e.data for e in group.entries.all()} == files
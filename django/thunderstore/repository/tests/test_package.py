@@ -5,6 +5,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 
 from conftest import TestUserTypes
 from thunderstore.community.consts import PackageListingReviewStatus
@@ -23,13 +24,18 @@ from thunderstore.permissions.models.tests._utils import (
     assert_visibility_is_not_visible,
     assert_visibility_is_public,
 )
-from thunderstore.repository.factories import PackageFactory, PackageVersionFactory
+from thunderstore.repository.factories import (
+    PackageFactory,
+    PackageRatingFactory,
+    PackageVersionFactory,
+)
 from thunderstore.repository.models import (
     Namespace,
     Package,
     PackageWiki,
     TeamMember,
     TeamMemberRole,
+    get_package_dependant_count,
     get_package_dependants,
 )
 from thunderstore.wiki.factories import WikiPageFactory
@@ -127,6 +133,47 @@ def test_get_package_dependants() -> None:
     )
 
 
+@pytest.mark.django_db
+def test_get_package_dependants_follows_latest_version() -> None:
+    target = PackageVersionFactory()
+    dependant = PackageVersionFactory(version_number="1.0.0")
+    dependant.dependencies.add(target)
+    assert list(get_package_dependants(target.package.pk)) == [dependant.package]
+
+    # Dependencies of older versions aren't considered
+    PackageVersionFactory(package=dependant.package, version_number="2.0.0")
+    assert not get_package_dependants(target.package.pk).exists()
+
+    # Removing the dependency from the latest version drops the dependant
+    dependant.package.latest.dependencies.add(target)
+    assert get_package_dependants(target.package.pk).exists()
+    dependant.package.latest.dependencies.clear()
+    assert not get_package_dependants(target.package.pk).exists()
+
+
+@pytest.mark.django_db
+def test_get_package_dependants_reverse_set() -> None:
+    target = PackageVersionFactory()
+    dependants = PackageVersionFactory.create_batch(2)
+    target.dependants.set(dependants)
+
+    assert set(get_package_dependants(target.package.pk)) == {
+        x.package for x in dependants
+    }
+
+
+@pytest.mark.django_db
+def test_get_package_dependant_count_in_community() -> None:
+    target = PackageVersionFactory()
+    listed = PackageListingFactory()
+    unlisted = PackageVersionFactory()
+    listed.package.latest.dependencies.add(target)
+    unlisted.dependencies.add(target)
+
+    assert get_package_dependant_count(target.package.pk) == 2
+    assert get_package_dependant_count(target.package.pk, listed.community) == 1
+
+
 @pytest.mark.django_db
 def test_package_deprecate() -> None:
     package: Package = PackageFactory(is_deprecated=False)
@@ -543,3 +590,38 @@ def test_package_is_unavailable_no_version() -> None:
     )
 
     assert package.is_unavailable(community) is True
+
+
+@pytest.mark.django_db
+def test_package_counters_are_maintained() -> None:
+    version = PackageVersionFactory(downloads=5)
+    package = Package.objects.get(pk=version.package.pk)
+    assert (package.total_downloads, package.rating_score) == (5, 0)
+
+    PackageVersionFactory(package=package, downloads=20, version_number="1.0.1")
+    rating = PackageRatingFactory(package=package)
+    PackageRatingFactory(package=package)
+    rating.delete()
+
+    # Saving an outdated instance doesn't revert the counters
+    package.is_pinned = True
+    package.save()
+
+    package.refresh_from_db()
+    assert package.is_pinned
+    assert (package.total_downloads, package.rating_score) == (25, 1)
+
+
+@pytest.mark.django_db
+def test_reconcile_package_counters_command() -> None:
+    listing = PackageListingFactory(package_version_kwargs={"downloads": 5})
+    PackageRatingFactory(package=listing.package)
+    Package.objects.update(total_downloads=0, rating_score=0)
+    PackageListing.objects.update(download_count=0, rating_count=0)
+
+    call_command("reconcile_package_counters")
+
+    package = Package.objects.get(pk=listing.package_id)
+    listing.refresh_from_db()
+    assert (package.total_downloads, package.rating_score) == (5, 1)
+    assert (listing.download_count, listing.rating_count) == (5, 1)
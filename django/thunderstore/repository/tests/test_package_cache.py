@@ -1,6 +1,6 @@
 import pytest
 
-from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
 
 
 @pytest.mark.django_db
@@ -21,7 +21,11 @@ def test_package_cache_is_invalidated_on_version_hidden(package_version, mocker)
     )
     package_version.is_active = False
     package_version.save()
-    mocked_invalidate_cache.assert_called_with(CacheBustCondition.any_package_updated)
+    package = package_version.package
+    mocked_invalidate_cache.assert_called_with(
+        CacheBustCondition.any_package_updated,
+        [CacheTag.package(package.pk), CacheTag.team(package.owner_id)],
+    )
 
 
 @pytest.mark.django_db
@@ -30,4 +34,10 @@ def test_package_cache_is_invalidated_on_listing_delete(active_package_listing,
         "thunderstore.community.models.package_listing.invalidate_cache_on_commit_async"
     )
     active_package_listing.delete()
-    mocked_invalidate_cache.assert_called_with(CacheBustCondition.any_package_updated)
+    mocked_invalidate_cache.assert_called_with(
+        CacheBustCondition.any_package_updated,
+        [
+            CacheTag.community(active_package_listing.community.identifier),
+            CacheTag.package(active_package_listing.package_id),
+        ],
+    )
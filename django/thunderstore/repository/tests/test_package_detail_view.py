@@ -1,8 +1,12 @@
 from unittest.mock import PropertyMock, patch
 
 import pytest
+from django.test import Client
 from django.urls import reverse
 
+from thunderstore.frontend.templatetags.encode_props import encode_props
+from thunderstore.repository.views.package.detail import PackageDetailView
+
 PERMISSION_KEYS = [
     "show_management_panel",
     "show_listing_admin_link",
@@ -80,7 +84,7 @@ def test_package_detail_view_permission_keys_in_context(
 
     response = client.get(url, HTTP_HOST=community_site.site.domain)
     context = response.context[0]
-    management_panel_props = context.get("management_panel_props", {})
+    management_panel_props = context["management_panel_props"]()
 
     assert response.status_code == 200
 
@@ -195,7 +199,82 @@ def test_package_detail_view_management_panel_props(
     with patch(path, new_callable=PropertyMock) as mock_permissions_checker_function:
         mock_permissions_checker_function.return_value = return_value
         response = client.get(url, HTTP_HOST=community_site.site.domain)
+        context = response.context[0]
+        management_panel_props = context["management_panel_props"]()
 
-    context = response.context[0]
-    management_panel_props = context["management_panel_props"]
     assert management_panel_props[management_panel_prop_key] == return_value
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("can_manage", (False, True))
+def test_package_detail_view_management_panel_props_are_lazy(
+    can_manage: bool,
+    client,
+    active_package_listing,
+    community_site,
+    mocker,
+):
+    """
+    Test that the management panel props, which query the categories, are only
+    built when the panel is shown.
+    """
+
+    owner = active_package_listing.package.owner
+    package = active_package_listing.package
+    url = get_package_detail_view_url(owner=owner.name, name=package.name)
+    get_management_panel = mocker.spy(PackageDetailView, "get_management_panel")
+
+    path = "thunderstore.repository.views.package.detail.PermissionsChecker.can_manage"
+    with patch(path, new_callable=PropertyMock) as mock_can_manage:
+        mock_can_manage.return_value = can_manage
+        response = client.get(url, HTTP_HOST=community_site.site.domain)
+
+    assert response.status_code == 200
+    assert get_management_panel.call_count == int(can_manage)
+
+
+@pytest.mark.django_db
+def test_package_detail_view_renders_cached_fragments(
+    client,
+    active_package_listing,
+    community_site,
+    mocker,
+):
+    owner = active_package_listing.package.owner
+    package = active_package_listing.package
+    url = get_package_detail_view_url(owner=owner.name, name=package.name)
+
+    first = client.get(url, HTTP_HOST=community_site.site.domain)
+    assert first.context[0]["fragment_variant"] == "public"
+
+    mocked_count = mocker.patch(
+        "thunderstore.repository.views.package.detail.get_package_dependant_count"
+    )
+    second = Client().get(url, HTTP_HOST=community_site.site.domain)
+
+    assert second.status_code == 200
+    mocked_count.assert_not_called()
+    # The report button props carry the CSRF token of each user
+    report_button_props = second.context[0]["report_button_props"]
+    assert first.context[0]["report_button_props"] != report_button_props
+    assert encode_props(report_button_props).encode() in second.content
+
+
+@pytest.mark.django_db
+def test_package_detail_view_fragment_variant_varies_by_user_flags(
+    client,
+    active_package_listing,
+    community_site,
+    mocker,
+):
+    owner = active_package_listing.package.owner
+    package = active_package_listing.package
+    url = get_package_detail_view_url(owner=owner.name, name=package.name)
+    mocker.patch(
+        "thunderstore.repository.views.package.detail.get_request_user_flags",
+        return_value=["flag_b", "flag_a"],
+    )
+
+    response = client.get(url, HTTP_HOST=community_site.site.domain)
+
+    assert response.context[0]["fragment_variant"] == "flag_a,flag_b"
@@ -9,9 +9,13 @@ import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from thunderstore.community.models import PackageCategory, PackageListing
+from thunderstore.repository import filetree
+from thunderstore.repository.consts import PackageVersionProcessingStatus
+from thunderstore.repository.filetree import get_file_checksums
 from thunderstore.repository.models import Team
 from thunderstore.repository.package_formats import PackageFormats
 from thunderstore.repository.package_upload import PackageUploadForm
+from thunderstore.repository.tasks.files import process_package_version
 
 
 def _build_package(
@@ -27,7 +31,7 @@ def _build_package(
 @pytest.mark.django_db
 @pytest.mark.parametrize("changelog", (None, "# Test changelog"))
 def test_package_upload(
-    user, manifest_v1_data, package_icon_bytes: bytes, community, changelog
+    user, manifest_v1_data, package_icon_bytes: bytes, community, changelog, mocker
 ):
     readme = "# Test readme"
     manifest = json.dumps(manifest_v1_data).encode("utf-8")
@@ -59,7 +63,16 @@ def test_package_upload(
     assert version.format_spec == PackageFormats.get_active_format()
     assert version.package.namespace == team.get_namespace()
     assert version.package.namespace.name == team.name
-    assert version.file_tree is not None
+    assert version.file_tree is None
+    assert version.processing_status == PackageVersionProcessingStatus.pending
+    # The checksums computed during validation are reused by the processing
+    assert set(get_file_checksums(version.pk)) == {name for name, _ in files}
+    inspect_zip = mocker.spy(filetree, "inspect_zip")
+    process_package_version(version.pk)
+    version.refresh_from_db()
+    assert inspect_zip.call_count == 0
+    assert get_file_checksums(version.pk) is None
+    assert version.processing_status == PackageVersionProcessingStatus.complete
     assert version.file_tree.entries.count() == 3 if changelog is None else 4
     assert version.installers.count() == 0
 
@@ -109,7 +122,11 @@ def test_package_upload_with_extra_data(
     assert listing.categories.count() == 1
     assert listing.categories.first() == category
     assert listing.has_nsfw_content is True
-    assert version.file_tree is not None
+    assert version.file_tree is None
+    assert version.processing_status == PackageVersionProcessingStatus.pending
+    process_package_version(version.pk)
+    version.refresh_from_db()
+    assert version.processing_status == PackageVersionProcessingStatus.complete
     assert version.file_tree.entries.count() == 3 if changelog is None else 4
     assert version.installers.count() == 0
 
@@ -147,7 +164,11 @@ def test_package_upload_with_installers(
     assert version.format_spec == PackageFormats.get_active_format()
     assert version.package.namespace == team.get_namespace()
     assert version.package.namespace.name == team.name
-    assert version.file_tree is not None
+    assert version.file_tree is None
+    assert version.processing_status == PackageVersionProcessingStatus.pending
+    process_package_version(version.pk)
+    version.refresh_from_db()
+    assert version.processing_status == PackageVersionProcessingStatus.complete
     assert version.file_tree.entries.count() == 3
     assert version.installers.count() == 1
     assert version.installers.first() == package_installer
@@ -14,8 +14,14 @@ from thunderstore.permissions.models.tests._utils import (
 )
 from thunderstore.repository.consts import PackageVersionReviewStatus
 from thunderstore.repository.factories import PackageFactory, PackageVersionFactory
-from thunderstore.repository.models import PackageVersion, TeamMember, TeamMemberRole
+from thunderstore.repository.models import (
+    PackageVersion,
+    TeamMember,
+    TeamMemberRole,
+    parse_version_number,
+)
 from thunderstore.repository.package_formats import PackageFormats
+from thunderstore.repository.tasks.files import update_total_used_disk_space
 from thunderstore.webhooks.audit import AuditAction, AuditTarget
 
 
@@ -28,6 +34,24 @@ def test_get_total_used_disk_space():
     assert PackageVersion.get_total_used_disk_space() == p1.file_size + p2.file_size
 
 
+@pytest.mark.django_db
+def test_get_total_used_disk_space_running_total():
+    p1 = PackageVersionFactory.create(file_size=100)
+    assert PackageVersion.get_total_used_disk_space() == 100
+
+    # Served from the cache rather than aggregated
+    PackageVersion.objects.filter(pk=p1.pk).update(file_size=1)
+    assert PackageVersion.get_total_used_disk_space() == 100
+
+    p2 = PackageVersionFactory.create(file_size=50)
+    assert PackageVersion.get_total_used_disk_space() == 150
+    p2.delete()
+    assert PackageVersion.get_total_used_disk_space() == 100
+
+    assert update_total_used_disk_space() == 1
+    assert PackageVersion.get_total_used_disk_space() == 1
+
+
 @pytest.mark.django_db
 def test_package_version_queryset_active():
     p1 = PackageVersionFactory(is_active=True)
@@ -398,3 +422,41 @@ def test_package_version_is_unavailable(
     version = PackageVersionFactory(package=package, is_active=version_is_active)
 
     assert version.is_unavailable(community) == expected_is_unavailable
+
+
+@pytest.mark.parametrize(
+    ("version_number", "expected"),
+    [
+        ("1.0.0", (1, 0, 0)),
+        ("0.12.345", (0, 12, 345)),
+    ],
+)
+def test_parse_version_number(version_number: str, expected) -> None:
+    assert parse_version_number(version_number) == expected
+
+
+@pytest.mark.parametrize("version_number", ["1.0", "1.0.0.0", "1.0.a", "+1.0.0"])
+def test_parse_version_number_invalid(version_number: str) -> None:
+    assert parse_version_number(version_number) == (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_package_version_save_with_legacy_version_number() -> None:
+    version = PackageVersionFactory(version_number="1.0")
+    version.is_active = False
+    version.save()
+    version.refresh_from_db()
+    assert version.version_key == (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_package_version_order_by_version() -> None:
+    package = PackageFactory()
+    for version_number in ("1.9.0", "1.10.0", "0.9.11", "1.9.10"):
+        PackageVersionFactory(package=package, version_number=version_number)
+
+    assert list(
+        package.versions.order_by_version().values_list("version_number", flat=True)
+    ) == ["1.10.0", "1.9.10", "1.9.0", "0.9.11"]
+    package.refresh_from_db()
+    assert package.latest.version_number == "1.10.0"
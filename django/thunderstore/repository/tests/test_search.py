@@ -0,0 +1,103 @@
+import pytest
+
+from thunderstore.repository.factories import PackageVersionFactory, TeamFactory
+from thunderstore.repository.models import Package
+from thunderstore.repository.search import (
+    build_prefix_query,
+    filter_packages_by_search_query,
+    get_search_terms,
+)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    (
+        ("", []),
+        ("Fish_and_Birds", ["fish", "and", "birds"]),
+        ("  fish  birds ", ["fish", "birds"]),
+        ("foo:* & !bar | (baz)", ["foo", "bar", "baz"]),
+        ("Ülö-123", ["ülö", "123"]),
+    ),
+)
+def test_search_get_search_terms(query: str, expected) -> None:
+    assert get_search_terms(query) == expected
+
+
+def test_search_build_prefix_query_without_terms() -> None:
+    assert build_prefix_query("&:* !") is None
+    assert build_prefix_query("fish") is not None
+
+
+def _search(query: str):
+    return list(
+        filter_packages_by_search_query(query, Package.objects.all()).order_by(
+            "-search_rank", "pk"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_search_vector_is_maintained() -> None:
+    version = PackageVersionFactory(name="Fish_and_Birds", description="Cat food")
+    package = version.package
+
+    assert _search("fish birds") == [package]
+    assert _search("cat") == [package]
+    assert _search(package.owner.name) == [package]
+    assert _search("dog") == []
+
+    package.owner = TeamFactory(name="Doghouse")
+    package.save(update_fields=("owner",))
+    assert _search("dog") == [package]
+
+
+@pytest.mark.django_db
+def test_search_matches_name_substrings() -> None:
+    package = PackageVersionFactory(name="BepInExPack").package
+    assert _search("InEx") == [package]
+    assert _search("inex pack") == [package]
+    assert _search("inex cats") == []
+
+
+@pytest.mark.django_db
+def test_search_ranks_name_matches_first() -> None:
+    by_description = PackageVersionFactory(
+        name="Something", description="Adds a robot"
+    ).package
+    by_name = PackageVersionFactory(name="Robot_Arms", description="Arms").package
+    assert _search("robot") == [by_name, by_description]
+
+
+@pytest.mark.django_db
+def test_search_ignores_tsquery_syntax() -> None:
+    package = PackageVersionFactory(name="Fish_and_Birds").package
+    assert _search("fish:* & | !") == [package]
+
+
+@pytest.mark.django_db
+def test_search_vector_is_not_rebuilt_by_unrelated_saves(mocker) -> None:
+    package = Package.objects.get(pk=PackageVersionFactory().package.pk)
+    update_search_vector = mocker.spy(package, "update_search_vector")
+
+    package.is_active = False
+    package.save()
+    assert update_search_vector.call_count == 0
+
+    package.name = "Renamed"
+    package.save()
+    assert update_search_vector.call_count == 1
+    assert _search("renamed") == [package]
+
+
+@pytest.mark.django_db
+def test_package_save_after_refresh_writes_reverted_fields() -> None:
+    package = Package.objects.get(pk=PackageVersionFactory(name="Original").package.pk)
+    Package.objects.filter(pk=package.pk).update(name="Concurrent")
+    package.refresh_from_db(fields=("name",))
+    assert package.name == "Concurrent"
+
+    package.name = "Original"
+    package.save()
+    package.refresh_from_db()
+    assert package.name == "Original"
+    assert _search("original") == [package]
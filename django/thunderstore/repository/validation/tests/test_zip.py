@@ -1,9 +1,14 @@
+from hashlib import sha256
 from io import BytesIO
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 
-from thunderstore.repository.validation.zip import check_unsafe_paths, check_zero_offset
+from thunderstore.repository.validation.zip import (
+    check_unsafe_paths,
+    check_zero_offset,
+    inspect_zip,
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +36,36 @@ def test_zip_check_zero_offset(bogus_bytes: int, expected: bool):
 
     with ZipFile(buffer, "r") as zf:
         assert check_zero_offset(zf.infolist()) is expected
+
+
+def test_zip_inspect_zip():
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as zf:
+        zf.writestr("dir/", "")
+        zf.writestr("dir/foo.txt", "foo")
+        zf.writestr("manifest.json", "{}")
+
+    with ZipFile(buffer, "r") as zf:
+        result = inspect_zip(zf, extract=("manifest.json", "README.md"))
+
+    assert result.corrupted_file is None
+    assert [(x.info.filename, x.checksum_sha256) for x in result.entries] == [
+        ("dir/foo.txt", sha256(b"foo").hexdigest()),
+        ("manifest.json", sha256(b"{}").hexdigest()),
+    ]
+    assert result.files == {"manifest.json": b"{}"}
+
+
+def test_zip_inspect_zip_corrupted():
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", ZIP_STORED) as zf:
+        zf.writestr("foo.txt", "foo")
+        zf.writestr("bar.txt", "bar")
+    # Corrupt the content of bar.txt, leaving its header intact
+    data = buffer.getvalue().replace(b"bar.txtbar", b"bar.txtbaz")
+
+    with ZipFile(BytesIO(data), "r") as zf:
+        result = inspect_zip(zf)
+
+    assert result.corrupted_file == "bar.txt"
+    assert [x.info.filename for x in result.entries] == ["foo.txt"]
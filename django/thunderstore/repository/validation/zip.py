@@ -1,10 +1,70 @@
-from typing import List
-from zipfile import ZipInfo
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Collection, Dict, List, Optional
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
 from django.conf import settings
 
 from thunderstore.repository.models import Team
 
+CHUNK_SIZE = 1024 * 1024
+
+# Files read by the package upload validation
+PACKAGE_METADATA_FILES = ("manifest.json", "icon.png", "README.md", "CHANGELOG.md")
+
+
+@dataclass
+class ZipEntry:
+    info: ZipInfo
+    checksum_sha256: str
+
+
+@dataclass
+class ZipInspection:
+    """
+    Result of inspecting the contents of a zip file with inspect_zip.
+
+    :param entries: The file entries of the zip, excluding directories.
+    :param files: Content of the extracted files by name.
+    :param corrupted_file: Name of the first entry failing the CRC check,
+        similar to ZipFile.testzip. Inspection stops at that entry.
+    """
+
+    entries: List[ZipEntry] = field(default_factory=list)
+    files: Dict[str, bytes] = field(default_factory=dict)
+    corrupted_file: Optional[str] = None
+
+
+def inspect_zip(unzip: ZipFile, extract: Collection[str] = ()) -> ZipInspection:
+    """
+    Decompress every entry of the zip once, verifying its CRC, computing its
+    sha256 checksum and storing the content of the entries listed in
+    `extract`. Content is streamed in chunks, so only the extracted files
+    are held in memory.
+    """
+    result = ZipInspection()
+    for info in unzip.infolist():
+        if info.is_dir():
+            continue
+
+        checksum = sha256()
+        content = bytearray() if info.filename in extract else None
+        try:
+            # ZipExtFile verifies the CRC once the entry has been read in full
+            with unzip.open(info) as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    checksum.update(chunk)
+                    if content is not None:
+                        content.extend(chunk)
+        except BadZipFile:
+            result.corrupted_file = info.filename
+            return result
+
+        result.entries.append(ZipEntry(info, checksum.hexdigest()))
+        if content is not None:
+            result.files[info.filename] = bytes(content)
+    return result
+
 
 def check_unsafe_paths(infolist: List[ZipInfo]) -> bool:
     for entry in infolist:
@@ -5,9 +5,11 @@ from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
 from django.views.decorators.csrf import ensure_csrf_cookie
 
+from thunderstore.account.utils import get_request_user_flags
 from thunderstore.community.models import PackageCategory, PackageListing
 from thunderstore.core.types import UserType
 from thunderstore.core.utils import check_validity
+from thunderstore.repository.models import get_package_dependant_count
 from thunderstore.repository.views.mixins import PackageListingDetailView
 from thunderstore.repository.views.package._utils import (
     can_view_listing_admin,
@@ -99,6 +101,23 @@ class PackageDetailView(PackageListingDetailView):
     def csrf_token(self) -> str:
         return csrf.get_token(self.request)
 
+    @cached_property
+    def fragment_variant(self) -> str:
+        """
+        Identify the viewer dependent content of the cached page fragments.
+
+        Permission gated panels are rendered outside of the fragments, so
+        they only vary by the dynamic HTML entries selected by user flags.
+        Anonymous users and users without flags share the same variant.
+        """
+        return ",".join(sorted(get_request_user_flags(self.request))) or "public"
+
+    def get_dependants_string(self) -> str:
+        dependant_count = get_package_dependant_count(self.object.package.pk)
+        if dependant_count == 1:
+            return f"{dependant_count} other package depends on this package"
+        return f"{dependant_count} other packages depend on this package"
+
     def get_review_panel(self):
         if not self.permissions_checker.can_moderate:
             return None
@@ -109,6 +128,27 @@ class PackageDetailView(PackageListingDetailView):
             "packageListingId": self.object.pk,
         }
 
+    def get_management_panel(self):
+        def format_category(cat: PackageCategory):
+            return {"name": cat.name, "slug": cat.slug}
+
+        return {
+            "isDeprecated": self.object.package.is_deprecated,
+            "canDeprecate": self.permissions_checker.can_deprecate,
+            "canUndeprecate": self.permissions_checker.can_undeprecate,
+            "canUnlist": self.permissions_checker.can_unlist,
+            "canUpdateCategories": self.permissions_checker.can_manage_categories,
+            "csrfToken": self.csrf_token,
+            "currentCategories": [
+                format_category(x) for x in self.object.categories.all()
+            ],
+            "availableCategories": [
+                format_category(x)
+                for x in self.object.community.package_categories.all()
+            ],
+            "packageListingId": self.object.pk,
+        }
+
     def get_report_panel(self):
         from thunderstore.ts_reports.consts import REPORT_DESCRIPTION_MAX_LENGTH
 
@@ -123,19 +163,9 @@ class PackageDetailView(PackageListingDetailView):
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
 
-        package_listing = context["object"]
-        dependant_count = len(package_listing.package.dependants_list)
-
-        if dependant_count == 1:
-            dependants_string = (
-                f"{dependant_count} other package depends on this package"
-            )
-        else:
-            dependants_string = (
-                f"{dependant_count} other packages depend on this package"
-            )
-
-        context["dependants_string"] = dependants_string
+        # Only resolved by the template when the fragment isn't cached
+        context["dependants_string"] = self.get_dependants_string
+        context["fragment_variant"] = self.fragment_variant
         context["show_management_panel"] = self.permissions_checker.can_manage
         context[
             "show_listing_admin_link"
@@ -146,25 +176,8 @@ class PackageDetailView(PackageListingDetailView):
         context["show_review_status"] = self.permissions_checker.can_manage
         context["show_internal_notes"] = self.permissions_checker.can_moderate
 
-        def format_category(cat: PackageCategory):
-            return {"name": cat.name, "slug": cat.slug}
-
-        context["management_panel_props"] = {
-            "isDeprecated": package_listing.package.is_deprecated,
-            "canDeprecate": self.permissions_checker.can_deprecate,
-            "canUndeprecate": self.permissions_checker.can_undeprecate,
-            "canUnlist": self.permissions_checker.can_unlist,
-            "canUpdateCategories": self.permissions_checker.can_manage_categories,
-            "csrfToken": self.csrf_token,
-            "currentCategories": [
-                format_category(x) for x in package_listing.categories.all()
-            ],
-            "availableCategories": [
-                format_category(x)
-                for x in package_listing.community.package_categories.all()
-            ],
-            "packageListingId": package_listing.pk,
-        }
+        # Only resolved by the template when the panel is shown
+        context["management_panel_props"] = self.get_management_panel
         context["report_button_props"] = self.get_report_panel()
         context["review_panel_props"] = self.get_review_panel()
         return context
@@ -1,7 +1,7 @@
 from typing import List, Optional, Set, Tuple
 
 from django.core.exceptions import PermissionDenied
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery, Sum
+from django.db.models import Q, QuerySet
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
@@ -10,7 +10,7 @@ from django.utils.functional import cached_property
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.generic import ListView
 
-from thunderstore.cache.enums import CacheBustCondition
+from thunderstore.cache.enums import CacheBustCondition, CacheTag
 from thunderstore.cache.pagination import CachedPaginator
 from thunderstore.community.consts import PackageListingReviewStatus
 from thunderstore.community.models import (
@@ -21,6 +21,7 @@ from thunderstore.community.models import (
 from thunderstore.frontend.url_reverse import get_community_url_reverse_args
 from thunderstore.repository.mixins import CommunityMixin
 from thunderstore.repository.models import Team, get_package_dependants
+from thunderstore.repository.search import filter_packages_by_search_query
 from thunderstore.repository.views.package._utils import get_moderatable_communities
 
 # Should be divisible by 4 and 3
@@ -50,6 +51,9 @@ class PackageListSearchView(CommunityMixin, ListView):
     def get_cache_vary(self):
         return ""
 
+    def get_cache_tags(self) -> List[str]:
+        return [CacheTag.community(self.community_identifier)]
+
     def get_categories(self):
         return PackageCategory.objects.exclude(~Q(community=self.community))
 
@@ -84,6 +88,7 @@ class PackageListSearchView(CommunityMixin, ListView):
             ("newest", "Newest"),
             ("most-downloaded", "Most downloaded"),
             ("top-rated", "Top rated"),
+            ("relevance", "Relevance"),
         )
 
     def get_sections(self) -> QuerySet[PackageListingSection]:
@@ -176,54 +181,46 @@ class PackageListSearchView(CommunityMixin, ListView):
 
     def order_queryset(self, queryset):
         active_ordering = self.get_active_ordering()
+        if active_ordering == "relevance" and self.get_search_query():
+            return queryset.order_by(
+                "-is_pinned",
+                "is_deprecated",
+                "-search_rank",
+                "-date_updated",
+            )
         if active_ordering == "newest":
             return queryset.order_by(
-                "-package__is_pinned",
-                "package__is_deprecated",
+                "-is_pinned",
+                "is_deprecated",
                 "-package__date_created",
             )
         if active_ordering == "most-downloaded":
-            return queryset.annotate(
-                total_downloads=Sum("package__versions__downloads"),
-            ).order_by(
-                "-package__is_pinned",
-                "package__is_deprecated",
-                "-total_downloads",
-                "-package__date_updated",
+            return queryset.order_by(
+                "-is_pinned",
+                "is_deprecated",
+                "-download_count",
+                "-date_updated",
             )
         if active_ordering == "top-rated":
-            return queryset.annotate(
-                total_rating=Count("package__package_ratings"),
-            ).order_by(
-                "-package__is_pinned",
-                "package__is_deprecated",
-                "-total_rating",
-                "-package__date_updated",
+            return queryset.order_by(
+                "-is_pinned",
+                "is_deprecated",
+                "-rating_count",
+                "-date_updated",
             )
         return queryset.order_by(
-            "-package__is_pinned",
-            "package__is_deprecated",
-            "-package__date_updated",
+            "-is_pinned",
+            "is_deprecated",
+            "-date_updated",
         )
 
     def perform_search(self, queryset, search_query):
-        search_fields = (
-            "package__name",
-            "package__owner__name",
-            "package__latest__description",
+        return filter_packages_by_search_query(
+            search_query,
+            queryset,
+            package_prefix="package__",
         )
 
-        icontains_query = Q()
-        parts = [x for x in search_query.split(" ") if x]
-
-        for part in parts:
-            part_query = Q()
-            for field in search_fields:
-                part_query |= Q(**{f"{field}__icontains": part})
-            icontains_query &= part_query
-
-        return queryset.filter(icontains_query).distinct()
-
     def filter_approval_status(
         self, queryset: QuerySet[PackageListing]
     ) -> QuerySet[PackageListing]:
@@ -237,8 +234,6 @@ class PackageListSearchView(CommunityMixin, ListView):
             )
 
     def get_queryset(self):
-        listing_ref = PackageListing.objects.filter(pk=OuterRef("pk"))
-
         queryset = (
             self.get_base_queryset()
             .prefetch_related(
@@ -252,18 +247,6 @@ class PackageListSearchView(CommunityMixin, ListView):
                 "package__owner",
                 "community",
             )
-            .annotate(
-                _total_downloads=Subquery(
-                    listing_ref.annotate(
-                        downloads=Sum("package__versions__downloads"),
-                    ).values("downloads"),
-                ),
-                _rating_score=Subquery(
-                    listing_ref.annotate(
-                        ratings=Count("package__package_ratings"),
-                    ).values("ratings"),
-                ),
-            )
         )
 
         included_categories = self.filter_require_categories
@@ -284,7 +267,7 @@ class PackageListSearchView(CommunityMixin, ListView):
             queryset = queryset.exclude(has_nsfw_content=True)
 
         if not self.get_is_deprecated_included():
-            queryset = queryset.exclude(package__is_deprecated=True)
+            queryset = queryset.exclude(is_deprecated=True)
 
         queryset = self.filter_approval_status(queryset)
 
@@ -320,6 +303,7 @@ class PackageListSearchView(CommunityMixin, ListView):
             cache_key="repository.package_list.paginator",
             cache_vary=self.get_full_cache_vary(),
             cache_bust_condition=CacheBustCondition.any_package_updated,
+            cache_tags=self.get_cache_tags(),
             orphans=orphans,
             allow_empty_first_page=allow_empty_first_page,
         )
@@ -434,6 +418,10 @@ class PackageListByDependencyView(PackageListSearchView):
     def get_page_title(self):
         return f"Mods that depend on {self.package_listing.package.display_name}"
 
+    def get_cache_tags(self) -> List[str]:
+        # Dependants may be listed in other communities
+        return []
+
     def get_cache_vary(self):
         return f"dependencies-{self.package_listing.package.id}"
 
@@ -465,6 +453,10 @@ class PackageReviewListView(PackageListSearchView):
     def get_page_title(self):
         return "Review queue"
 
+    def get_cache_tags(self) -> List[str]:
+        # Spans all of the communities the user can moderate
+        return []
+
     def get_cache_vary(self):
         return f"review-queue"
 
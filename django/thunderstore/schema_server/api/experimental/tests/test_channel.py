@@ -133,6 +133,30 @@ def test_schema_server_api_channel_latest_get_cached(
     assert response.status_code == 304
 
 
+@pytest.mark.django_db
+def test_schema_server_api_channel_latest_get_etag(
+    api_client: APIClient,
+    schema_channel: SchemaChannel,
+):
+    version = schema_channel._add_new_version(b"Foo")
+    url = f"/api/experimental/schema/{schema_channel.identifier}/latest/"
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response["ETag"] == f'"{version.file.checksum_sha256}"'
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+    assert response["ETag"] == f'"{version.file.checksum_sha256}"'
+
+    schema_channel._add_new_version(b"Bar")
+    response = api_client.get(
+        url, HTTP_IF_NONE_MATCH=f'"{version.file.checksum_sha256}"'
+    )
+    assert response.status_code == 200
+    assert gzip_decompress(response.content) == b"Bar"
+
+
 @pytest.mark.django_db
 def test_schema_server_api_channel_latest_get_not_found_channel(
     api_client: APIClient,
@@ -1,8 +1,6 @@
 from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
 from django.http import HttpResponse
 from django.utils import timezone
-from django.utils.cache import get_conditional_response
-from django.utils.http import http_date
 from drf_yasg.openapi import TYPE_FILE, Schema
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
@@ -12,6 +10,7 @@ from rest_framework.parsers import FileUploadParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from thunderstore.core.utils import conditional_response
 from thunderstore.schema_server.models import SchemaChannel, SchemaFile
 
 
@@ -78,18 +77,19 @@ class SchemaChannelLatestApiView(APIView):
             raise NotFound()
         schema: SchemaFile = channel.latest.file
 
-        last_modified = int(schema.last_modified.timestamp())
-
-        # TODO: Add ETag support if useful
-        # Check if we can return a 304 response, otherwise return full content
-        response = get_conditional_response(request, last_modified=last_modified)
-        if response is None:
+        def get_response():
             # TODO: Stream directly from the S3 backend instead of buffering
             # TODO: Should we support decompressing for non-gzip capable clients?
             response = HttpResponse(
                 content=schema.data,
                 content_type=schema.content_type,
             )
-            response["Last-Modified"] = http_date(last_modified)
             response["Content-Encoding"] = schema.content_encoding
-        return response
+            return response
+
+        return conditional_response(
+            request,
+            get_response,
+            etag=schema.checksum_sha256,
+            last_modified=schema.last_modified,
+        )
@@ -0,0 +1 @@
+default_app_config = "thunderstore.social.apps.SocialAppConfig"
@@ -1,5 +1,6 @@
 import datetime
-from typing import List, Optional, Set, TypedDict
+from hashlib import sha256
+from typing import Iterable, List, Optional, Set, Tuple, TypedDict
 
 from django.db.models import Q, Value
 from django.db.models.functions import Concat
@@ -10,10 +11,15 @@ from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from thunderstore.account.models.user_flag import UserFlag
+from thunderstore.account.models.user_flag import UserFlag, UserFlagMembership
 from thunderstore.api.cyberstorm.views.team import TeamPermissionsMixin
 from thunderstore.core.types import UserType
+from thunderstore.core.utils import conditional_response
 from thunderstore.repository.models import TeamMember
+from thunderstore.social.profile_cache import (
+    get_cached_user_profile,
+    get_user_profile_version,
+)
 from thunderstore.social.utils import get_connection_avatar_url
 
 
@@ -24,12 +30,17 @@ class CurrentUserExperimentalApiView(APIView):
 
     @swagger_auto_schema(tags=["experimental"])
     def get(self, request, format=None):
-        if request.user.is_authenticated:
-            profile = get_user_profile(request.user)
-        else:
-            profile = get_empty_profile()
-
-        return Response(profile)
+        if not request.user.is_authenticated:
+            return Response(get_empty_profile())
+
+        document, etag = get_cached_profile_document(request.user)
+        response = conditional_response(
+            request,
+            lambda: Response(build_user_profile(request.user, document)),
+            etag=etag,
+        )
+        response["Cache-Control"] = "private, no-cache"
+        return response
 
 
 class CurrentUserRatedPackagesExperimentalApiView(APIView):
@@ -162,27 +173,76 @@ def get_rated_packages(user: Optional[UserType]) -> RatedPackagesInfo:
     }
 
 
-def get_user_profile(user: UserType) -> UserProfile:
-    username = user.username
-    capabilities = {"package.rate"}
-    teams = get_teams(user)
-    is_staff = user.is_staff
+class UserFlagPeriod(TypedDict):
+    identifier: str
+    valid_from: datetime.datetime
+    valid_until: Optional[datetime.datetime]
+
+
+class ProfileDocument(TypedDict):
+    """
+    The time independent parts of a user's profile, which are cached until
+    the user, their social auth connections, flags or teams change.
+    """
+
+    username: str
+    connections: List[SocialAuthConnection]
+    teams_full: List[dict]
+    is_staff: bool
+    flags: List[UserFlagPeriod]
+
+
+def get_profile_document(user: UserType) -> ProfileDocument:
+    return {
+        "username": user.username,
+        "connections": get_social_auth_connections(user),
+        "teams_full": [x.dict() for x in get_teams(user)],
+        "is_staff": user.is_staff,
+        "flags": get_flag_periods(user),
+    }
+
+
+def get_cached_profile_document(user: UserType) -> Tuple[ProfileDocument, str]:
+    """
+    Return the user's cached profile document, along with an ETag of the
+    profile built from it.
+    """
+    version = get_user_profile_version(user.pk)
+    document = get_cached_user_profile(
+        user.pk, version, lambda: get_profile_document(user)
+    )
+    active_flags = get_active_flags(document["flags"], timezone.now())
+    etag = sha256(f"{user.pk}.{version}.{','.join(active_flags)}".encode())
+    return document, etag.hexdigest()
+
+
+def build_user_profile(user: UserType, document: ProfileDocument) -> UserProfile:
+    active_flags = get_active_flags(document["flags"], timezone.now())
+    teams = document["teams_full"]
 
     return UserProfileSerializer(
         {
-            "username": username,
-            "capabilities": capabilities,
-            "connections": get_social_auth_connections(user),
-            "subscription": get_subscription_status(user),
+            "username": document["username"],
+            "capabilities": {"package.rate"},
+            "connections": document["connections"],
+            "subscription": get_subscription_status(user, active_flags),
             "rated_packages": [],
-            "teams": [x.name for x in teams],
+            "teams": [x["name"] for x in teams],
             "teams_full": teams,
-            "is_staff": is_staff,
+            "is_staff": document["is_staff"],
         }
     ).data
 
 
-def get_subscription_status(user: Optional[UserType]) -> SubscriptionStatus:
+def get_user_profile(user: UserType) -> UserProfile:
+    document, _ = get_cached_profile_document(user)
+    return build_user_profile(user, document)
+
+
+def get_subscription_status(
+    user: Optional[UserType],
+    active_flags: Optional[List[str]] = None,
+) -> SubscriptionStatus:
     """
     Return information regarding user's paid subscription plan.
 
@@ -194,12 +254,46 @@ def get_subscription_status(user: Optional[UserType]) -> SubscriptionStatus:
         return {"expires": None}
 
     now = timezone.now()
-    if "cyberstorm_beta_access" in UserFlag.get_active_flags_on_user(user, now):
+    if active_flags is None:
+        active_flags = UserFlag.get_active_flags_on_user(user, now)
+    if "cyberstorm_beta_access" in active_flags:
         return {"expires": (now + datetime.timedelta(weeks=4))}
 
     return {"expires": None}
 
 
+def get_flag_periods(user: UserType) -> List[UserFlagPeriod]:
+    """
+    Return the validity periods of the user's flags which haven't expired.
+    The active flags are resolved from these at request time, so that the
+    cached profile doesn't need to be invalidated as the periods pass.
+    """
+    memberships = (
+        UserFlagMembership.objects.filter(user=user)
+        .exclude(datetime_valid_until__lte=timezone.now())
+        .order_by("flag__identifier", "datetime_valid_from")
+        .values_list("flag__identifier", "datetime_valid_from", "datetime_valid_until")
+    )
+    return [
+        {"identifier": identifier, "valid_from": start, "valid_until": end}
+        for identifier, start, end in memberships
+    ]
+
+
+def get_active_flags(
+    periods: Iterable[UserFlagPeriod],
+    timestamp: datetime.datetime,
+) -> List[str]:
+    return sorted(
+        {
+            x["identifier"]
+            for x in periods
+            if x["valid_from"] <= timestamp
+            and (x["valid_until"] is None or x["valid_until"] > timestamp)
+        }
+    )
+
+
 OAUTH_USERNAME_FIELDS = {
     "discord": "username",
     "github": "login",
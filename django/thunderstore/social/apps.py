@@ -0,0 +1,42 @@
+from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+
+
+class SocialAppConfig(AppConfig):
+    name = "thunderstore.social"
+    label = "social"
+
+    def ready(self):
+        from social_django.models import UserSocialAuth
+
+        from thunderstore.account.models import ServiceAccount, UserFlagMembership
+        from thunderstore.repository.models import Team, TeamMember
+        from thunderstore.social.profile_cache import (
+            service_account_changed,
+            team_changed,
+            team_member_changed,
+            user_changed,
+            user_relation_changed,
+        )
+
+        # Invalidate the cached profile documents of the current user API
+        receivers = (
+            ("user", user_changed, get_user_model()),
+            ("social_auth", user_relation_changed, UserSocialAuth),
+            ("user_flag_membership", user_relation_changed, UserFlagMembership),
+            ("team", team_changed, Team),
+            ("team_member", team_member_changed, TeamMember),
+            ("service_account", service_account_changed, ServiceAccount),
+        )
+        for name, receiver, sender in receivers:
+            post_save.connect(
+                receiver=receiver,
+                sender=sender,
+                dispatch_uid=f"profile_cache_{name}_post_save",
+            )
+            post_delete.connect(
+                receiver=receiver,
+                sender=sender,
+                dispatch_uid=f"profile_cache_{name}_post_delete",
+            )
@@ -0,0 +1,117 @@
+import time
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from django.conf import settings
+from django.db import transaction
+
+from thunderstore.cache.utils import get_cache
+
+# Bump to discard the cached documents when their structure changes
+PROFILE_CACHE_VERSION = 1
+
+T = TypeVar("T")
+
+cache = get_cache("default")
+
+
+def get_profile_version_key(user_id: int) -> str:
+    return f"social.profile.version.{user_id}"
+
+
+def get_profile_cache_key(user_id: int, version: int) -> str:
+    return f"social.profile.v{PROFILE_CACHE_VERSION}.{user_id}.{version}"
+
+
+def get_user_profile_version(user_id: int) -> int:
+    """
+    Return the current version of the user's profile document.
+
+    Versions are initialized from the clock rather than from zero, so that a
+    counter lost from the cache can't resurrect documents cached under it.
+    """
+    key = get_profile_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version or 0
+
+
+def get_cached_user_profile(
+    user_id: int,
+    version: int,
+    build: Callable[[], T],
+) -> T:
+    """
+    Return the user's profile document at the given version, building and
+    caching it if it isn't cached yet.
+    """
+    key = get_profile_cache_key(user_id, version)
+    document = cache.get(key)
+    if document is None:
+        document = build()
+        cache.set(key, document, timeout=settings.USER_PROFILE_CACHE_TTL_SECONDS)
+    return document
+
+
+def _bump_user_profile_versions(user_ids: Iterable[int]) -> None:
+    for user_id in user_ids:
+        key = get_profile_version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def invalidate_user_profiles(user_ids: Iterable[Optional[int]]) -> None:
+    """
+    Invalidate the cached profile documents of the given users.
+
+    The versions are bumped both immediately and once the transaction has
+    been committed, as documents built by concurrent requests before the
+    commit would otherwise be cached under the new version.
+    """
+    user_ids = {x for x in user_ids if x is not None}
+    if not user_ids:
+        return
+    _bump_user_profile_versions(user_ids)
+    transaction.on_commit(lambda: _bump_user_profile_versions(user_ids))
+
+
+def invalidate_team_member_profiles(team_id: Optional[int]) -> None:
+    from thunderstore.repository.models import TeamMember
+
+    if team_id is None:
+        return
+    invalidate_user_profiles(
+        TeamMember.objects.filter(team_id=team_id).values_list("user_id", flat=True)
+    )
+
+
+def user_changed(sender, instance, **kwargs: Any) -> None:
+    # Logging in only updates the last login time, which isn't profiled
+    if kwargs.get("update_fields") == {"last_login"}:
+        return
+    invalidate_user_profiles((instance.pk,))
+
+
+def user_relation_changed(sender, instance, **kwargs: Any) -> None:
+    invalidate_user_profiles((instance.user_id,))
+
+
+def team_changed(sender, instance, **kwargs: Any) -> None:
+    invalidate_team_member_profiles(instance.pk)
+
+
+def team_member_changed(sender, instance, **kwargs: Any) -> None:
+    # The member counts of the team are part of every member's profile
+    invalidate_user_profiles((instance.user_id,))
+    invalidate_team_member_profiles(instance.team_id)
+
+
+def service_account_changed(sender, instance, **kwargs: Any) -> None:
+    # Service accounts are excluded from the member counts of their team.
+    # Saves of existing accounts only track their usage, so they're skipped.
+    if not kwargs.get("created", True):
+        return
+    invalidate_team_member_profiles(instance.owner_id)
@@ -120,34 +120,36 @@ def test_current_user_info__for_oauth_user__has_connections(
     assert type(user_info["connections"]) == list
     assert len(user_info["connections"]) == 0
 
-    UserSocialAuth.objects.bulk_create(
-        [
-            UserSocialAuth(
-                user=user,
-                provider="discord",
-                uid="d123",
-                extra_data={"username": "discord_user"},
-            ),
-            UserSocialAuth(
-                user=user,
-                provider="github",
-                uid="gh123",
-                extra_data={"login": "gh_user", "avatar_url": "gh_url"},
-            ),
-            UserSocialAuth(
-                user=user,
-                provider="overwolf",
-                uid="ow123",
-                extra_data={"nickname": "ow_user", "avatar": "ow_url"},
-            ),
-            UserSocialAuth(
-                user=user,
-                provider="unknown",
-                uid="unk123",
-                extra_data={},
-            ),
-        ],
-    )
+    # Saved one by one, as bulk creation skips the signals which invalidate
+    # the cached profile.
+    connections = [
+        UserSocialAuth(
+            user=user,
+            provider="discord",
+            uid="d123",
+            extra_data={"username": "discord_user"},
+        ),
+        UserSocialAuth(
+            user=user,
+            provider="github",
+            uid="gh123",
+            extra_data={"login": "gh_user", "avatar_url": "gh_url"},
+        ),
+        UserSocialAuth(
+            user=user,
+            provider="overwolf",
+            uid="ow123",
+            extra_data={"nickname": "ow_user", "avatar": "ow_url"},
+        ),
+        UserSocialAuth(
+            user=user,
+            provider="unknown",
+            uid="unk123",
+            extra_data={},
+        ),
+    ]
+    for connection in connections:
+        connection.save()
 
     response = request_user_info(api_client)
 
@@ -290,3 +292,108 @@ def test_current_user_is_staff_v1_api(
         expected_status,
         True,
     )
+
+
+@pytest.mark.django_db
+def test_current_user_info__revalidated_with_etag__is_not_modified(
+    api_client: APIClient,
+    user: UserType,
+) -> None:
+    api_client.force_authenticate(user=user)
+    response = request_user_info(api_client)
+
+    assert response.status_code == 200
+    assert response["Cache-Control"] == "private, no-cache"
+    etag = response["ETag"]
+
+    response = api_client.get(
+        "/api/experimental/current-user/",
+        HTTP_ACCEPT="application/json",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    user.username = "Renamed"
+    user.save()
+    response = api_client.get(
+        "/api/experimental/current-user/",
+        HTTP_ACCEPT="application/json",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.json()["username"] == "Renamed"
+
+
+@pytest.mark.django_db
+def test_current_user_info__is_served_from_cache(
+    api_client: APIClient,
+    user: UserType,
+    django_assert_max_num_queries,
+) -> None:
+    api_client.force_authenticate(user=user)
+    TeamMemberFactory.create(user=user)
+    first = request_user_info(api_client).json()
+
+    with django_assert_max_num_queries(0):
+        second = request_user_info(api_client).json()
+
+    assert second == first
+
+
+@pytest.mark.django_db
+def test_current_user_info__team_changes__invalidate_member_profiles(
+    api_client: APIClient,
+    user: UserType,
+) -> None:
+    api_client.force_authenticate(user=user)
+    member = TeamMemberFactory.create(user=user, role=TeamMemberRole.owner)
+    assert request_user_info(api_client).json()["teams_full"][0]["member_count"] == 1
+
+    other = TeamMemberFactory.create(team=member.team)
+    assert request_user_info(api_client).json()["teams_full"][0]["member_count"] == 2
+
+    other.delete()
+    assert request_user_info(api_client).json()["teams_full"][0]["member_count"] == 1
+
+    member.team.is_active = False
+    member.team.save()
+    assert request_user_info(api_client).json()["teams"] == []
+
+
+@pytest.mark.django_db
+def test_current_user_info__flag_changes__update_subscription(
+    api_client: APIClient,
+    user: UserType,
+    freezer,
+) -> None:
+    api_client.force_authenticate(user=user)
+    flag = UserFlag.objects.create(
+        name="Cyberstorm Beta",
+        app_label="social",
+        identifier="cyberstorm_beta_access",
+    )
+    now = timezone.now()
+    membership = UserFlagMembership.objects.create(
+        user=user,
+        flag=flag,
+        datetime_valid_from=now + datetime.timedelta(hours=1),
+        datetime_valid_until=now + datetime.timedelta(hours=2),
+    )
+
+    response = request_user_info(api_client)
+    etag = response["ETag"]
+    assert response.json()["subscription"]["expires"] is None
+
+    # The cached flag periods are resolved at request time
+    freezer.tick(datetime.timedelta(minutes=90))
+    response = request_user_info(api_client)
+    assert response["ETag"] != etag
+    assert response.json()["subscription"]["expires"] is not None
+
+    membership.delete()
+    response = request_user_info(api_client)
+    assert response.json()["subscription"]["expires"] is None
@@ -1,17 +1,43 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from hashlib import sha256
+from tempfile import SpooledTemporaryFile
+from typing import IO, Callable, ContextManager, Dict, Iterable
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.storage import get_storage_class
 from django.db import models
 
 from thunderstore.core.mixins import AdminLinkMixin, SafeDeleteMixin
+from thunderstore.utils.batch import batch
+
+CHUNK_SIZE = 1024 * 1024
+# Uploaded content is kept in memory until it grows beyond this size, after
+# which it's rolled over to a file on disk.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
 
 
 def get_object_file_path(_, filename: str) -> str:
     return f"blob-storage/sha256/{filename}.sha256.blob"
 
 
+@dataclass(frozen=True)
+class BlobSource:
+    """
+    Content of a blob whose checksum is already known, allowing blobs to be
+    created in bulk without holding their content in memory.
+
+    :param open: Callable returning a new readable stream of the content.
+        Might be called from another thread.
+    """
+
+    checksum_sha256: str
+    data_size: int
+    open: Callable[[], ContextManager[IO[bytes]]]
+
+
 class DataBlob(SafeDeleteMixin, AdminLinkMixin):
     """
     The DataBlob class is responsible for storing arbitrary blobs of data with
@@ -61,5 +87,61 @@ class DataBlob(SafeDeleteMixin, AdminLinkMixin):
             data_size=len(content),
         )
 
+    @classmethod
+    def bulk_get_or_create(
+        cls,
+        sources: Iterable[BlobSource],
+    ) -> Dict[str, "DataBlob"]:
+        """
+        Get or create the blobs of multiple sources at once, returning them
+        keyed by checksum.
+
+        Existing blobs are looked up in batches, and the content of missing
+        ones is uploaded concurrently before inserting them with a single
+        query per batch.
+        """
+        sources_by_checksum = {x.checksum_sha256: x for x in sources}
+        blobs = cls._get_by_checksums(sources_by_checksum.keys())
+        missing = [x for c, x in sources_by_checksum.items() if c not in blobs]
+        if not missing:
+            return blobs
+
+        workers = min(settings.BLOB_UPLOAD_MAX_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            created = list(executor.map(cls._upload_source, missing))
+
+        # Conflicts are possible if another process created the same blob
+        # concurrently, in which case the existing row is used.
+        cls.objects.bulk_create(created, batch_size=1000, ignore_conflicts=True)
+        blobs.update(cls._get_by_checksums(x.checksum_sha256 for x in missing))
+        return blobs
+
+    @classmethod
+    def _get_by_checksums(cls, checksums: Iterable[str]) -> Dict[str, "DataBlob"]:
+        result = {}
+        for checksum_batch in batch(1000, checksums):
+            for blob in cls.objects.filter(checksum_sha256__in=checksum_batch):
+                result[blob.checksum_sha256] = blob
+        return result
+
+    @classmethod
+    def _upload_source(cls, source: BlobSource) -> "DataBlob":
+        """
+        Upload the content of the source to the storage and return an
+        unsaved DataBlob pointing to it.
+        """
+        blob = cls(checksum_sha256=source.checksum_sha256, data_size=source.data_size)
+        # Storage backends expect seekable files, so the stream is spooled
+        # rather than passed on as is.
+        with source.open() as stream, SpooledTemporaryFile(SPOOL_MAX_SIZE) as copy:
+            shutil.copyfileobj(stream, copy, CHUNK_SIZE)
+            copy.seek(0)
+            blob.data.save(
+                f"{source.checksum_sha256}.sha256.blob",
+                File(copy),
+                save=False,
+            )
+        return blob
+
     def on_safe_delete(self):
         self.data.delete()
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 from django.db import models
 
 from thunderstore.core.mixins import AdminLinkMixin, TimestampMixin
+from thunderstore.storage.models.blob import BlobSource, DataBlob
 from thunderstore.storage.models.reference import DataBlobReference
 
 
@@ -41,3 +42,26 @@ class DataBlobGroup(TimestampMixin, AdminLinkMixin):
             content_type=content_type,
             content_encoding=content_encoding,
         )
+
+    def add_entries(
+        self,
+        entries: Sequence[Tuple[str, BlobSource]],
+    ) -> List["DataBlobReference"]:
+        """
+        Add multiple named entries at once, see DataBlob.bulk_get_or_create.
+        """
+        if self.is_complete:
+            raise RuntimeError("Modifying complete groups is not permitted")
+
+        blobs = DataBlob.bulk_get_or_create(source for _, source in entries)
+        return DataBlobReference.objects.bulk_create(
+            [
+                DataBlobReference(
+                    blob=blobs[source.checksum_sha256],
+                    group=self,
+                    name=name,
+                )
+                for name, source in entries
+            ],
+            batch_size=1000,
+        )
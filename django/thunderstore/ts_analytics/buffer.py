@@ -0,0 +1,103 @@
+import json
+from typing import TYPE_CHECKING, List, Optional
+
+from django.conf import settings
+from redis import Redis
+
+from thunderstore.cache.utils import get_cache
+from thunderstore.core.utils import capture_exception
+from thunderstore.ts_analytics.metrics import AnalyticsEvent, record_analytics_event
+
+if TYPE_CHECKING:
+    from thunderstore.ts_analytics.kafka import KafkaMessage
+
+BUFFER_KEY = "ts_analytics.buffer"
+
+
+def _get_redis() -> Redis:
+    return get_cache("legacy").client.get_client(write=True)
+
+
+def queue_kafka_message(
+    topic: str,
+    payload_string: str,
+    key: Optional[str] = None,
+) -> None:
+    """
+    Add a message to the analytics buffer, from which flush_analytics_buffer
+    hands it over to Kafka in bulk. The message is sent with a task of its
+    own instead if buffering is disabled or fails.
+    """
+    from thunderstore.ts_analytics.tasks import (
+        flush_analytics_buffer_task,
+        send_kafka_message,
+    )
+
+    if settings.USE_BUFFERED_ANALYTICS:
+        try:
+            length = _get_redis().rpush(
+                BUFFER_KEY,
+                json.dumps([topic, payload_string, key]),
+            )
+        except Exception as e:  # pragma: no cover
+            capture_exception(e)
+        else:
+            record_analytics_event(AnalyticsEvent.buffered)
+            if length % settings.ANALYTICS_BUFFER_BATCH_SIZE == 0:
+                # Don't wait for the periodic flush once full batches are
+                # available.
+                flush_analytics_buffer_task.delay()
+            return
+
+    record_analytics_event(AnalyticsEvent.unbuffered)
+    send_kafka_message.delay(topic=topic, payload_string=payload_string, key=key)
+
+
+def flush_analytics_buffer() -> int:
+    """
+    Hand the buffered messages over to send_kafka_messages in batches of
+    ANALYTICS_BUFFER_BATCH_SIZE. Batches are claimed atomically, so
+    concurrent flushes never send the same messages.
+
+    :return: The number of messages flushed
+    """
+    from thunderstore.ts_analytics.tasks import send_kafka_messages
+
+    redis = _get_redis()
+    batch_size = settings.ANALYTICS_BUFFER_BATCH_SIZE
+    flushed = 0
+    while True:
+        pipe = redis.pipeline(transaction=True)
+        pipe.lrange(BUFFER_KEY, 0, batch_size - 1)
+        pipe.ltrim(BUFFER_KEY, batch_size, -1)
+        entries, _ = pipe.execute()
+        if not entries:
+            break
+
+        try:
+            send_kafka_messages.delay(messages=[json.loads(x) for x in entries])
+        except Exception:
+            # Return the batch to the front of the buffer for the next flush
+            redis.lpush(BUFFER_KEY, *reversed(entries))
+            raise
+
+        record_analytics_event(AnalyticsEvent.flushed, len(entries))
+        flushed += len(entries)
+        if len(entries) < batch_size:
+            break
+    return flushed
+
+
+def requeue_kafka_messages(messages: List["KafkaMessage"]) -> None:
+    """
+    Return messages that couldn't be sent to the front of the analytics
+    buffer, so that the next flush sends them first.
+    """
+    if not messages:
+        return
+    _get_redis().lpush(BUFFER_KEY, *(json.dumps(list(x)) for x in reversed(messages)))
+    record_analytics_event(AnalyticsEvent.requeued, len(messages))
+
+
+def get_analytics_buffer_length() -> int:
+    return _get_redis().llen(BUFFER_KEY)
@@ -1,11 +1,12 @@
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from confluent_kafka import Producer
 from django.conf import settings
 from pydantic import BaseModel
 
 from thunderstore.core.utils import capture_exception
+from thunderstore.ts_analytics.metrics import AnalyticsEvent, record_analytics_event
 
 
 class KafkaTopic(str, Enum):
@@ -27,6 +28,11 @@ class KafkaTopic(str, Enum):
     M_COMMUNITY_UPDATE_V1 = "model.community.update.v1"
 
 
+# A message as passed through the analytics buffer and Celery, consisting of
+# the topic, the payload string and the key
+KafkaMessage = Tuple[str, str, Optional[str]]
+
+
 def build_full_topic_name(*, topic_prefix: Optional[str], topic_name: str) -> str:
     return ".".join((x for x in (topic_prefix, topic_name) if x))
 
@@ -57,22 +63,82 @@ class KafkaClient:
         payload_string: str,
         key: Optional[str] = None,
     ):
-        full_topic_name = build_full_topic_name(
-            topic_prefix=self.topic_prefix,
-            topic_name=topic,
-        )
         try:
-            value_bytes = payload_string.encode("utf-8")
-            key_bytes = key.encode("utf-8") if key else None
-
-            self._producer.produce(
-                topic=full_topic_name,
-                value=value_bytes,
-                key=key_bytes,
-            )
-            self._producer.poll()
+            self._produce(topic, payload_string, key)
+            # Serve the delivery callbacks of earlier messages without
+            # waiting for this one to be delivered.
+            self._producer.poll(0)
+        except Exception as e:  # pragma: no cover
+            capture_exception(e)
+
+    def send_batch(self, messages: Iterable[KafkaMessage]) -> int:
+        """
+        Produce the messages and wait for the producer queue to be flushed.
+
+        Messages the producer queue can't take even after flushing it are
+        returned to the analytics buffer, to be sent by its next flush.
+        Messages that can't be produced for other reasons, e.g. as they're
+        too large, are dropped as they would never succeed.
+
+        Returns the number of messages still undelivered once the flush timed
+        out. These remain queued in the producer.
+        """
+        messages = list(messages)
+        for index, (topic, payload_string, key) in enumerate(messages):
+            try:
+                self._produce_flushing(topic, payload_string, key)
+            except BufferError as e:
+                capture_exception(e)
+                self._requeue(messages[index:])
+                break
+            except Exception as e:
+                capture_exception(e)
+                record_analytics_event(AnalyticsEvent.dropped)
+        undelivered = self._producer.flush(settings.KAFKA_FLUSH_TIMEOUT_SECONDS)
+        if undelivered:
+            record_analytics_event(AnalyticsEvent.undelivered, undelivered)
+        return undelivered
+
+    def _produce_flushing(
+        self,
+        topic: str,
+        payload_string: str,
+        key: Optional[str],
+    ):
+        try:
+            self._produce(topic, payload_string, key)
+        except BufferError:
+            # The rest of the batch won't fit either, so wait for the whole
+            # queue to be delivered rather than for room for one message.
+            self._producer.flush(settings.KAFKA_FLUSH_TIMEOUT_SECONDS)
+            self._produce(topic, payload_string, key)
+
+    def _requeue(self, messages: List[KafkaMessage]):
+        from thunderstore.ts_analytics.buffer import requeue_kafka_messages
+
+        try:
+            requeue_kafka_messages(messages)
         except Exception as e:  # pragma: no cover
             capture_exception(e)
+            record_analytics_event(AnalyticsEvent.dropped, len(messages))
+
+    def _produce(self, topic: str, payload_string: str, key: Optional[str]):
+        kwargs = {
+            "topic": build_full_topic_name(
+                topic_prefix=self.topic_prefix,
+                topic_name=topic,
+            ),
+            "value": payload_string.encode("utf-8"),
+            "key": key.encode("utf-8") if key else None,
+        }
+        try:
+            self._producer.produce(**kwargs)
+        except BufferError:
+            # The local producer queue is full, wait for deliveries to make
+            # room for the message before trying once more.
+            record_analytics_event(AnalyticsEvent.backpressure)
+            self._producer.poll(settings.KAFKA_BACKPRESSURE_TIMEOUT_SECONDS)
+            self._producer.produce(**kwargs)
 
 
 class DummyKafkaClient:
@@ -86,17 +152,30 @@ class DummyKafkaClient:
     def _send_string(self, topic: str, payload_string: str, key: Optional[str] = None):
         pass
 
+    def send_batch(self, messages: Iterable[KafkaMessage]) -> int:
+        return 0
+
 
 _KAFKA_CLIENT_INSTANCE = None
 
 
+def on_delivery(error, message):
+    if error is not None:
+        record_analytics_event(AnalyticsEvent.delivery_failed)
+
+
 def instantiate_kafka_client() -> Union[KafkaClient, DummyKafkaClient]:
     if settings.KAFKA_ENABLED is False:
         return DummyKafkaClient()
     else:
         return KafkaClient(
             topic_prefix=settings.KAFKA_TOPIC_PREFIX,
-            producer_config=settings.KAFKA_CONFIG,
+            producer_config={
+                "linger.ms": settings.KAFKA_LINGER_MS,
+                "batch.num.messages": settings.KAFKA_BATCH_NUM_MESSAGES,
+                "on_delivery": on_delivery,
+                **settings.KAFKA_CONFIG,
+            },
         )
 
 
@@ -0,0 +1,39 @@
+from typing import Dict
+
+from thunderstore.cache.metrics import CacheMetrics
+from thunderstore.core.utils import ChoiceEnum
+
+METRICS_KEY = "ts_analytics.metrics"
+
+
+class AnalyticsEvent(ChoiceEnum):
+    # Events added to the redis buffer
+    buffered = "buffered"
+    # Events sent through a Celery task as buffering wasn't possible
+    unbuffered = "unbuffered"
+    # Events handed from the buffer to the bulk send task
+    flushed = "flushed"
+    # Times producing had to wait for the full producer queue to drain
+    backpressure = "backpressure"
+    # Events returned to the buffer as the producer queue couldn't take them
+    requeued = "requeued"
+    # Events that couldn't be produced, nor returned to the buffer
+    dropped = "dropped"
+    # Events still undelivered once a batch flush timed out
+    undelivered = "undelivered"
+    # Events the broker reported as failed
+    delivery_failed = "delivery_failed"
+
+
+metrics = CacheMetrics(key=METRICS_KEY)
+
+
+def record_analytics_event(event: str, amount: int = 1) -> None:
+    metrics.add(event, amount)
+
+
+def get_analytics_metrics() -> Dict[str, int]:
+    """
+    Return the analytics pipeline counters collected by all processes.
+    """
+    return metrics.read()
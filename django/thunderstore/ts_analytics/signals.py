@@ -6,13 +6,13 @@ from pydantic import BaseModel
 
 from thunderstore.community.models import Community, PackageListing
 from thunderstore.repository.models import Package, PackageVersion
+from thunderstore.ts_analytics.buffer import queue_kafka_message
 from thunderstore.ts_analytics.kafka import KafkaTopic
-from thunderstore.ts_analytics.tasks import send_kafka_message
 
 
 def _send_kafka_message_on_commit(topic: str, payload: BaseModel):
     transaction.on_commit(
-        lambda: send_kafka_message.delay(topic=topic, payload_string=payload.json())
+        lambda: queue_kafka_message(topic=topic, payload_string=payload.json())
     )
 
 
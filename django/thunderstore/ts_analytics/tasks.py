@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import List, Optional
 
 from celery import shared_task
 
 from thunderstore.core.settings import CeleryQueues
-from thunderstore.ts_analytics.kafka import get_kafka_client
+from thunderstore.ts_analytics.buffer import flush_analytics_buffer
+from thunderstore.ts_analytics.kafka import KafkaMessage, get_kafka_client
 
 
 @shared_task(
@@ -14,3 +15,22 @@ from thunderstore.ts_analytics.kafka import get_kafka_client
 def send_kafka_message(topic: str, payload_string: str, key: Optional[str] = None):
     client = get_kafka_client()
     client._send_string(topic=topic, payload_string=payload_string, key=key)
+
+
+@shared_task(
+    queue=CeleryQueues.Analytics,
+    name="thunderstore.ts_analytics.tasks.send_kafka_messages",
+    ignore_result=True,
+)
+def send_kafka_messages(messages: List[KafkaMessage]):
+    client = get_kafka_client()
+    client.send_batch(messages)
+
+
+@shared_task(
+    queue=CeleryQueues.Analytics,
+    name="thunderstore.ts_analytics.tasks.flush_analytics_buffer",
+    ignore_result=True,
+)
+def flush_analytics_buffer_task():
+    flush_analytics_buffer()
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from thunderstore.ts_analytics.buffer import (
+    flush_analytics_buffer,
+    get_analytics_buffer_length,
+    queue_kafka_message,
+    requeue_kafka_messages,
+)
+from thunderstore.ts_analytics.metrics import AnalyticsEvent, get_analytics_metrics
+
+
+@pytest.fixture
+def send_kafka_messages():
+    with patch("thunderstore.ts_analytics.tasks.send_kafka_messages") as mocked:
+        yield mocked
+
+
+def get_metric(event: str) -> int:
+    return get_analytics_metrics().get(event, 0)
+
+
+def test_queue_kafka_message_buffers_message(send_kafka_messages) -> None:
+    before = get_metric(AnalyticsEvent.buffered)
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 1}', key="key")
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 2}')
+
+    assert get_analytics_buffer_length() == 2
+    send_kafka_messages.delay.assert_not_called()
+    assert get_metric(AnalyticsEvent.buffered) == before + 2
+
+
+def test_queue_kafka_message_when_buffering_disabled(settings) -> None:
+    settings.USE_BUFFERED_ANALYTICS = False
+
+    with patch("thunderstore.ts_analytics.tasks.send_kafka_message") as mocked:
+        queue_kafka_message(topic="test.topic", payload_string="{}")
+
+    mocked.delay.assert_called_once_with(
+        topic="test.topic",
+        payload_string="{}",
+        key=None,
+    )
+    assert get_analytics_buffer_length() == 0
+
+
+def test_queue_kafka_message_flushes_full_batches(
+    settings,
+    send_kafka_messages,
+) -> None:
+    settings.ANALYTICS_BUFFER_BATCH_SIZE = 2
+
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 1}')
+    send_kafka_messages.delay.assert_not_called()
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 2}')
+
+    send_kafka_messages.delay.assert_called_once_with(
+        messages=[
+            ["test.topic", '{"id": 1}', None],
+            ["test.topic", '{"id": 2}', None],
+        ]
+    )
+    assert get_analytics_buffer_length() == 0
+
+
+def test_flush_analytics_buffer_sends_batches(settings, send_kafka_messages) -> None:
+    settings.ANALYTICS_BUFFER_BATCH_SIZE = 3
+    before = get_metric(AnalyticsEvent.flushed)
+    for i in range(5):
+        queue_kafka_message(topic="test.topic", payload_string=json.dumps({"id": i}))
+    # The first full batch was flushed as it was completed
+    assert send_kafka_messages.delay.call_count == 1
+
+    assert flush_analytics_buffer() == 2
+    assert send_kafka_messages.delay.call_count == 2
+    messages = send_kafka_messages.delay.call_args.kwargs["messages"]
+    assert [json.loads(x[1])["id"] for x in messages] == [3, 4]
+    assert get_analytics_buffer_length() == 0
+    assert get_metric(AnalyticsEvent.flushed) == before + 5
+
+    assert flush_analytics_buffer() == 0
+
+
+def test_flush_analytics_buffer_keeps_messages_on_failure(send_kafka_messages) -> None:
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 1}')
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 2}')
+    send_kafka_messages.delay.side_effect = RuntimeError("Broker unavailable")
+
+    with pytest.raises(RuntimeError):
+        flush_analytics_buffer()
+    assert get_analytics_buffer_length() == 2
+
+    send_kafka_messages.delay.side_effect = None
+    assert flush_analytics_buffer() == 2
+    messages = send_kafka_messages.delay.call_args.kwargs["messages"]
+    assert [json.loads(x[1])["id"] for x in messages] == [1, 2]
+
+
+def test_requeue_kafka_messages_are_flushed_first(send_kafka_messages) -> None:
+    before = get_metric(AnalyticsEvent.requeued)
+    queue_kafka_message(topic="test.topic", payload_string='{"id": 3}')
+    requeue_kafka_messages(
+        [
+            ("test.topic", '{"id": 1}', "key"),
+            ("test.topic", '{"id": 2}', None),
+        ]
+    )
+
+    assert flush_analytics_buffer() == 3
+    send_kafka_messages.delay.assert_called_once_with(
+        messages=[
+            ["test.topic", '{"id": 1}', "key"],
+            ["test.topic", '{"id": 2}', None],
+            ["test.topic", '{"id": 3}', None],
+        ]
+    )
+    assert get_metric(AnalyticsEvent.requeued) == before + 2
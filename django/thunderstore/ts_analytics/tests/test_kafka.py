@@ -6,7 +6,8 @@ from pydantic import BaseModel
 
 from thunderstore.core.settings import KafkaConfigValidationError, validate_kafka_config
 from thunderstore.ts_analytics.kafka import DummyKafkaClient, get_kafka_client
-from thunderstore.ts_analytics.tasks import send_kafka_message
+from thunderstore.ts_analytics.metrics import AnalyticsEvent, get_analytics_metrics
+from thunderstore.ts_analytics.tasks import send_kafka_message, send_kafka_messages
 
 # ======================================================================
 # CORE FIXTURES AND MOCKS
@@ -81,6 +82,18 @@ def test_send_kafka_message_task_handles_none_key(mock_kafka_client):
     )
 
 
+def test_send_kafka_messages_task_sends_batch(mock_kafka_client):
+    """Tests that the bulk task hands all of the messages to the client."""
+    messages = [
+        ["test-topic", '{"id": 1}', None],
+        ["test-topic", '{"id": 2}', "key"],
+    ]
+
+    send_kafka_messages(messages=messages)
+
+    mock_kafka_client.send_batch.assert_called_once_with(messages)
+
+
 # ======================================================================
 # KAFKA CLIENT TESTS
 # ======================================================================
@@ -172,3 +185,144 @@ def test_kafka_config_validation_no_bootstrap_servers():
         match="Kafka bootstrap servers are missing from config",
     ):
         validate_kafka_config(True, config)
+
+
+def test_kafka_client_send_batch(mock_producer, settings):
+    """Test KafkaClient produces a batch before waiting for its delivery"""
+    from thunderstore.ts_analytics.kafka import KafkaClient
+
+    client = KafkaClient(
+        topic_prefix="dev", producer_config={"bootstrap.servers": "test:9092"}
+    )
+    mock_producer.flush.return_value = 0
+
+    undelivered = client.send_batch(
+        [
+            ("test.topic", '{"id": 1}', None),
+            ("test.topic", '{"id": 2}', "key"),
+        ]
+    )
+
+    assert undelivered == 0
+    assert mock_producer.produce.call_count == 2
+    mock_producer.produce.assert_called_with(
+        topic="dev.test.topic",
+        value=b'{"id": 2}',
+        key=b"key",
+    )
+    mock_producer.flush.assert_called_once_with(settings.KAFKA_FLUSH_TIMEOUT_SECONDS)
+    mock_producer.poll.assert_not_called()
+
+
+def test_kafka_client_waits_for_room_in_full_queue(mock_producer, settings):
+    """Test KafkaClient retries producing once the full queue has drained"""
+    from thunderstore.ts_analytics.kafka import KafkaClient
+
+    client = KafkaClient(
+        topic_prefix=None, producer_config={"bootstrap.servers": "test:9092"}
+    )
+    mock_producer.produce.side_effect = [BufferError(), None]
+
+    client._send_string(topic="test.topic", payload_string="{}")
+
+    assert mock_producer.produce.call_count == 2
+    mock_producer.poll.assert_any_call(settings.KAFKA_BACKPRESSURE_TIMEOUT_SECONDS)
+    mock_producer.poll.assert_called_with(0)
+
+
+def test_kafka_client_send_batch_flushes_full_queue(mock_producer, settings):
+    """Test KafkaClient flushes the producer queue once waiting isn't enough"""
+    from thunderstore.ts_analytics.kafka import KafkaClient
+
+    client = KafkaClient(
+        topic_prefix=None, producer_config={"bootstrap.servers": "test:9092"}
+    )
+    mock_producer.produce.side_effect = [BufferError(), BufferError(), None, None]
+    mock_producer.flush.return_value = 0
+
+    with patch("thunderstore.ts_analytics.buffer.requeue_kafka_messages") as requeue:
+        client.send_batch(
+            [
+                ("test.topic", '{"id": 1}', None),
+                ("test.topic", '{"id": 2}', None),
+            ]
+        )
+
+    assert mock_producer.produce.call_count == 4
+    assert mock_producer.flush.call_count == 2
+    requeue.assert_not_called()
+
+
+def test_kafka_client_send_batch_requeues_unsent_messages(mock_producer, settings):
+    """Test KafkaClient returns the messages it couldn't produce to the buffer"""
+    from thunderstore.ts_analytics.kafka import KafkaClient
+
+    settings.ALWAYS_RAISE_EXCEPTIONS = False
+
+    client = KafkaClient(
+        topic_prefix=None, producer_config={"bootstrap.servers": "test:9092"}
+    )
+    mock_producer.produce.side_effect = [None] + [BufferError()] * 4
+    mock_producer.flush.return_value = 0
+    messages = [
+        ("test.topic", '{"id": 1}', None),
+        ("test.topic", '{"id": 2}', None),
+        ("test.topic", '{"id": 3}', "key"),
+    ]
+
+    with patch("thunderstore.ts_analytics.buffer.requeue_kafka_messages") as requeue:
+        client.send_batch(messages)
+
+    assert mock_producer.produce.call_count == 5
+    requeue.assert_called_once_with(messages[1:])
+
+
+def test_kafka_client_send_batch_drops_failing_messages(mock_producer, settings):
+    """Test KafkaClient skips messages that can't be produced and sends the rest"""
+    from confluent_kafka import KafkaException
+
+    from thunderstore.ts_analytics.kafka import KafkaClient
+
+    settings.ALWAYS_RAISE_EXCEPTIONS = False
+    client = KafkaClient(
+        topic_prefix=None, producer_config={"bootstrap.servers": "test:9092"}
+    )
+    mock_producer.produce.side_effect = [None, KafkaException("too large"), None]
+    mock_producer.flush.return_value = 0
+    before = get_analytics_metrics().get(AnalyticsEvent.dropped, 0)
+
+    with patch("thunderstore.ts_analytics.buffer.requeue_kafka_messages") as requeue:
+        client.send_batch(
+            [
+                ("test.topic", '{"id": 1}', None),
+                ("test.topic", '{"id": 2}', None),
+                ("test.topic", '{"id": 3}', None),
+            ]
+        )
+
+    assert mock_producer.produce.call_count == 3
+    mock_producer.produce.assert_called_with(
+        topic="test.topic",
+        value=b'{"id": 3}',
+        key=None,
+    )
+    requeue.assert_not_called()
+    assert get_analytics_metrics().get(AnalyticsEvent.dropped, 0) == before + 1
+
+
+def test_instantiate_kafka_client_applies_batching_defaults(settings):
+    """Test the batching settings are used unless the config overrides them"""
+    from thunderstore.ts_analytics.kafka import instantiate_kafka_client
+
+    settings.KAFKA_ENABLED = True
+    settings.KAFKA_LINGER_MS = 25
+    settings.KAFKA_BATCH_NUM_MESSAGES = 500
+    settings.KAFKA_CONFIG = {"bootstrap.servers": "test:9092", "linger.ms": 5}
+
+    with patch("thunderstore.ts_analytics.kafka.Producer") as mock_producer_cls:
+        instantiate_kafka_client()
+
+    config = mock_producer_cls.call_args.args[0]
+    assert config["bootstrap.servers"] == "test:9092"
+    assert config["linger.ms"] == 5
+    assert config["batch.num.messages"] == 500
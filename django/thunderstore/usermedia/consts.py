@@ -1,5 +1,6 @@
 from django.conf import settings
 
 UPLOAD_PART_SIZE = 1024 * 1024 * 50
+DOWNLOAD_PART_SIZE = 1024 * 1024 * 8
 MAX_UPLOAD_SIZE = 1024 * 1024 * settings.REPOSITORY_MAX_PACKAGE_SIZE_MB
 MIN_UPLOAD_SIZE = 1
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import IO, List, Optional, TypedDict, cast
 
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
@@ -10,7 +11,7 @@ from mypy_boto3_s3 import Client
 from mypy_boto3_s3.type_defs import CompletedPartTypeDef
 
 from thunderstore.core.types import UserType
-from thunderstore.usermedia.consts import UPLOAD_PART_SIZE
+from thunderstore.usermedia.consts import DOWNLOAD_PART_SIZE, UPLOAD_PART_SIZE
 from thunderstore.usermedia.exceptions import (
     InvalidUploadStateException,
     S3BucketNameMissingException,
@@ -217,7 +218,18 @@ def download_file(
         size=user_media.size,
         charset=None,
     )
-    client.download_fileobj(bucket_name, user_media.key, cast(IO, fileobj))
+    # Files larger than a single part are fetched with parallel ranged GETs
+    config = TransferConfig(
+        multipart_threshold=DOWNLOAD_PART_SIZE,
+        multipart_chunksize=DOWNLOAD_PART_SIZE,
+        max_concurrency=settings.USERMEDIA_S3_DOWNLOAD_MAX_CONCURRENCY,
+    )
+    client.download_fileobj(
+        bucket_name,
+        user_media.key,
+        cast(IO, fileobj),
+        Config=config,
+    )
     fileobj.seek(0)
     return fileobj
 
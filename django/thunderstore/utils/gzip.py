@@ -1,5 +1,12 @@
 import gzip
 import io
+from hashlib import sha256
+from tempfile import SpooledTemporaryFile
+from typing import IO, Optional
+
+# Compressed data is kept in memory until it grows beyond this size, after
+# which it's rolled over to a file on disk.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
 
 
 def gzip_compress(data: bytes) -> bytes:
@@ -13,3 +20,64 @@ def gzip_decompress(data: bytes) -> bytes:
     with io.BytesIO(data) as buffer:
         with gzip.GzipFile(fileobj=buffer, mode="rb") as gz:
             return gz.read()
+
+
+class SpooledGzipWriter:
+    """
+    Incrementally gzip data into a spooled temporary file, allowing large
+    payloads to be compressed without holding them in memory in full.
+
+    The output is deterministic (the gzip header timestamp is zeroed), so
+    the sha256 checksum of the uncompressed data identifies the compressed
+    file as well.
+
+    Usage:
+        with SpooledGzipWriter() as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            compressed = writer.finish()
+    """
+
+    def __init__(self, max_size: int = SPOOL_MAX_SIZE):
+        self.file: IO[bytes] = SpooledTemporaryFile(max_size=max_size)
+        self._gzip: Optional[gzip.GzipFile] = gzip.GzipFile(
+            fileobj=self.file,
+            mode="wb",
+            mtime=0,
+        )
+        self.uncompressed_size = 0
+        self._checksum = sha256()
+
+    def write(self, data: bytes) -> int:
+        if self._gzip is None:
+            raise RuntimeError("Writing to a finished SpooledGzipWriter")
+        self.uncompressed_size += len(data)
+        self._checksum.update(data)
+        return self._gzip.write(data)
+
+    @property
+    def checksum_sha256(self) -> str:
+        return self._checksum.hexdigest()
+
+    def finish(self) -> IO[bytes]:
+        """
+        Flush the gzip trailer and return the compressed file rewound to
+        the start. The file remains valid until the writer is closed.
+        """
+        if self._gzip is not None:
+            self._gzip.close()
+            self._gzip = None
+        self.file.seek(0)
+        return self.file
+
+    def close(self) -> None:
+        if self._gzip is not None:
+            self._gzip.close()
+            self._gzip = None
+        self.file.close()
+
+    def __enter__(self) -> "SpooledGzipWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
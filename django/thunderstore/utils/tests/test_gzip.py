@@ -0,0 +1,54 @@
+import gzip
+from hashlib import sha256
+
+import pytest
+
+from thunderstore.utils.gzip import SpooledGzipWriter
+
+
+@pytest.mark.parametrize("max_size", (0, 16, 1024 * 1024))
+def test_spooled_gzip_writer__compresses_written_chunks(max_size: int) -> None:
+    chunks = [b"Lorem ", b"ipsum ", b"dolor " * 100]
+
+    with SpooledGzipWriter(max_size=max_size) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+        result = writer.finish().read()
+
+    assert gzip.decompress(result) == b"".join(chunks)
+    assert writer.uncompressed_size == sum(len(x) for x in chunks)
+
+
+def test_spooled_gzip_writer__finish_is_idempotent() -> None:
+    with SpooledGzipWriter() as writer:
+        writer.write(b"test")
+        first = writer.finish().read()
+        second = writer.finish().read()
+
+    assert first == second
+    assert gzip.decompress(first) == b"test"
+
+
+def test_spooled_gzip_writer__write_after_finish_raises() -> None:
+    with SpooledGzipWriter() as writer:
+        writer.finish()
+        with pytest.raises(RuntimeError, match="finished SpooledGzipWriter"):
+            writer.write(b"test")
+
+
+def test_spooled_gzip_writer__close_closes_file() -> None:
+    writer = SpooledGzipWriter()
+    writer.write(b"test")
+    writer.close()
+    assert writer.file.closed
+
+
+def test_spooled_gzip_writer__output_is_deterministic() -> None:
+    results = []
+    for _ in range(2):
+        with SpooledGzipWriter() as writer:
+            writer.write(b"test")
+            results.append((writer.checksum_sha256, writer.finish().read()))
+
+    assert results[0] == results[1]
+    assert results[0][0] == sha256(b"test").hexdigest()
@@ -0,0 +1,234 @@
+import time
+from collections import defaultdict
+from hashlib import sha256
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+
+from thunderstore.cache.metrics import CacheMetrics
+from thunderstore.cache.utils import get_cache
+from thunderstore.core.utils import ChoiceEnum, capture_exception
+
+METRICS_KEY = "webhooks.metrics"
+
+# Upper bounds (in milliseconds) of the delivery latency histogram buckets
+LATENCY_BUCKETS = (250, 1000, 5000)
+
+# Connections kept open per destination host by a worker process
+POOL_MAXSIZE = 4
+
+
+class DeliveryOutcome(ChoiceEnum):
+    delivered = "delivered"
+    rate_limited = "rate_limited"
+    error = "error"
+    deferred = "deferred"
+    failed = "failed"
+
+
+class WebhookDelivery(BaseModel):
+    url: str
+    data: str
+    headers: Dict[str, str] = {"Content-Type": "application/json"}
+    attempt: int = 0
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc.lower()
+
+
+metrics = CacheMetrics(key=METRICS_KEY)
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session of the process, which keeps the connections to
+    webhook hosts open between deliveries.
+    """
+    global _session
+    if _session is None:
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        _session = requests.Session()
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def dispatch_webhook_deliveries(deliveries: Iterable[WebhookDelivery]) -> None:
+    """
+    Enqueue the deliveries with a task per destination host, so that the
+    deliveries to a host share a connection and its rate limits.
+    """
+    from thunderstore.webhooks.tasks import deliver_webhooks
+
+    by_host: Dict[str, List[Dict]] = defaultdict(list)
+    for delivery in deliveries:
+        by_host[delivery.host].append(delivery.dict())
+
+    for group in by_host.values():
+        try:
+            deliver_webhooks.delay(deliveries=group)
+        except Exception as e:  # pragma: no cover
+            capture_exception(e)
+
+
+def post_deliveries(deliveries: Iterable[WebhookDelivery]) -> None:
+    """
+    Post the deliveries in order, waiting out short rate limits. Deliveries
+    which can't be made within WEBHOOK_MAX_WAIT_SECONDS are retried by a
+    later task, up to WEBHOOK_MAX_ATTEMPTS attempts.
+    """
+    from thunderstore.webhooks.tasks import deliver_webhooks
+
+    deferred: List[WebhookDelivery] = []
+    countdown = 0.0
+
+    for delivery in deliveries:
+        while True:
+            wait = get_rate_limit_wait(delivery)
+            if wait > settings.WEBHOOK_MAX_WAIT_SECONDS:
+                retry_after = wait
+                break
+            if wait > 0:
+                time.sleep(wait)
+
+            outcome, retry_after = post_delivery(delivery)
+            if outcome in (DeliveryOutcome.delivered, DeliveryOutcome.failed):
+                retry_after = None
+                break
+
+            delivery.attempt += 1
+            if delivery.attempt >= settings.WEBHOOK_MAX_ATTEMPTS:
+                metrics.add(DeliveryOutcome.failed)
+                retry_after = None
+                break
+            # Rate limits are waited out by the next iteration if short
+            # enough, while errors are always retried by a later task.
+            if outcome == DeliveryOutcome.error:
+                break
+
+        if retry_after is not None:
+            metrics.add(DeliveryOutcome.deferred)
+            deferred.append(delivery)
+            countdown = max(countdown, retry_after)
+
+    if deferred:
+        deliver_webhooks.apply_async(
+            kwargs={"deliveries": [x.dict() for x in deferred]},
+            countdown=countdown,
+        )
+
+
+def post_delivery(delivery: WebhookDelivery) -> Tuple[str, Optional[float]]:
+    """
+    Make a single attempt at posting the delivery.
+
+    :return: The outcome, and the seconds to wait before retrying if the
+        delivery should be retried
+    """
+    start = time.monotonic()
+    try:
+        response = get_session().post(
+            delivery.url,
+            data=delivery.data,
+            headers=delivery.headers,
+            timeout=settings.WEBHOOK_TIMEOUT_SECONDS,
+        )
+    except requests.RequestException:
+        record_delivery(DeliveryOutcome.error, time.monotonic() - start)
+        return DeliveryOutcome.error, get_backoff(delivery)
+
+    update_rate_limit(delivery, response)
+
+    if response.status_code == 429:
+        outcome, retry_after = DeliveryOutcome.rate_limited, get_retry_after(response)
+    elif response.status_code >= 500:
+        outcome, retry_after = DeliveryOutcome.error, get_backoff(delivery)
+    elif response.status_code >= 400:
+        # The webhook is misconfigured or was deleted, retrying won't help
+        outcome, retry_after = DeliveryOutcome.failed, None
+    else:
+        outcome, retry_after = DeliveryOutcome.delivered, None
+
+    record_delivery(outcome, time.monotonic() - start)
+    return outcome, retry_after
+
+
+def get_backoff(delivery: WebhookDelivery) -> float:
+    return settings.WEBHOOK_RETRY_BACKOFF_SECONDS * 2**delivery.attempt
+
+
+def get_retry_after(response: requests.Response) -> float:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return float(response.json()["retry_after"])
+    except (KeyError, TypeError, ValueError):
+        return settings.WEBHOOK_RETRY_BACKOFF_SECONDS
+
+
+def get_rate_limit_keys(delivery: WebhookDelivery) -> List[str]:
+    # Discord limits each webhook separately, on top of a global limit. The
+    # URL is hashed as it contains the webhook's token.
+    url_hash = sha256(delivery.url.encode()).hexdigest()
+    return [
+        f"webhooks.ratelimit.url.{url_hash}",
+        f"webhooks.ratelimit.host.{delivery.host}",
+    ]
+
+
+def get_rate_limit_wait(delivery: WebhookDelivery) -> float:
+    """
+    Return the seconds to wait before the delivery is allowed to be posted.
+    """
+    limits = get_cache("legacy").get_many(get_rate_limit_keys(delivery))
+    if not limits:
+        return 0
+    return max(0.0, max(limits.values()) - time.time())
+
+
+def update_rate_limit(delivery: WebhookDelivery, response: requests.Response):
+    """
+    Store the rate limit reported by the response, so that further requests
+    made by any worker are held back until the limit resets.
+    """
+    headers = response.headers
+    if response.status_code == 429:
+        wait = get_retry_after(response)
+    elif headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            wait = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, ValueError):
+            return
+    else:
+        return
+
+    url_key, host_key = get_rate_limit_keys(delivery)
+    is_global = headers.get("X-RateLimit-Global", "").lower() == "true"
+    get_cache("legacy").set(
+        host_key if is_global else url_key,
+        time.time() + wait,
+        timeout=int(wait) + 1,
+    )
+
+
+def record_delivery(outcome: str, duration: float) -> None:
+    ms = int(duration * 1000)
+    bucket = next((f"le_{x}ms" for x in LATENCY_BUCKETS if ms <= x), "le_inf")
+    metrics.add(outcome)
+    metrics.add(f"latency.{bucket}")
+    metrics.add("latency.total_ms", ms)
+
+
+def get_webhook_metrics() -> Dict[str, int]:
+    """
+    Return the webhook delivery counters collected by all processes.
+    """
+    return metrics.read()
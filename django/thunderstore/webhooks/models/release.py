@@ -5,10 +5,9 @@ from django.conf import settings
 from django.db import models
 from django.db.models import Q
 from django.utils import timezone
-from sentry_sdk import capture_exception
 
-from thunderstore.core.tasks import celery_post
 from thunderstore.core.utils import ChoiceEnum
+from thunderstore.webhooks.delivery import WebhookDelivery, dispatch_webhook_deliveries
 
 
 class WebhookType(ChoiceEnum):
@@ -115,7 +114,7 @@ class Webhook(models.Model):
                     "fields": [
                         {
                             "name": "Total downloads",
-                            "value": f"{version.package.downloads}",
+                            "value": f"{version.package.total_downloads}",
                         },
                         {
                             "name": "Categories",
@@ -126,19 +125,30 @@ class Webhook(models.Model):
             ]
         }
 
+    @classmethod
+    def post_package_version_release_to_all(cls, webhooks, version):
+        """
+        Announce the release through all of the webhooks at once, allowing
+        the deliveries to be grouped by destination.
+        """
+        deliveries = []
+        for webhook in webhooks:
+            if not webhook.is_active:
+                continue
+            data = webhook.get_version_release_json(version)
+            if data:
+                deliveries.append(webhook.build_delivery(data))
+        dispatch_webhook_deliveries(deliveries)
+
     def post_package_version_release(self, version):
         data = self.get_version_release_json(version)
         if data:
             self.call_with_json(data)
 
+    def build_delivery(self, webhook_data) -> WebhookDelivery:
+        return WebhookDelivery(url=self.webhook_url, data=json.dumps(webhook_data))
+
     def call_with_json(self, webhook_data):
         if not self.is_active:
             return
-        try:
-            celery_post.delay(
-                self.webhook_url,
-                data=json.dumps(webhook_data),
-                headers={"Content-Type": "application/json"},
-            )
-        except Exception as e:
-            capture_exception(e)
+        dispatch_webhook_deliveries([self.build_delivery(webhook_data)])
@@ -1 +1,2 @@
 from .audit import process_audit_event
+from .delivery import deliver_webhooks
@@ -1,8 +1,8 @@
 from celery import shared_task
 
 from thunderstore.core.settings import CeleryQueues
-from thunderstore.core.tasks import celery_post
 from thunderstore.webhooks.audit import AuditEvent
+from thunderstore.webhooks.delivery import WebhookDelivery, dispatch_webhook_deliveries
 from thunderstore.webhooks.models import AuditWebhook
 
 
@@ -16,9 +16,6 @@ def process_audit_event(event_json: str):
         exclude_none=True,
     )
     webhooks = AuditWebhook.get_for_event(event)
-    for webhook in webhooks:
-        celery_post.delay(
-            webhook.webhook_url,
-            data=rendered,
-            headers={"Content-Type": "application/json"},
-        )
+    dispatch_webhook_deliveries(
+        WebhookDelivery(url=webhook.webhook_url, data=rendered) for webhook in webhooks
+    )
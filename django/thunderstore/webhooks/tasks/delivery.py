@@ -0,0 +1,15 @@
+from typing import Dict, List
+
+from celery import shared_task
+
+from thunderstore.core.settings import CeleryQueues
+from thunderstore.webhooks.delivery import WebhookDelivery, post_deliveries
+
+
+@shared_task(
+    name="thunderstore.webhooks.tasks.deliver_webhooks",
+    queue=CeleryQueues.Default,
+    ignore_result=True,
+)
+def deliver_webhooks(deliveries: List[Dict]):
+    post_deliveries(WebhookDelivery.parse_obj(x) for x in deliveries)
@@ -29,7 +29,9 @@ def test_process_audit_event(
     message: Optional[str],
     mocker,
 ):
-    mocked_post = mocker.patch("thunderstore.webhooks.tasks.audit.celery_post")
+    mocked_dispatch = mocker.patch(
+        "thunderstore.webhooks.tasks.audit.dispatch_webhook_deliveries"
+    )
 
     webhook = AuditWebhook.objects.create(
         name="Webhook Test",
@@ -43,4 +45,6 @@ def test_process_audit_event(
         message=message,
     )
     process_audit_event(event.json())
-    assert mocked_post.called_once()
+    mocked_dispatch.assert_called_once()
+    deliveries = list(mocked_dispatch.call_args.args[0])
+    assert [x.url for x in deliveries] == [webhook.webhook_url]
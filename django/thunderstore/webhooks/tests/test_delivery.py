@@ -0,0 +1,209 @@
+import json
+from typing import Dict, Optional
+
+import pytest
+import requests
+
+from thunderstore.community.models import PackageListing
+from thunderstore.webhooks.delivery import (
+    DeliveryOutcome,
+    WebhookDelivery,
+    dispatch_webhook_deliveries,
+    get_rate_limit_wait,
+    get_webhook_metrics,
+    post_deliveries,
+)
+from thunderstore.webhooks.models.release import Webhook
+
+
+def make_response(
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None,
+    content: bytes = b"",
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def session(mocker):
+    session = mocker.Mock()
+    mocker.patch("thunderstore.webhooks.delivery.get_session", return_value=session)
+    return session
+
+
+@pytest.fixture
+def deliver_webhooks(mocker):
+    return mocker.patch("thunderstore.webhooks.tasks.deliver_webhooks")
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch("thunderstore.webhooks.delivery.time.sleep")
+
+
+def test_dispatch_webhook_deliveries_groups_by_host(deliver_webhooks) -> None:
+    deliveries = [
+        WebhookDelivery(url="https://discord.com/api/webhooks/1/a", data="1"),
+        WebhookDelivery(url="https://example.com/hook", data="2"),
+        WebhookDelivery(url="https://discord.com/api/webhooks/2/b", data="3"),
+    ]
+    dispatch_webhook_deliveries(deliveries)
+
+    assert deliver_webhooks.delay.call_count == 2
+    groups = [x.kwargs["deliveries"] for x in deliver_webhooks.delay.call_args_list]
+    assert [[x["data"] for x in group] for group in groups] == [["1", "3"], ["2"]]
+
+
+def test_post_deliveries_reuses_session(session, deliver_webhooks) -> None:
+    session.post.return_value = make_response(204)
+    before = get_webhook_metrics().get(DeliveryOutcome.delivered, 0)
+
+    post_deliveries(
+        WebhookDelivery(url="https://example.com/hook", data=str(i)) for i in range(3)
+    )
+
+    assert session.post.call_count == 3
+    assert all(x.kwargs["timeout"] for x in session.post.call_args_list)
+    deliver_webhooks.apply_async.assert_not_called()
+    assert get_webhook_metrics()[DeliveryOutcome.delivered] == before + 3
+
+
+def test_post_deliveries_waits_out_short_rate_limit(
+    session,
+    deliver_webhooks,
+    sleep,
+    settings,
+) -> None:
+    settings.WEBHOOK_MAX_WAIT_SECONDS = 5
+    session.post.side_effect = [
+        make_response(429, {"Retry-After": "1"}),
+        make_response(204),
+    ]
+
+    post_deliveries([WebhookDelivery(url="https://example.com/hook", data="1")])
+
+    assert session.post.call_count == 2
+    assert 0 < sleep.call_args.args[0] <= 1
+    deliver_webhooks.apply_async.assert_not_called()
+
+
+def test_post_deliveries_defers_long_rate_limit(
+    session,
+    deliver_webhooks,
+    sleep,
+    settings,
+) -> None:
+    settings.WEBHOOK_MAX_WAIT_SECONDS = 5
+    session.post.return_value = make_response(
+        429,
+        {"X-RateLimit-Global": "true"},
+        json.dumps({"retry_after": 30}).encode(),
+    )
+    deliveries = [
+        WebhookDelivery(url="https://example.com/hook/1", data="1"),
+        WebhookDelivery(url="https://example.com/hook/2", data="2"),
+    ]
+
+    post_deliveries(deliveries)
+
+    # The global limit holds back the second delivery without posting it
+    assert session.post.call_count == 1
+    sleep.assert_not_called()
+    kwargs = deliver_webhooks.apply_async.call_args.kwargs
+    assert 25 < kwargs["countdown"] <= 30
+    assert [x["attempt"] for x in kwargs["kwargs"]["deliveries"]] == [1, 0]
+    assert get_rate_limit_wait(deliveries[1]) > 25
+
+
+def test_post_deliveries_stores_exhausted_rate_limit(session, deliver_webhooks) -> None:
+    session.post.return_value = make_response(
+        204,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2.5"},
+    )
+    delivery = WebhookDelivery(url="https://example.com/hook", data="1")
+    other = WebhookDelivery(url="https://example.com/other", data="2")
+
+    post_deliveries([delivery])
+
+    assert 0 < get_rate_limit_wait(delivery) <= 2.5
+    assert get_rate_limit_wait(other) == 0
+
+
+@pytest.mark.parametrize(
+    "error",
+    (make_response(502), requests.ConnectionError()),
+)
+def test_post_deliveries_retries_errors_with_backoff(
+    session,
+    deliver_webhooks,
+    settings,
+    error,
+) -> None:
+    settings.WEBHOOK_RETRY_BACKOFF_SECONDS = 10
+    if isinstance(error, Exception):
+        session.post.side_effect = error
+    else:
+        session.post.return_value = error
+
+    post_deliveries(
+        [WebhookDelivery(url="https://example.com/hook", data="1", attempt=2)]
+    )
+
+    assert session.post.call_count == 1
+    kwargs = deliver_webhooks.apply_async.call_args.kwargs
+    assert kwargs["countdown"] == 40
+    assert kwargs["kwargs"]["deliveries"][0]["attempt"] == 3
+
+
+def test_post_deliveries_gives_up(session, deliver_webhooks, settings) -> None:
+    settings.WEBHOOK_MAX_ATTEMPTS = 3
+    session.post.return_value = make_response(500)
+
+    post_deliveries(
+        [WebhookDelivery(url="https://example.com/hook", data="1", attempt=2)]
+    )
+
+    deliver_webhooks.apply_async.assert_not_called()
+
+
+def test_post_deliveries_does_not_retry_client_errors(
+    session,
+    deliver_webhooks,
+) -> None:
+    session.post.return_value = make_response(404)
+
+    post_deliveries([WebhookDelivery(url="https://example.com/hook", data="1")])
+
+    assert session.post.call_count == 1
+    deliver_webhooks.apply_async.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_webhook_post_package_version_release_to_all(
+    release_webhook: Webhook,
+    active_package_listing: PackageListing,
+    freezer,
+    mocker,
+) -> None:
+    inactive = Webhook.objects.create(
+        name="inactive",
+        webhook_url="https://example.com/inactive/",
+        is_active=False,
+        community=release_webhook.community,
+    )
+    mocked_dispatch = mocker.patch(
+        "thunderstore.webhooks.models.release.dispatch_webhook_deliveries"
+    )
+    version = active_package_listing.package.latest
+
+    Webhook.post_package_version_release_to_all([release_webhook, inactive], version)
+
+    deliveries = mocked_dispatch.call_args.args[0]
+    assert [x.url for x in deliveries] == [release_webhook.webhook_url]
+    assert json.loads(deliveries[0].data) == release_webhook.get_version_release_json(
+        version
+    )
@@ -5,6 +5,7 @@ from django.utils import timezone
 from django.utils.text import slugify
 
 from django_contracts.compat import TimestampMixin
+from thunderstore.markdown.templatetags.markdownify import precompute_rendered_markdown
 
 
 class TitleMixin(models.Model):
@@ -52,6 +53,8 @@ class WikiPage(TimestampMixin, TitleMixin):
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
         self.wiki.on_page_updated()
+        content = self.markdown_content
+        transaction.on_commit(lambda: precompute_rendered_markdown((content,)))
 
     @transaction.atomic
     def delete(self, *args, **kwargs):